@@ -1,13 +1,18 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from firebase_admin import auth
+
+from app.dependencies.firebase import init_firebase
 
 
 # Dependencia de seguridad estándar para FastAPI
 security = HTTPBearer()
 
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    # Con STARTUP_MODE=lazy Firebase se inicializa aquí, en la primera petición autenticada
+    init_firebase()
+    from firebase_admin import auth
+
     token = credentials.credentials
     try:
         decoded_token = auth.verify_id_token(token)
@@ -1,8 +1,9 @@
 # app/database.py
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
+import threading
 from dotenv import load_dotenv
 
 # Cargar variables de entorno
@@ -15,15 +16,40 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL no está configurada en las variables de entorno")
 
-# SQLAlchemy
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# SQLAlchemy: el engine se crea en el primer uso (create_engine importa el driver de PostgreSQL)
+_engine = None
+_engine_lock = threading.Lock()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 metadata = MetaData()
 
+def get_engine():
+    """
+    Engine compartido; se crea una sola vez aunque lleguen peticiones concurrentes
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(DATABASE_URL)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+def warm_up_pool() -> None:
+    """
+    Abre la primera conexión del pool para que la primera consulta no pague la conexión y la autenticación
+    """
+    try:
+        with get_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+        print("Conexión inicial a PostgreSQL establecida.")
+    except Exception as e:
+        print(f"ADVERTENCIA: No se pudo abrir la conexión inicial a PostgreSQL: {e}")
+
 # Dependency para obtener la sesión de base de datos
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -0,0 +1,28 @@
+# app/dependencies/firebase.py
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# En Cloud Run, usar la ruta absoluta del archivo de credenciales
+key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "/app/serviceAccountKey.json")
+
+def init_firebase() -> None:
+    """
+    Inicializa el SDK de Firebase Admin (si no se ha hecho ya).
+    firebase_admin se importa aquí y no al importar la aplicación: con STARTUP_MODE=lazy
+    la inicialización ocurre en la primera petición autenticada.
+    """
+    import firebase_admin
+    from firebase_admin import credentials
+
+    if firebase_admin._apps:
+        return
+
+    if key_path:
+        cred = credentials.Certificate(key_path)
+        firebase_admin.initialize_app(cred)
+        print("Firebase Admin SDK inicializado correctamente.")
+    else:
+        print("ADVERTENCIA: No se encontró la ruta a las credenciales. Firebase Admin no se pudo inicializar.")
@@ -0,0 +1,97 @@
+# Mantenimiento de player_latest_stats: el último snapshot de player_stadistics por jugador
+#
+# Las lecturas de /player, /compare y /compare/basic buscan por clave primaria en
+# player_latest_stats en lugar de ordenar player_stadistics por snapshot_date en cada
+# petición. Triggers de PostgreSQL la mantienen en cada INSERT/UPDATE/DELETE/TRUNCATE de
+# player_stadistics, sea quien sea el que escriba (scraper, cargas manuales...).
+#
+# El DDL, los triggers y la reconstrucción son los de la migración 0003: se importan de
+# ella para que la instalación manual aplique exactamente lo mismo que alembic.
+#
+# Instalación (tabla + triggers) y reconstrucción completa (desde backend/apis/base_de_datos):
+#   python -m app.latest_stats install
+#   python -m app.latest_stats rebuild
+import argparse
+import importlib.util
+import weakref
+from pathlib import Path
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models import PlayerLatestStats
+
+
+def _load_migration(filename: str):
+    """
+    Módulo de una revisión de migrations/versions (su nombre empieza por un dígito y no
+    se puede importar con import)
+    """
+    path = Path(__file__).resolve().parent.parent / "migrations" / "versions" / filename
+    spec = importlib.util.spec_from_file_location(f"_migration_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_migration = _load_migration("0003_player_latest_stats.py")
+CREATE_TABLE_SQL = _migration.CREATE_TABLE_SQL
+REBUILD_SQL = _migration.REBUILD_SQL
+TRIGGER_SQL = _migration.TRIGGER_SQL
+
+# Por engine: si player_latest_stats existe (ver player_latest_stats_available)
+_available = weakref.WeakKeyDictionary()
+
+
+def player_latest_stats_available(db: Session) -> bool:
+    """
+    True si la tabla player_latest_stats existe en la base de la sesión. Se comprueba una vez
+    por engine: una base sin la migración sigue sirviendo desde player_stadistics, y empieza
+    a usar la tabla cuando el proceso se reinicia con la migración aplicada.
+    """
+    engine = db.get_bind().engine
+    if engine not in _available:
+        _available[engine] = inspect(engine).has_table(PlayerLatestStats.__tablename__)
+    return _available[engine]
+
+
+def rebuild_player_latest_stats(connection: Connection) -> int:
+    """
+    Vacía player_latest_stats y la vuelve a llenar desde player_stadistics. Devuelve las filas escritas.
+    """
+    connection.execute(text("DELETE FROM player_latest_stats"))
+    return connection.execute(text(REBUILD_SQL)).rowcount
+
+
+def install_player_latest_stats(connection: Connection) -> int:
+    """
+    Crea la tabla (si no existe) y los triggers de mantenimiento, y la llena desde
+    player_stadistics. El trigger requiere PostgreSQL.
+    """
+    if connection.dialect.name != "postgresql":
+        raise ValueError(f"The player_latest_stats trigger requires PostgreSQL, not {connection.dialect.name}")
+
+    connection.execute(text(CREATE_TABLE_SQL))
+    for statement in TRIGGER_SQL:
+        connection.execute(text(statement))
+    return rebuild_player_latest_stats(connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install or rebuild the player_latest_stats table")
+    parser.add_argument("command", choices=["install", "rebuild"])
+    args = parser.parse_args()
+
+    from app.dependencies.database import get_engine
+
+    with get_engine().begin() as connection:
+        if args.command == "install":
+            rows = install_player_latest_stats(connection)
+        else:
+            rows = rebuild_player_latest_stats(connection)
+    print(f"player_latest_stats: {rows} jugadores")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,40 @@
 
 # app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
 from dotenv import load_dotenv
-import firebase_admin
-from firebase_admin import credentials
 
+from app.dependencies.database import warm_up_pool
+from app.dependencies.firebase import init_firebase
 from app.routers import jugadores
 from app.routers import usuarios
 
 load_dotenv()
 
-# En Cloud Run, usar la ruta absoluta del archivo de credenciales
-key_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "/app/serviceAccountKey.json")
+# "eager": Firebase y la primera conexión a PostgreSQL se preparan antes de aceptar tráfico.
+# "lazy": ambos se difieren a la primera petición que los necesita (arranque en frío más corto).
+STARTUP_MODE = os.getenv("STARTUP_MODE", "eager").lower()
 
-# 3. Inicializa el SDK de Firebase Admin (si no se ha hecho ya)
-if not firebase_admin._apps:
-    if key_path:
-        cred = credentials.Certificate(key_path)
-        firebase_admin.initialize_app(cred)
-        print("Firebase Admin SDK inicializado correctamente.")
-    else:
-        print("ADVERTENCIA: No se encontró la ruta a las credenciales. Firebase Admin no se pudo inicializar.")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Inicialización de Firebase Admin y del pool de conexiones según STARTUP_MODE
+    """
+    if STARTUP_MODE != "lazy":
+        init_firebase()
+        warm_up_pool()
+    yield
 
 app = FastAPI(
     title="API de Consulta de Jugadores de Tenis",
     description="API profesional para consultar matches y estadísticas de jugadores desde PostgreSQL",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 app.add_middleware(
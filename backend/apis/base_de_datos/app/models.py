@@ -1,5 +1,5 @@
 # app/models.py
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Text, DECIMAL, VARCHAR, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Text, DECIMAL, VARCHAR, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.dependencies.database import Base
 
@@ -50,6 +50,40 @@ class PlayerStadistics(Base):
     
     # Relación
     player = relationship("Player", back_populates="estadisticas")
+    
+    # Último snapshot de un jugador (migración 0004); stat_id desempata snapshots del mismo día
+    __table_args__ = (
+        Index("ix_player_stadistics_player_id_snapshot_date", player_id, snapshot_date.desc(), stat_id.desc()),
+    )
+
+# Último snapshot de player_stadistics de cada jugador (una fila por jugador). Lo mantiene
+# al día un trigger sobre player_stadistics; instalación y reconstrucción en app/latest_stats.py
+class PlayerLatestStats(Base):
+    __tablename__ = "player_latest_stats"
+    
+    player_id = Column(Integer, ForeignKey("players.player_id", ondelete="CASCADE"), primary_key=True)
+    stat_id = Column(Integer, nullable=False)
+    snapshot_date = Column(Date, nullable=False)
+    actual_rank = Column(Integer)
+    min_rank = Column(Integer)
+    grass_winrt = Column(DECIMAL(5,3))
+    hard_winrt = Column(DECIMAL(5,3))
+    clay_winrt = Column(DECIMAL(5,3))
+    g_winrt = Column(DECIMAL(5,3))
+    a_winrt = Column(DECIMAL(5,3))
+    d_winrt = Column(DECIMAL(5,3))
+    m_winrt = Column(DECIMAL(5,3))
+    f_winrt = Column(DECIMAL(5,3))
+    o_winrt = Column(DECIMAL(5,3))
+    pct_1stin = Column(DECIMAL(5,3))
+    pct_1stwon = Column(DECIMAL(5,3))
+    pct_2ndwon = Column(DECIMAL(5,3))
+    pct_svptswon = Column(DECIMAL(5,3))
+    pct_bpconv = Column(DECIMAL(5,3))
+    pct_bpsaved = Column(DECIMAL(5,3))
+    pct_1stretptswon = Column(DECIMAL(5,3))
+    pct_2ndretptswon = Column(DECIMAL(5,3))
+    recperf = Column(DECIMAL(5,3))
 
 class Match(Base):
     __tablename__ = "matches"
@@ -65,6 +99,15 @@ class Match(Base):
     # Relaciones
     player1 = relationship("Player", foreign_keys=[player1_id], back_populates="matches_as_p1")
     player2 = relationship("Player", foreign_keys=[player2_id], back_populates="matches_as_p2")
+    
+    # Índices de /players/matches (migración 0002): orden y cursor por (snapshot_date, match_id)
+    # y, para cada filtro por igualdad, la misma clave precedida de la columna filtrada
+    __table_args__ = (
+        Index("ix_matches_snapshot_date_match_id", "snapshot_date", "match_id"),
+        Index("ix_matches_tourney_name_snapshot_date", "tourney_name", "snapshot_date", "match_id"),
+        Index("ix_matches_tourney_tipe_snapshot_date", "tourney_tipe", "snapshot_date", "match_id"),
+        Index("ix_matches_surface_snapshot_date", "surface", "snapshot_date", "match_id"),
+    )
 
 class H2H(Base):
     __tablename__ = "h2h"
@@ -79,6 +122,11 @@ class H2H(Base):
     # Relaciones
     player1 = relationship("Player", foreign_keys=[player1_id], back_populates="h2h_as_p1")
     player2 = relationship("Player", foreign_keys=[player2_id], back_populates="h2h_as_p2")
+    
+    # Último H2H de una pareja, en cualquiera de los dos sentidos (migración 0004)
+    __table_args__ = (
+        Index("ix_h2h_players_snapshot_date", player1_id, player2_id, snapshot_date.desc()),
+    )
 
 
 # Modelo para la tabla users
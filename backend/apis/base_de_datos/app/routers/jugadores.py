@@ -1,15 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, desc
-from typing import Dict, Any
-from datetime import datetime  # date se agregará cuando se active el filtro de partidos futuros
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import or_, and_, desc, tuple_, bindparam, func, literal, select, true
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, date
 
 from app.dependencies.database import get_db
-from app.models import Player, PlayerStadistics, Match, H2H
+from app.latest_stats import player_latest_stats_available
+from app.models import Player, PlayerStadistics, PlayerLatestStats, Match, H2H
 from app.schemas.jugadores import MatchCompleto, MatchesResponse, PlayerCompleto, PlayerBasicInfo
 
 router = APIRouter(prefix="/players", tags=["Jugadores de Tenis"])
 
+def obtener_estadisticas_recientes(db: Session, player_id: int):
+    """
+    Obtiene el snapshot de estadísticas más reciente del jugador.
+    
+    Se lee por clave primaria de player_latest_stats, que un trigger mantiene al día en
+    cada escritura de player_stadistics (ver app/latest_stats.py). Si la base aún no tiene
+    esa tabla (migración 0003 sin aplicar), o el jugador no tiene fila en ella, se ordena
+    player_stadistics por snapshot_date.
+    
+    Args:
+        db: Sesión de base de datos
+        player_id: ID del jugador
+        
+    Returns:
+        Fila con las estadísticas más recientes o None si el jugador no tiene estadísticas
+    """
+    estadisticas = None
+    if player_latest_stats_available(db):
+        estadisticas = db.get(PlayerLatestStats, player_id)
+    if estadisticas is None:
+        estadisticas = db.query(PlayerStadistics).filter(
+            PlayerStadistics.player_id == player_id
+        ).order_by(desc(PlayerStadistics.snapshot_date), desc(PlayerStadistics.stat_id)).first()
+    return estadisticas
+
 def obtener_info_completa_player(db: Session, player_id: int) -> Dict[str, Any]:
     """
     Obtiene información completa del jugador incluyendo datos básicos y estadísticas más recientes.
@@ -26,10 +52,8 @@ def obtener_info_completa_player(db: Session, player_id: int) -> Dict[str, Any]:
     if not player:
         return None
     
-    # Obtener estadísticas más recientes del jugador ordenadas por snapshot_date
-    estadisticas = db.query(PlayerStadistics).filter(
-        PlayerStadistics.player_id == player_id
-    ).order_by(desc(PlayerStadistics.snapshot_date)).first()
+    # Obtener estadísticas más recientes del jugador
+    estadisticas = obtener_estadisticas_recientes(db, player_id)
     
     # Información básica del jugador
     info_completa = {
@@ -150,9 +174,7 @@ def obtener_info_basica_player(db: Session, player_id: int) -> Dict[str, Any]:
         return None
     
     # Obtener estadísticas más recientes del jugador
-    estadisticas = db.query(PlayerStadistics).filter(
-        PlayerStadistics.player_id == player_id
-    ).order_by(desc(PlayerStadistics.snapshot_date)).first()
+    estadisticas = obtener_estadisticas_recientes(db, player_id)
     
     # Calcular edad si hay fecha de nacimiento
     age = None
@@ -401,42 +423,164 @@ async def comparar_jugadores_exacto(
         Dict: Información completa de ambos jugadores con prefijos p1_ y p2_, incluyendo H2H y tasas específicas
         
     Raises:
-        HTTPException: Si algún jugador no existe o no se puede obtener su información
+        HTTPException: Si algún jugador no existe
     """
-    # Buscar ambos jugadores
-    player1 = db.query(Player).filter(Player.name == nombre1).first()
-    if not player1:
+    # Ambos jugadores, sus estadísticas más recientes y el último H2H en una sola consulta
+    consulta = CONSULTA_COMPARACION if player_latest_stats_available(db) else CONSULTA_COMPARACION_SIN_LATEST_STATS
+    fila = db.execute(consulta, {"nombre1": nombre1, "nombre2": nombre2}).one()
+    if fila.p1_player_id is None:
         raise HTTPException(
             status_code=404, 
             detail=f"Jugador '{nombre1}' no encontrado. Verifique el nombre exacto."
         )
     
-    player2 = db.query(Player).filter(Player.name == nombre2).first()
-    if not player2:
+    if fila.p2_player_id is None:
         raise HTTPException(
             status_code=404, 
             detail=f"Jugador '{nombre2}' no encontrado. Verifique el nombre exacto."
         )
     
-    # Obtener información completa de ambos jugadores
-    info_j1 = obtener_info_completa_player(db, player1.player_id)
-    info_j2 = obtener_info_completa_player(db, player2.player_id)
+    info_j1 = info_desde_fila(fila, "p1_")
+    info_j2 = info_desde_fila(fila, "p2_")
     
-    if not info_j1:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error interno: No se pudo obtener información del jugador '{nombre1}'"
-        )
+    # Si el orden está invertido en la BD, intercambiar los valores
+    if fila.h2h_player1_id == fila.p2_player_id:
+        h2h_info = {"p1_h2h_win": fila.h2h_p2_win, "p2_h2h_win": fila.h2h_p1_win}
+    else:
+        h2h_info = {"p1_h2h_win": fila.h2h_p1_win, "p2_h2h_win": fila.h2h_p2_win}
     
-    if not info_j2:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error interno: No se pudo obtener información del jugador '{nombre2}'"
+    return construir_comparacion(info_j1, info_j2, h2h_info, surface, tourney_type)
+
+# Columnas de estadísticas que se leen para /compare (las de obtener_info_completa_player)
+COLUMNAS_ESTADISTICAS = [
+    "actual_rank", "min_rank", "grass_winrt", "hard_winrt", "clay_winrt", "g_winrt", "a_winrt",
+    "d_winrt", "m_winrt", "f_winrt", "o_winrt", "pct_1stin", "pct_1stwon", "pct_2ndwon",
+    "pct_svptswon", "pct_bpconv", "pct_bpsaved", "pct_1stretptswon", "pct_2ndretptswon", "recperf",
+]
+
+def consulta_comparacion(usar_latest_stats: bool = True):
+    """
+    Construye la sentencia única de /compare, con los parámetros nombre1 y nombre2: una fila con ambos jugadores (prefijos p1_ y
+    p2_), sus estadísticas más recientes y el último H2H de la pareja en cualquier sentido.
+    
+    Los jugadores se buscan en CTEs unidas con LEFT JOIN a una fila ancla, de modo que la
+    fila existe aunque falte alguno (sus columnas quedan a NULL). Las estadísticas se
+    localizan por stat_id: el de player_latest_stats o, si el jugador no tiene fila ahí, el
+    del último snapshot de player_stadistics (siempre este si usar_latest_stats es False,
+    para bases sin la tabla). El H2H se localiza con una subconsulta
+    correlacionada que usa ix_h2h_players_snapshot_date en cada sentido. Se usan subconsultas
+    correlacionadas en lugar de LATERAL para que la sentencia también funcione en SQLite.
+    
+    Args:
+        usar_latest_stats: Si se consulta player_latest_stats antes que player_stadistics
+        
+    Returns:
+        Select de SQLAlchemy que devuelve exactamente una fila
+    """
+    players = Player.__table__
+    stats = PlayerStadistics.__table__
+    latest = PlayerLatestStats.__table__
+    h2h = H2H.__table__
+    
+    ancla = select(literal(1).label("ancla")).cte("ancla")
+    jugadores = [
+        select(players.c.player_id, players.c.date_of_birth, players.c.height_cm, players.c.hand)
+        .where(players.c.name == nombre)
+        .limit(1)
+        .cte(etiqueta)
+        for nombre, etiqueta in ((bindparam("nombre1"), "jugador1"), (bindparam("nombre2"), "jugador2"))
+    ]
+    
+    def stat_id_reciente(player_id):
+        por_fecha = (
+            select(stats.c.stat_id)
+            .where(stats.c.player_id == player_id)
+            .order_by(desc(stats.c.snapshot_date), desc(stats.c.stat_id))
+            .limit(1)
+            .scalar_subquery()
+        )
+        if not usar_latest_stats:
+            return por_fecha
+        return func.coalesce(
+            select(latest.c.stat_id).where(latest.c.player_id == player_id).scalar_subquery(),
+            por_fecha,
         )
     
-    # Obtener información H2H
-    h2h_info = obtener_h2h_info(db, player1.player_id, player2.player_id)
+    j1, j2 = jugadores
+    s1, s2 = stats.alias("estadisticas1"), stats.alias("estadisticas2")
+    ultimo_h2h = h2h.alias("ultimo_h2h")
+    h2h_id = (
+        select(h2h.c.h2h_id)
+        .where(or_(
+            and_(h2h.c.player1_id == j1.c.player_id, h2h.c.player2_id == j2.c.player_id),
+            and_(h2h.c.player1_id == j2.c.player_id, h2h.c.player2_id == j1.c.player_id)
+        ))
+        .order_by(desc(h2h.c.snapshot_date))
+        .limit(1)
+        .scalar_subquery()
+    )
     
+    columnas = []
+    for prefijo, jugador, estadisticas in (("p1_", j1, s1), ("p2_", j2, s2)):
+        columnas += [jugador.c[name].label(f"{prefijo}{name}") for name in ("player_id", "date_of_birth", "height_cm", "hand")]
+        columnas += [estadisticas.c[name].label(f"{prefijo}{name}") for name in COLUMNAS_ESTADISTICAS]
+    columnas += [
+        ultimo_h2h.c.player1_id.label("h2h_player1_id"),
+        ultimo_h2h.c.p1_h2h_win.label("h2h_p1_win"),
+        ultimo_h2h.c.p2_h2h_win.label("h2h_p2_win"),
+    ]
+    
+    return select(*columnas).select_from(
+        ancla
+        .outerjoin(j1, true())
+        .outerjoin(j2, true())
+        .outerjoin(s1, s1.c.stat_id == stat_id_reciente(j1.c.player_id))
+        .outerjoin(s2, s2.c.stat_id == stat_id_reciente(j2.c.player_id))
+        .outerjoin(ultimo_h2h, ultimo_h2h.c.h2h_id == h2h_id)
+    )
+
+# Se construye una sola vez: montar la sentencia en cada petición cuesta más que ejecutarla
+CONSULTA_COMPARACION = consulta_comparacion()
+CONSULTA_COMPARACION_SIN_LATEST_STATS = consulta_comparacion(usar_latest_stats=False)
+
+def info_desde_fila(fila, prefijo: str) -> Dict[str, Any]:
+    """
+    Información del jugador con las mismas claves y conversiones que obtener_info_completa_player
+    a partir de la fila de CONSULTA_COMPARACION.
+    
+    Args:
+        fila: Fila devuelta por CONSULTA_COMPARACION
+        prefijo: "p1_" o "p2_"
+        
+    Returns:
+        Dict con datos básicos y estadísticas (None si el jugador no tiene estadísticas)
+    """
+    valores = fila._mapping
+    info = {
+        "date_of_birth": valores[f"{prefijo}date_of_birth"],
+        "height_cm": valores[f"{prefijo}height_cm"],
+        "hand": valores[f"{prefijo}hand"],
+    }
+    for name in COLUMNAS_ESTADISTICAS:
+        valor = valores[f"{prefijo}{name}"]
+        info[name] = valor if valor is None or name in ("actual_rank", "min_rank") else float(valor)
+    return info
+
+def construir_comparacion(info_j1: Dict[str, Any], info_j2: Dict[str, Any], h2h_info: Dict[str, Any],
+                          surface: str = None, tourney_type: str = None) -> Dict[str, Any]:
+    """
+    Construye la respuesta de /compare con prefijos p1_ y p2_ en el formato que espera la API del modelo.
+    
+    Args:
+        info_j1: Información completa del jugador 1
+        info_j2: Información completa del jugador 2
+        h2h_info: Información Head-to-Head con claves p1_h2h_win y p2_h2h_win
+        surface: Tipo de superficie (grass, hard, clay) - opcional
+        tourney_type: Tipo de torneo (G, M, A, F, D, O) - opcional
+        
+    Returns:
+        Dict: Características de ambos jugadores para la predicción
+    """
     # Obtener tasas específicas para ambos jugadores
     tasas_j1 = obtener_tasas_especificas(info_j1, surface, tourney_type)
     tasas_j2 = obtener_tasas_especificas(info_j2, surface, tourney_type)
@@ -492,6 +636,7 @@ async def comparar_jugadores_exacto(
         "p2_tourney_wRate": tasas_j2["tourney_wRate"] or 0
     }
 
+
 def crear_match_completo(match: Match, info_j1: Dict[str, Any], info_j2: Dict[str, Any], h2h_info: Dict[str, Any]) -> MatchCompleto:
     """
     Crea un objeto MatchCompleto con toda la información de jugadores y H2H.
@@ -590,59 +735,137 @@ def obtener_info_jugador_fallback(player_id: int) -> Dict[str, Any]:
         "hand": None,
     }
 
+# Tamaño de página de /players/matches
+MATCHES_PAGE_SIZE = 100
+MATCHES_MAX_PAGE_SIZE = 500
+
+def codificar_cursor_partidos(snapshot_date: date, match_id: int) -> str:
+    """
+    Cursor opaco de la paginación por clave: último (snapshot_date, match_id) devuelto.
+    """
+    return f"{snapshot_date.isoformat()}_{match_id}"
+
+def decodificar_cursor_partidos(cursor: str) -> Tuple[date, int]:
+    """
+    Inverso de codificar_cursor_partidos.
+    
+    Raises:
+        HTTPException: Si el cursor no tiene el formato esperado
+    """
+    try:
+        fecha, match_id = cursor.split("_", 1)
+        return date.fromisoformat(fecha), int(match_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cursor inválido: {cursor}"
+        )
+
 @router.get("/matches", 
-            response_model=Dict[str, Any],
+            response_model=MatchesResponse,
             summary="Obtener partidos futuros",
-            description="Obtiene partidos con información básica. Usa /compare para obtener información detallada de jugadores específicos")
-async def obtener_partidos_futuros(db: Session = Depends(get_db)):
+            description="Obtiene partidos con información básica, paginados por cursor y con filtros opcionales. Usa /compare para obtener información detallada de jugadores específicos")
+async def obtener_partidos_futuros(
+    date_from: Optional[date] = None,  # Incluida; sin cursor, por defecto hoy (solo partidos futuros)
+    date_to: Optional[date] = None,  # Incluida
+    tourney_name: Optional[str] = None,
+    tourney_tipe: Optional[str] = None,  # G, M, A, F, D, O
+    surface: Optional[str] = None,  # Hard, Clay, Grass
+    limit: int = Query(MATCHES_PAGE_SIZE, ge=1, le=MATCHES_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,  # next_cursor de la página anterior
+    db: Session = Depends(get_db)
+):
     """
-    Obtiene partidos de la base de datos con información básica.
-    Para obtener información detallada de los jugadores, usa el endpoint /compare.
+    Obtiene los partidos futuros con información básica, ordenados por
+    (snapshot_date, match_id). Para obtener información detallada de los jugadores,
+    usa el endpoint /compare.
+    
+    Sin cursor ni date_from la primera página empieza en la fecha de hoy; con un
+    date_from anterior se pueden consultar también partidos pasados.
     
-    NOTA: En el futuro, cuando tengas más registros, descomenta las líneas marcadas
-    para filtrar solo partidos posteriores a la fecha actual.
+    La paginación es por clave (keyset): cada página continúa después del último
+    (snapshot_date, match_id) de la anterior, así que su coste no depende de la
+    profundidad de la página ni del tamaño de la tabla. Filtros y orden se resuelven
+    en SQL con los índices de matches.
     
     Args:
+        date_from: Fecha mínima del partido (hoy si no se indica ni cursor ni fecha)
+        date_to: Fecha máxima del partido
+        tourney_name: Nombre exacto del torneo
+        tourney_tipe: Tipo de torneo
+        surface: Superficie
+        limit: Número máximo de partidos por página
+        cursor: Cursor devuelto como next_cursor por la página anterior
         db: Sesión de base de datos
         
     Returns:
-        Dict: Lista de partidos con información básica y total de partidos
+        MatchesResponse: Partidos de la página, número de partidos de la página
+        (matches_in_page) y cursor de la siguiente (None si no hay más). Una página sin
+        partidos es una respuesta normal con matches vacío. No se devuelve el total:
+        contarlo recorrería todo el rango filtrado en cada página; quien lo necesite
+        sigue next_cursor hasta el final.
         
     Raises:
-        HTTPException: Si no se encuentran partidos en la base de datos
+        HTTPException: Si el cursor no es válido
     """
-    # TODO: descomentar estas líneas para filtrar partidos futuros
-    # from datetime import date
-    # today = date.today()
-    # matches = db.query(Match).filter(Match.snapshot_date > today).all()
-    
-    # Por ahora, obtener todos los partidos (comentar esta línea cuando actives el filtro de fecha)
-    matches = db.query(Match).all()
-    
-    if not matches:
-        raise HTTPException(
-            status_code=404,
-            detail="No se encontraron partidos en la base de datos"
+    # Una sola consulta: players se une dos veces (jugador 1 y jugador 2) en lugar de
+    # buscar los nombres partido a partido; outer join para conservar partidos sin jugador.
+    player1 = aliased(Player)
+    player2 = aliased(Player)
+    query = (
+        db.query(
+            Match.match_id,
+            Match.snapshot_date,
+            Match.tourney_name,
+            Match.tourney_tipe,
+            Match.surface,
+            Match.player1_id,
+            Match.player2_id,
+            player1.name.label("player1_name"),
+            player2.name.label("player2_name"),
         )
+        .outerjoin(player1, player1.player_id == Match.player1_id)
+        .outerjoin(player2, player2.player_id == Match.player2_id)
+    )
     
-    partidos_basicos = []
-    
-    for match in matches:
-        # Obtener nombres de los jugadores
-        player1 = db.query(Player).filter(Player.player_id == match.player1_id).first()
-        player2 = db.query(Player).filter(Player.player_id == match.player2_id).first()
-        
-        partido_basico = {
+    # La primera página empieza hoy; las siguientes ya están acotadas por el cursor
+    if date_from is None and cursor is None:
+        date_from = date.today()
+    if date_from is not None:
+        query = query.filter(Match.snapshot_date >= date_from)
+    if date_to is not None:
+        query = query.filter(Match.snapshot_date <= date_to)
+    if tourney_name is not None:
+        query = query.filter(Match.tourney_name == tourney_name)
+    if tourney_tipe is not None:
+        query = query.filter(Match.tourney_tipe == tourney_tipe)
+    if surface is not None:
+        query = query.filter(Match.surface == surface)
+    if cursor is not None:
+        query = query.filter(tuple_(Match.snapshot_date, Match.match_id) > decodificar_cursor_partidos(cursor))
+    
+    # Una fila de más para saber si existe una página siguiente sin contar toda la tabla
+    matches = query.order_by(Match.snapshot_date, Match.match_id).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        next_cursor = codificar_cursor_partidos(matches[-1].snapshot_date, matches[-1].match_id)
+    
+    partidos_basicos = [
+        {
             "snapshot_date": match.snapshot_date.isoformat() if match.snapshot_date else None,
-            "player1_name": player1.name if player1 else f"Player {match.player1_id}",
-            "player2_name": player2.name if player2 else f"Player {match.player2_id}",
+            "player1_name": match.player1_name or f"Player {match.player1_id}",
+            "player2_name": match.player2_name or f"Player {match.player2_id}",
             "tourney_name": match.tourney_name,
             "tourney_type": match.tourney_tipe,
             "surface": match.surface
         }
-        partidos_basicos.append(partido_basico)
+        for match in matches
+    ]
     
     return {
-        "total_matches": len(partidos_basicos),
-        "matches": partidos_basicos
+        "matches_in_page": len(partidos_basicos),
+        "matches": partidos_basicos,
+        "next_cursor": next_cursor
     }
@@ -145,10 +145,20 @@ class MatchCompleto(BaseModel):
     p2_pct_2ndretptswon: Optional[float] = None
     p2_recperf: Optional[float] = None
 
-# Schema para respuesta de múltiples matches
+# Schema para la información básica de un partido en /matches
+class MatchBasico(BaseModel):
+    snapshot_date: Optional[date] = None
+    player1_name: str
+    player2_name: str
+    tourney_name: Optional[str] = None
+    tourney_type: Optional[str] = None  # G, M, A, F, D, O
+    surface: Optional[str] = None
+
+# Schema para una página de /matches (vacía si no hay partidos)
 class MatchesResponse(BaseModel):
-    total_matches: int
-    matches: List[MatchCompleto]
+    matches_in_page: int
+    matches: List[MatchBasico]
+    next_cursor: Optional[str] = None  # None en la última página
 
 # Schema para información básica del jugador con datos calculados
 class PlayerBasicInfo(BaseModel):
@@ -0,0 +1,217 @@
+# Benchmark del ensamblado de características de GET /players/compare
+#
+# Compara el ensamblado anterior (búsqueda de cada jugador por nombre, su información
+# completa y el H2H, consulta a consulta) con la sentencia única de consulta_comparacion,
+# y comprueba que ambos devuelven exactamente el mismo diccionario p1_/p2_ para cada pareja.
+# Por petición informa de las sentencias ejecutadas, el tiempo de base de datos (suma de
+# lo que tarda el driver en cada sentencia) y la latencia total del ensamblado.
+#
+# Por defecto siembra SQLite en memoria con jugadores sin estadísticas, jugadores sin fila
+# en player_latest_stats y H2H guardados en ambos sentidos. Con --database-url se usan las
+# parejas de la tabla h2h de una base existente (solo lectura); ahí, con la latencia de red
+# real, es donde se nota cada ida y vuelta.
+#
+# Uso (desde backend/apis/base_de_datos):
+#   python -m benchmarks.bench_compare --players 500 --requests 2000
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.dependencies.database import Base
+from app.latest_stats import rebuild_player_latest_stats
+from app.models import H2H, Player, PlayerStadistics
+from app.routers.jugadores import (
+    comparar_jugadores_exacto, construir_comparacion, obtener_h2h_info, obtener_info_completa_player
+)
+
+SURFACES = [None, "grass", "hard", "clay"]
+TOURNEY_TYPES = [None, "G", "M", "A", "F", "D", "O"]
+
+
+def seed(engine, n_players: int, n_snapshots: int, rng: random.Random) -> None:
+    """
+    Jugadores con n_snapshots semanales de estadísticas (uno de cada veinte sin ninguna) y
+    un H2H con varios snapshots para cada pareja consecutiva, guardado en un sentido u otro
+    """
+    def ratio():
+        return round(rng.random(), 3)
+
+    with engine.begin() as connection:
+        connection.execute(insert(Player), [
+            {
+                "player_id": i,
+                "name": f"Player Name {i}",
+                "date_of_birth": date(1985, 1, 1) + timedelta(days=rng.randint(0, 6000)),
+                "height_cm": rng.randint(165, 210),
+                "hand": rng.randint(0, 1),
+            }
+            for i in range(1, n_players + 1)
+        ])
+        stats, stat_id = [], 1
+        for player_id in range(1, n_players + 1):
+            if player_id % 20 == 0:
+                continue
+            for week in range(n_snapshots):
+                stats.append({
+                    "stat_id": stat_id,
+                    "player_id": player_id,
+                    "snapshot_date": date(2024, 1, 1) + timedelta(weeks=week),
+                    "actual_rank": rng.randint(1, 500),
+                    "min_rank": rng.randint(1, 500),
+                    **{name: ratio() for name in (
+                        "grass_winrt", "hard_winrt", "clay_winrt", "g_winrt", "a_winrt", "d_winrt", "m_winrt",
+                        "f_winrt", "o_winrt", "pct_1stin", "pct_1stwon", "pct_2ndwon", "pct_svptswon",
+                        "pct_bpconv", "pct_bpsaved", "pct_1stretptswon", "pct_2ndretptswon", "recperf",
+                    )},
+                })
+                stat_id += 1
+        connection.execute(insert(PlayerStadistics), stats)
+
+        h2h, h2h_id = [], 1
+        for player_id in range(1, n_players, 2):
+            pair = (player_id, player_id + 1) if rng.random() < 0.5 else (player_id + 1, player_id)
+            for week in range(3):
+                h2h.append({
+                    "h2h_id": h2h_id,
+                    "snapshot_date": date(2024, 1, 1) + timedelta(weeks=week),
+                    "player1_id": pair[0],
+                    "player2_id": pair[1],
+                    "p1_h2h_win": rng.randint(0, 10),
+                    "p2_h2h_win": rng.randint(0, 10),
+                })
+                h2h_id += 1
+        connection.execute(insert(H2H), h2h)
+
+        rebuild_player_latest_stats(connection)
+        # Jugadores sin fila en player_latest_stats: se lee player_stadistics directamente
+        connection.exec_driver_sql("DELETE FROM player_latest_stats WHERE player_id % 7 = 0")
+
+
+async def comparar_secuencial(nombre1, nombre2, surface, tourney_type, db):
+    """
+    Ensamblado anterior a consulta_comparacion: una consulta detrás de otra
+    """
+    player1 = db.query(Player).filter(Player.name == nombre1).first()
+    if not player1:
+        raise HTTPException(status_code=404, detail=f"Jugador '{nombre1}' no encontrado. Verifique el nombre exacto.")
+    player2 = db.query(Player).filter(Player.name == nombre2).first()
+    if not player2:
+        raise HTTPException(status_code=404, detail=f"Jugador '{nombre2}' no encontrado. Verifique el nombre exacto.")
+
+    info_j1 = obtener_info_completa_player(db, player1.player_id)
+    info_j2 = obtener_info_completa_player(db, player2.player_id)
+    h2h_info = obtener_h2h_info(db, player1.player_id, player2.player_id)
+    return construir_comparacion(info_j1, info_j2, h2h_info, surface, tourney_type)
+
+
+def measure(engine, session_factory, handler, requests: list) -> tuple:
+    """
+    (resultados, sentencias por petición, ms de BD por petición, ms totales por petición)
+    """
+    statements, db_seconds = [0], [0.0]
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["bench_start"] = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements[0] += 1
+        db_seconds[0] += time.perf_counter() - conn.info.pop("bench_start")
+
+    async def run_all():
+        results = []
+        for nombre1, nombre2, surface, tourney_type in requests:
+            with session_factory() as db:
+                try:
+                    results.append(await handler(nombre1, nombre2, surface, tourney_type, db))
+                except HTTPException as e:
+                    results.append((e.status_code, e.detail))
+        return results
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        start = time.perf_counter()
+        results = asyncio.run(run_all())
+        total_seconds = time.perf_counter() - start
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+    n = len(requests)
+    return results, statements[0] / n, db_seconds[0] * 1000 / n, total_seconds * 1000 / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-statement /players/compare feature assembly")
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--snapshots", type=int, default=104, help="Weekly stat snapshots per player")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--database-url", help="Existing database: compare the pairs stored in h2h (read only)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.database_url:
+        engine = create_engine(args.database_url)
+        with engine.connect() as connection:
+            pairs = connection.execute(
+                select(Player.name, H2H.player2_id).join(H2H, H2H.player1_id == Player.player_id).limit(args.requests)
+            ).all()
+            names = dict(connection.execute(
+                select(Player.player_id, Player.name).where(Player.player_id.in_({player2_id for _, player2_id in pairs}))
+            ).all())
+        pairs = [(name, names[player2_id]) for name, player2_id in pairs if player2_id in names]
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        seed(engine, args.players, args.snapshots, rng)
+
+        def name(player_id):
+            return f"Player Name {player_id}" if player_id <= args.players else f"Missing Player {player_id}"
+
+        pairs = []
+        for _ in range(args.requests):
+            player_id = rng.randrange(1, args.players, 2)
+            pair = (name(player_id), name(player_id + 1)) if rng.random() < 0.5 else (name(player_id + 1), name(player_id))
+            if rng.random() < 0.2:
+                pair = (pair[0], name(rng.randint(1, args.players + 50)))
+            pairs.append(pair)
+
+    if not pairs:
+        print("no player pairs to compare")
+        sys.exit(1)
+    requests = [(nombre1, nombre2, rng.choice(SURFACES), rng.choice(TOURNEY_TYPES)) for nombre1, nombre2 in pairs]
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Una pasada de calentamiento por implementación antes de medir
+    measure(engine, session_factory, comparar_secuencial, requests[:50])
+    measure(engine, session_factory, comparar_jugadores_exacto, requests[:50])
+    before, before_statements, before_db_ms, before_total_ms = measure(engine, session_factory, comparar_secuencial, requests)
+    after, after_statements, after_db_ms, after_total_ms = measure(engine, session_factory, comparar_jugadores_exacto, requests)
+
+    print(f"{len(requests)} requests ({engine.dialect.name})")
+    print(f"sequential queries: {before_statements:4.1f} statements/request  "
+          f"db={before_db_ms:7.3f} ms/request  total={before_total_ms:7.3f} ms/request")
+    print(f"single statement:   {after_statements:4.1f} statements/request  "
+          f"db={after_db_ms:7.3f} ms/request  total={after_total_ms:7.3f} ms/request  "
+          f"({before_db_ms / after_db_ms:.1f}x db time)")
+
+    mismatches = [request for request, old, new in zip(requests, before, after) if old != new]
+    if mismatches:
+        print(f"FAIL: {len(mismatches)} requests differ, first: {mismatches[0]}")
+        sys.exit(1)
+    print("OK: both implementations return the same response for every request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# Benchmark de la lectura del último snapshot de estadísticas de un jugador
+#
+# Compara la consulta anterior (player_stadistics ORDER BY snapshot_date DESC LIMIT 1 por
+# jugador) con la lectura por clave primaria de player_latest_stats, sobre una tabla con
+# años de snapshots diarios por jugador, y comprueba que ambas devuelven la misma fila.
+#
+# Por defecto usa SQLite en memoria (la tabla se llena con la reconstrucción completa).
+# Con --database-url apunta a una base PostgreSQL VACÍA de pruebas: crea las tablas,
+# instala el trigger y mide además el coste de insertar un día más de snapshots con él.
+#
+# Uso (desde backend/apis/base_de_datos):
+#   python -m benchmarks.bench_latest_stats --players 300 --years 5
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, desc, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.dependencies.database import Base
+from app.latest_stats import install_player_latest_stats, rebuild_player_latest_stats
+from app.models import Player, PlayerStadistics
+from app.routers.jugadores import obtener_estadisticas_recientes
+
+START_DATE = date(2015, 1, 1)
+
+
+def snapshot_rows(player_ids: range, day: date, first_stat_id: int, rng: random.Random) -> list:
+    return [
+        {
+            "stat_id": first_stat_id + offset,
+            "player_id": player_id,
+            "snapshot_date": day,
+            "actual_rank": rng.randint(1, 500),
+            "min_rank": rng.randint(1, 500),
+            "hard_winrt": round(rng.random(), 3),
+            "recperf": round(rng.random(), 3),
+        }
+        for offset, player_id in enumerate(player_ids)
+    ]
+
+
+def seed(engine, n_players: int, n_days: int, rng: random.Random) -> int:
+    """
+    Un snapshot diario por jugador durante n_days días. Devuelve el siguiente stat_id libre.
+    """
+    players = range(1, n_players + 1)
+    with engine.begin() as connection:
+        connection.execute(insert(Player), [{"player_id": i, "name": f"Player Name {i}"} for i in players])
+        rows, stat_id = [], 1
+        for day in range(n_days):
+            rows += snapshot_rows(players, START_DATE + timedelta(days=day), stat_id, rng)
+            stat_id += n_players
+            if len(rows) >= 50_000:
+                connection.execute(insert(PlayerStadistics), rows)
+                rows = []
+        if rows:
+            connection.execute(insert(PlayerStadistics), rows)
+    return stat_id
+
+
+def latest_by_order(db, player_id: int):
+    """
+    Consulta anterior a player_latest_stats
+    """
+    return db.query(PlayerStadistics).filter(
+        PlayerStadistics.player_id == player_id
+    ).order_by(desc(PlayerStadistics.snapshot_date)).first()
+
+
+def mean_us(session_factory, fn, player_ids: list) -> float:
+    """
+    Latencia media en µs por jugador; una sesión nueva por lectura, como una petición
+    """
+    start = time.perf_counter()
+    for player_id in player_ids:
+        with session_factory() as db:
+            fn(db, player_id)
+    return (time.perf_counter() - start) * 1e6 / len(player_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark player_latest_stats against ORDER BY snapshot_date per request")
+    parser.add_argument("--players", type=int, default=300)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--database-url", help="Empty scratch PostgreSQL database (installs and exercises the trigger)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    n_days = args.years * 365
+    start = time.perf_counter()
+    next_stat_id = seed(engine, args.players, n_days, rng)
+    print(f"seeded {args.players} players x {n_days} daily snapshots = {args.players * n_days:,} rows "
+          f"in {time.perf_counter() - start:.1f} s ({engine.dialect.name})")
+
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            rows = install_player_latest_stats(connection)
+        else:
+            rows = rebuild_player_latest_stats(connection)
+    print(f"full rebuild of player_latest_stats: {rows} rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if engine.dialect.name == "postgresql":
+        # Un día más de snapshots: el trigger mantiene la tabla en la misma transacción
+        day = START_DATE + timedelta(days=n_days)
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(insert(PlayerStadistics), snapshot_rows(range(1, args.players + 1), day, next_stat_id, rng))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"insert of one more daily snapshot with the trigger: {elapsed:.1f} ms ({elapsed * 1000 / args.players:.0f} us/row)")
+
+    player_ids = [rng.randint(1, args.players) for _ in range(args.reads)]
+    with session_factory() as db:
+        mismatches = sum(
+            obtener_estadisticas_recientes(db, player_id).stat_id != latest_by_order(db, player_id).stat_id
+            for player_id in set(player_ids)
+        )
+    order_us = mean_us(session_factory, latest_by_order, player_ids)
+    latest_us = mean_us(session_factory, obtener_estadisticas_recientes, player_ids)
+    print(f"ORDER BY snapshot_date DESC LIMIT 1: {order_us:9.1f} us/read")
+    print(f"player_latest_stats primary key:     {latest_us:9.1f} us/read  ({order_us / latest_us:.1f}x)")
+    print(f"mismatching players: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
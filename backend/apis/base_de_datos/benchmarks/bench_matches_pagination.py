@@ -0,0 +1,123 @@
+# Benchmark de GET /players/matches con paginación por clave y filtros en SQL
+#
+# Siembra una base SQLite con N partidos por tamaño pedido y mide la latencia y el tamaño
+# de la respuesta de la primera página, de una página profunda (cursor a mitad de la
+# tabla) y de una página filtrada, frente al listado completo sin paginar (el
+# comportamiento anterior). Muestra también el plan de la consulta filtrada.
+#
+# Uso (desde backend/apis/base_de_datos):
+#   python -m benchmarks.bench_matches_pagination --matches 10000 100000 1000000
+import argparse
+import logging
+import os
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import aliased, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.dependencies.database import Base
+from app.models import Match, Player
+from app.routers.jugadores import codificar_cursor_partidos
+from benchmarks.check_matches_queries import client_for
+
+SURFACES = ("Hard", "Clay", "Grass")
+TOURNEY_TYPES = ("G", "M", "A", "D", "F", "O")
+
+
+def seed(engine, n_matches: int, n_players: int = 2000) -> None:
+    """
+    N partidos repartidos en varios años, con jugadores, torneos, tipos y superficies cíclicos
+    """
+    with engine.begin() as connection:
+        connection.execute(insert(Player), [{"player_id": i, "name": f"Player Name {i}"} for i in range(1, n_players + 1)])
+        for start in range(0, n_matches, 50_000):
+            connection.execute(insert(Match), [
+                {
+                    "match_id": i,
+                    "snapshot_date": date(2015, 1, 1) + timedelta(days=i * 3650 // n_matches),
+                    "tourney_name": f"Tournament {i % 70}",
+                    "tourney_tipe": TOURNEY_TYPES[i % len(TOURNEY_TYPES)],
+                    "surface": SURFACES[i % len(SURFACES)],
+                    "player1_id": i % n_players + 1,
+                    "player2_id": (i * 7 + 3) % n_players + 1,
+                }
+                for i in range(start + 1, min(start + 50_000, n_matches) + 1)
+            ])
+
+
+def best(fn, repeat: int) -> tuple:
+    """
+    (menor latencia en ms, resultado de la última llamada)
+    """
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), result
+
+
+def unpaginated(session_factory) -> list:
+    """
+    Listado completo sin paginar: la consulta y el mapeo previos a la paginación
+    """
+    player1, player2 = aliased(Player), aliased(Player)
+    with session_factory() as db:
+        rows = (
+            db.query(Match.snapshot_date, Match.tourney_name, Match.tourney_tipe, Match.surface,
+                     player1.name.label("player1_name"), player2.name.label("player2_name"))
+            .outerjoin(player1, player1.player_id == Match.player1_id)
+            .outerjoin(player2, player2.player_id == Match.player2_id)
+            .all()
+        )
+        return [
+            {"snapshot_date": row.snapshot_date.isoformat(), "player1_name": row.player1_name,
+             "player2_name": row.player2_name, "tourney_name": row.tourney_name,
+             "tourney_type": row.tourney_tipe, "surface": row.surface}
+            for row in rows
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyset pagination of /players/matches")
+    parser.add_argument("--matches", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    for n_matches in args.matches:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        seed(engine, n_matches)
+        client = client_for(engine)
+
+        middle = n_matches // 2
+        middle_date = date(2015, 1, 1) + timedelta(days=middle * 3650 // n_matches)
+        cases = {
+            "first page": {"limit": args.limit, "date_from": "2015-01-01"},
+            "deep page": {"limit": args.limit, "cursor": codificar_cursor_partidos(middle_date, middle)},
+            "filtered page": {"limit": args.limit, "surface": "Clay", "tourney_tipe": "M", "date_from": "2020-01-01"},
+        }
+        for name, params in cases.items():
+            elapsed, response = best(lambda: client.get("/players/matches", params=params), args.repeat)
+            print(f"matches={n_matches:<9} {name:<16} {elapsed:9.2f} ms  response={len(response.content) / 1024:9.1f} KB")
+
+        session_factory = sessionmaker(bind=engine)
+        elapsed, rows = best(lambda: unpaginated(session_factory), 1)
+        print(f"matches={n_matches:<9} {'unpaginated':<16} {elapsed:9.2f} ms  rows={len(rows)} (query + mapping only)")
+
+        with engine.connect() as connection:
+            plan = connection.execute(text(
+                "EXPLAIN QUERY PLAN SELECT match_id FROM matches WHERE surface = 'Clay' "
+                "AND snapshot_date >= '2020-01-01' ORDER BY snapshot_date, match_id LIMIT 101"
+            )).all()
+        print(f"  plan (surface filter): {' / '.join(row[-1] for row in plan)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Comprobación del número de consultas SQL de GET /players/matches
+#
+# Siembra una base SQLite en memoria con N partidos (y 2·N jugadores), pide una página
+# del endpoint y cuenta las sentencias que llegan al driver. El número debe ser constante:
+# si crece con los partidos devueltos, el endpoint ha vuelto a buscar los jugadores
+# partido a partido (N+1) y el script termina con código 1.
+#
+# Con --database-url se cuentan las consultas contra una base existente (solo lectura,
+# sin sembrar datos).
+#
+# Uso (desde backend/apis/base_de_datos):
+#   python -m benchmarks.check_matches_queries --matches 10 200 2000
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.dependencies.database import Base, get_db
+from app.models import Match, Player
+from app.routers import jugadores
+
+MAX_QUERIES = 1
+
+
+def seed(session, n_matches: int) -> None:
+    """
+    2·N jugadores y N partidos; uno de cada cien partidos apunta a un jugador inexistente
+    """
+    session.add_all(Player(player_id=i, name=f"Player Name {i}") for i in range(1, 2 * n_matches + 1))
+    session.add_all(
+        Match(
+            match_id=i,
+            snapshot_date=date(2025, 1, 1) + timedelta(days=i % 365),
+            tourney_name=f"Tournament {i % 40}",
+            tourney_tipe="A",
+            surface=("Hard", "Clay", "Grass")[i % 3],
+            player1_id=2 * i - 1,
+            player2_id=2 * i if i % 100 else 10 ** 9,
+        )
+        for i in range(1, n_matches + 1)
+    )
+    session.commit()
+
+
+def count_queries(engine, client: TestClient) -> tuple:
+    """
+    (consultas ejecutadas, latencia en ms, partidos devueltos) de una página del endpoint
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        start = time.perf_counter()
+        response = client.get("/players/matches", params={"limit": 500, "date_from": "2025-01-01"})
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    response.raise_for_status()
+    return len(statements), elapsed_ms, response.json()["matches_in_page"]
+
+
+def client_for(engine) -> TestClient:
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(jugadores.router)
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that /players/matches runs a constant number of queries")
+    parser.add_argument("--matches", type=int, nargs="+", default=[10, 200, 2000])
+    parser.add_argument("--database-url", help="Count queries against an existing database instead of seeding SQLite")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+        queries, elapsed_ms, total = count_queries(engine, client_for(engine))
+        print(f"matches={total:<7} queries={queries:<5} latency={elapsed_ms:8.1f} ms")
+        sys.exit(0 if queries <= MAX_QUERIES else 1)
+
+    failed = False
+    for n_matches in args.matches:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with sessionmaker(bind=engine)() as session:
+            seed(session, n_matches)
+
+        queries, elapsed_ms, total = count_queries(engine, client_for(engine))
+        failed |= queries > MAX_QUERIES
+        print(f"matches={total:<7} queries={queries:<5} latency={elapsed_ms:8.1f} ms")
+
+    if failed:
+        print(f"FAIL: /players/matches ran more than {MAX_QUERIES} query (per-row lookups are back)")
+        sys.exit(1)
+    print("OK: query count does not depend on the number of matches returned")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+#!/bin/sh
+# Aplica las migraciones pendientes antes de servir tráfico: la versión nueva de la API
+# puede depender de tablas o índices que crean (p. ej. player_latest_stats).
+# RUN_MIGRATIONS=0 lo omite cuando las migraciones se ejecutan en un paso de despliegue aparte.
+set -e
+
+if [ "${RUN_MIGRATIONS:-1}" != "0" ]; then
+    alembic upgrade head
+fi
+
+exec "$@"
@@ -0,0 +1,67 @@
+# Entorno de Alembic: usa DATABASE_URL y los modelos de app.models
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool, text
+
+from app.dependencies.database import Base, DATABASE_URL
+import app.models  # noqa: F401  (registra las tablas en Base.metadata)
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Clave del cerrojo de sesión (pg_advisory_lock) que serializa alembic upgrade
+MIGRATION_LOCK_KEY = 7218450391
+
+
+def run_migrations_offline() -> None:
+    """
+    Genera el SQL de las migraciones sin conectarse (alembic upgrade head --sql)
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Aplica las migraciones sobre una conexión ya abierta (config.attributes["connection"],
+    p. ej. desde los scripts de benchmarks) o sobre una nueva a DATABASE_URL
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    engine = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        # Varias instancias arrancando a la vez (docker-entrypoint.sh): solo una migra,
+        # las demás esperan al cerrojo y encuentran la base ya en head
+        locked = connection.dialect.name == "postgresql"
+        if locked:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
+        try:
+            context.configure(connection=connection, target_metadata=target_metadata)
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if locked:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,104 @@
+"""Esquema inicial: players, player_stadistics, matches, h2h y users
+
+Las tablas se crearon originalmente fuera de la aplicación; esta migración solo crea
+las que falten, de modo que una base existente pasa por ella sin cambios.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # En modo offline (--sql) no hay conexión que inspeccionar: se genera el esquema completo
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "players" not in existing:
+        op.create_table(
+            "players",
+            sa.Column("player_id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.VARCHAR(255), nullable=False),
+            sa.Column("country", sa.VARCHAR(3)),
+            sa.Column("date_of_birth", sa.Date()),
+            sa.Column("height_cm", sa.Integer()),
+            sa.Column("hand", sa.Integer()),
+            sa.Column("image_url", sa.Text()),
+        )
+        op.create_index("ix_players_player_id", "players", ["player_id"])
+        op.create_index("ix_players_name", "players", ["name"])
+
+    if "player_stadistics" not in existing:
+        op.create_table(
+            "player_stadistics",
+            sa.Column("stat_id", sa.Integer(), primary_key=True),
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.player_id", ondelete="CASCADE"), nullable=False),
+            sa.Column("snapshot_date", sa.Date(), nullable=False),
+            sa.Column("actual_rank", sa.Integer()),
+            sa.Column("min_rank", sa.Integer()),
+            *[
+                sa.Column(name, sa.DECIMAL(5, 3))
+                for name in (
+                    "grass_winrt", "hard_winrt", "clay_winrt", "g_winrt", "a_winrt", "d_winrt", "m_winrt",
+                    "f_winrt", "o_winrt", "pct_1stin", "pct_1stwon", "pct_2ndwon", "pct_svptswon", "pct_bpconv",
+                    "pct_bpsaved", "pct_1stretptswon", "pct_2ndretptswon", "recperf",
+                )
+            ],
+        )
+        op.create_index("ix_player_stadistics_stat_id", "player_stadistics", ["stat_id"])
+        op.create_index("ix_player_stadistics_player_id", "player_stadistics", ["player_id"])
+
+    if "matches" not in existing:
+        op.create_table(
+            "matches",
+            sa.Column("match_id", sa.Integer(), primary_key=True),
+            sa.Column("snapshot_date", sa.Date(), nullable=False),
+            sa.Column("tourney_name", sa.VARCHAR(255)),
+            sa.Column("tourney_tipe", sa.VARCHAR(100)),
+            sa.Column("surface", sa.VARCHAR(50)),
+            sa.Column("player1_id", sa.Integer(), sa.ForeignKey("players.player_id"), nullable=False),
+            sa.Column("player2_id", sa.Integer(), sa.ForeignKey("players.player_id"), nullable=False),
+        )
+        op.create_index("ix_matches_match_id", "matches", ["match_id"])
+        op.create_index("ix_matches_player1_id", "matches", ["player1_id"])
+        op.create_index("ix_matches_player2_id", "matches", ["player2_id"])
+
+    if "h2h" not in existing:
+        op.create_table(
+            "h2h",
+            sa.Column("h2h_id", sa.Integer(), primary_key=True),
+            sa.Column("snapshot_date", sa.Date(), nullable=False),
+            sa.Column("player1_id", sa.Integer(), sa.ForeignKey("players.player_id", ondelete="CASCADE"), nullable=False),
+            sa.Column("player2_id", sa.Integer(), sa.ForeignKey("players.player_id", ondelete="CASCADE"), nullable=False),
+            sa.Column("p1_h2h_win", sa.Integer()),
+            sa.Column("p2_h2h_win", sa.Integer()),
+        )
+        op.create_index("ix_h2h_h2h_id", "h2h", ["h2h_id"])
+        op.create_index("ix_h2h_player1_id", "h2h", ["player1_id"])
+        op.create_index("ix_h2h_player2_id", "h2h", ["player2_id"])
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("firebase_uid", sa.VARCHAR(255), primary_key=True),
+            sa.Column("email", sa.VARCHAR(255), nullable=False),
+            sa.Column("display_name", sa.VARCHAR(255)),
+            sa.Column("photo_url", sa.Text()),
+            sa.Column("auth_provider", sa.VARCHAR(50), nullable=False),
+            sa.Column("credits", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        )
+        op.create_index("ix_users_firebase_uid", "users", ["firebase_uid"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+
+def downgrade() -> None:
+    # El esquema inicial no se elimina: contiene los datos de producción
+    pass
@@ -0,0 +1,33 @@
+"""Índices de la paginación por clave y los filtros de /players/matches
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_matches_snapshot_date_match_id", ["snapshot_date", "match_id"]),
+    ("ix_matches_tourney_name_snapshot_date", ["tourney_name", "snapshot_date", "match_id"]),
+    ("ix_matches_tourney_tipe_snapshot_date", ["tourney_tipe", "snapshot_date", "match_id"]),
+    ("ix_matches_surface_snapshot_date", ["surface", "snapshot_date", "match_id"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY (PostgreSQL) no bloquea las escrituras mientras se construye el índice;
+    # requiere ejecutarse fuera de la transacción de la migración
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(name, "matches", columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in INDEXES:
+            op.drop_index(name, table_name="matches", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,143 @@
+"""Tabla player_latest_stats mantenida por trigger sobre player_stadistics
+
+El DDL, los triggers y la reconstrucción se definen aquí, congelados con la revisión:
+app/latest_stats.py (instalación y reconstrucción manuales) importa estas mismas
+sentencias en lugar de duplicarlas, y app/models.py puede cambiar sin alterar lo que
+aplica esta migración.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "player_id", "stat_id", "snapshot_date", "actual_rank", "min_rank", "grass_winrt", "hard_winrt",
+    "clay_winrt", "g_winrt", "a_winrt", "d_winrt", "m_winrt", "f_winrt", "o_winrt", "pct_1stin",
+    "pct_1stwon", "pct_2ndwon", "pct_svptswon", "pct_bpconv", "pct_bpsaved", "pct_1stretptswon",
+    "pct_2ndretptswon", "recperf",
+)
+_COLUMN_LIST = ", ".join(COLUMNS)
+_UPSERT_SET = ", ".join(f"{name} = EXCLUDED.{name}" for name in COLUMNS if name != "player_id")
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS player_latest_stats (
+    player_id INTEGER NOT NULL,
+    stat_id INTEGER NOT NULL,
+    snapshot_date DATE NOT NULL,
+    actual_rank INTEGER,
+    min_rank INTEGER,
+    grass_winrt DECIMAL(5, 3),
+    hard_winrt DECIMAL(5, 3),
+    clay_winrt DECIMAL(5, 3),
+    g_winrt DECIMAL(5, 3),
+    a_winrt DECIMAL(5, 3),
+    d_winrt DECIMAL(5, 3),
+    m_winrt DECIMAL(5, 3),
+    f_winrt DECIMAL(5, 3),
+    o_winrt DECIMAL(5, 3),
+    pct_1stin DECIMAL(5, 3),
+    pct_1stwon DECIMAL(5, 3),
+    pct_2ndwon DECIMAL(5, 3),
+    pct_svptswon DECIMAL(5, 3),
+    pct_bpconv DECIMAL(5, 3),
+    pct_bpsaved DECIMAL(5, 3),
+    pct_1stretptswon DECIMAL(5, 3),
+    pct_2ndretptswon DECIMAL(5, 3),
+    recperf DECIMAL(5, 3),
+    PRIMARY KEY (player_id),
+    FOREIGN KEY (player_id) REFERENCES players (player_id) ON DELETE CASCADE
+)
+"""
+
+REBUILD_SQL = f"""
+INSERT INTO player_latest_stats ({_COLUMN_LIST})
+SELECT {_COLUMN_LIST} FROM (
+    SELECT {_COLUMN_LIST},
+           ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY snapshot_date DESC, stat_id DESC) AS position
+    FROM player_stadistics
+) ranked
+WHERE position = 1
+"""
+
+TRIGGER_SQL = [
+    f"""
+CREATE OR REPLACE FUNCTION refresh_player_latest_stats_for(target_player_id INTEGER) RETURNS void AS $$
+BEGIN
+    DELETE FROM player_latest_stats WHERE player_id = target_player_id;
+    INSERT INTO player_latest_stats ({_COLUMN_LIST})
+    SELECT {_COLUMN_LIST} FROM player_stadistics
+    WHERE player_id = target_player_id
+    ORDER BY snapshot_date DESC, stat_id DESC
+    LIMIT 1
+    ON CONFLICT (player_id) DO UPDATE SET {_UPSERT_SET};
+END;
+$$ LANGUAGE plpgsql
+""",
+    f"""
+CREATE OR REPLACE FUNCTION player_latest_stats_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO player_latest_stats ({_COLUMN_LIST})
+        VALUES ({", ".join(f"NEW.{name}" for name in COLUMNS)})
+        ON CONFLICT (player_id) DO UPDATE SET {_UPSERT_SET}
+        WHERE (player_latest_stats.snapshot_date, player_latest_stats.stat_id)
+              <= (EXCLUDED.snapshot_date, EXCLUDED.stat_id);
+        RETURN NULL;
+    END IF;
+
+    PERFORM refresh_player_latest_stats_for(OLD.player_id);
+    IF TG_OP = 'UPDATE' AND NEW.player_id <> OLD.player_id THEN
+        PERFORM refresh_player_latest_stats_for(NEW.player_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    "DROP TRIGGER IF EXISTS player_latest_stats_refresh ON player_stadistics",
+    """
+CREATE TRIGGER player_latest_stats_refresh
+AFTER INSERT OR UPDATE OR DELETE ON player_stadistics
+FOR EACH ROW EXECUTE FUNCTION player_latest_stats_trigger()
+""",
+    # TRUNCATE no dispara los triggers por fila: un trigger por sentencia vacía también la tabla
+    """
+CREATE OR REPLACE FUNCTION player_latest_stats_truncate_trigger() RETURNS trigger AS $$
+BEGIN
+    TRUNCATE player_latest_stats;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    "DROP TRIGGER IF EXISTS player_latest_stats_truncate ON player_stadistics",
+    """
+CREATE TRIGGER player_latest_stats_truncate
+AFTER TRUNCATE ON player_stadistics
+FOR EACH STATEMENT EXECUTE FUNCTION player_latest_stats_truncate_trigger()
+""",
+]
+
+
+def upgrade() -> None:
+    op.execute(CREATE_TABLE_SQL)
+    # El trigger es de PostgreSQL; en otros motores la tabla se llena solo con la reconstrucción
+    if op.get_context().dialect.name == "postgresql":
+        for statement in TRIGGER_SQL:
+            op.execute(statement)
+    op.execute("DELETE FROM player_latest_stats")
+    op.execute(REBUILD_SQL)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS player_latest_stats_truncate ON player_stadistics")
+        op.execute("DROP TRIGGER IF EXISTS player_latest_stats_refresh ON player_stadistics")
+        op.execute("DROP FUNCTION IF EXISTS player_latest_stats_truncate_trigger()")
+        op.execute("DROP FUNCTION IF EXISTS player_latest_stats_trigger()")
+        op.execute("DROP FUNCTION IF EXISTS refresh_player_latest_stats_for(INTEGER)")
+    op.drop_table("player_latest_stats")
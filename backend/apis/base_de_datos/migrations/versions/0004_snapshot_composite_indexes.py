@@ -0,0 +1,38 @@
+"""Índices compuestos para las búsquedas del último snapshot
+
+- player_stadistics (player_id, snapshot_date DESC, stat_id DESC): último snapshot de un
+  jugador (reconstrucción de player_latest_stats y lectura de respaldo); stat_id es el
+  desempate del ORDER BY, así el orden completo sale del índice sin ordenar en memoria.
+- h2h (player1_id, player2_id, snapshot_date DESC): último H2H de una pareja; la
+  consulta en ambos sentidos usa el índice una vez por sentido.
+Las búsquedas de partidos por fecha usan ix_matches_snapshot_date_match_id (0002).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_player_stadistics_player_id_snapshot_date", "player_stadistics", ["player_id", sa.text("snapshot_date DESC"), sa.text("stat_id DESC")]),
+    ("ix_h2h_players_snapshot_date", "h2h", ["player1_id", "player2_id", sa.text("snapshot_date DESC")]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY (PostgreSQL) no bloquea las escrituras mientras se construye el índice
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -1,15 +1,56 @@
 import os
 from pathlib import Path
 
+def default_model_path(name: str) -> str:
+    """
+    Usa el modelo en formato nativo de XGBoost (.ubj) si existe; si no, el pickle original
+    """
+    native_path = Path("./AI_models") / f"{name}.ubj"
+    if native_path.exists():
+        return f"./{native_path.as_posix()}"
+    return f"./AI_models/{name}.pkl"
+
 class Settings:
     """
     Configuración de la aplicación
     """
     
     # Configuración del modelo
-    MODEL_PATH: str = os.getenv("MODEL_PATH", "./AI_models/modelo_xgb2.pkl")
-    MODEL_REDUCED_PATH: str = os.getenv("MODEL_REDUCED_PATH", "./AI_models/modelo_reduced_xgb2.pkl")
-    MODEL_VERSION: str = "1.0.0"
+    MODEL_PATH: str = os.getenv("MODEL_PATH", default_model_path("modelo_xgb2"))
+    MODEL_REDUCED_PATH: str = os.getenv("MODEL_REDUCED_PATH", default_model_path("modelo_reduced_xgb2"))
+    MODELS_DIR: str = os.getenv("MODELS_DIR", "./AI_models")
+    # Token para los endpoints de administración de modelos (vacío = deshabilitados)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+    WARMUP_ITERATIONS: int = int(os.getenv("WARMUP_ITERATIONS", 3))
+    # Arranque: "eager" carga y calienta los modelos antes de aceptar tráfico; "lazy" acepta
+    # tráfico de inmediato y los carga en segundo plano (/ready da 503 hasta que terminan)
+    STARTUP_MODE: str = os.getenv("STARTUP_MODE", "eager").lower()
+    
+    # Configuración de inferencia (INFERENCE_WORKERS * XGBOOST_NTHREAD no debería superar los núcleos)
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", os.cpu_count() or 1))
+    XGBOOST_NTHREAD: int = int(os.getenv("XGBOOST_NTHREAD", 1))
+    # Backend de inferencia: "xgboost" o "numpy" (evaluador vectorizado sin DMatrix)
+    INFERENCE_BACKEND: str = os.getenv("INFERENCE_BACKEND", "xgboost").lower()
+    # Con el backend "numpy", los lotes más grandes que esto siguen usando XGBoost
+    NUMPY_BACKEND_MAX_BATCH: int = int(os.getenv("NUMPY_BACKEND_MAX_BATCH", 64))
+    
+    # Micro-batching de peticiones concurrentes a /predict y /predict-reduced (opcional)
+    MICROBATCH_ENABLED: bool = os.getenv("MICROBATCH_ENABLED", "False").lower() == "true"
+    MICROBATCH_MAX_WAIT_MS: float = float(os.getenv("MICROBATCH_MAX_WAIT_MS", 2.0))
+    MICROBATCH_MAX_BATCH_SIZE: int = int(os.getenv("MICROBATCH_MAX_BATCH_SIZE", 64))
+    
+    # Caché de predicciones (LRU + TTL); PREDICTION_CACHE_SIZE=0 la desactiva
+    PREDICTION_CACHE_SIZE: int = int(os.getenv("PREDICTION_CACHE_SIZE", 10000))
+    PREDICTION_CACHE_TTL_SECONDS: float = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", 300))
+    PREDICTION_CACHE_DECIMALS: int = int(os.getenv("PREDICTION_CACHE_DECIMALS", 6))
+    
+    # Matriz de enfrentamientos: N jugadores generan N·(N-1) filas en una sola llamada al modelo
+    PAIRWISE_MAX_PLAYERS: int = int(os.getenv("PAIRWISE_MAX_PLAYERS", 256))
+    # Cascada: el modelo reducido responde primero y el completo solo si la confianza
+    # (|P(p1) - P(p2)|) del reducido queda por debajo de este umbral
+    CASCADE_CONFIDENCE_THRESHOLD: float = float(os.getenv("CASCADE_CONFIDENCE_THRESHOLD", 0.1))
+    # Simulación de cuadros: tope de simulaciones Monte Carlo por petición
+    SIMULATION_MAX_RUNS: int = int(os.getenv("SIMULATION_MAX_RUNS", 1_000_000))
     
     # Configuración de la API
     API_TITLE: str = "Tennis Match Prediction API"
@@ -19,10 +60,20 @@ class Settings:
     # Configuración del servidor
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", 8000))
+    # Workers de gunicorn; con PRELOAD_MODELS los modelos se cargan una vez en el proceso
+    # maestro y los workers comparten esa memoria copy-on-write tras el fork
+    # Con más de un worker /admin/models/activate responde 409: cada worker tiene su propio modelo activo
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", 1))
+    PRELOAD_MODELS: bool = os.getenv("PRELOAD_MODELS", "False").lower() == "true"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     
     # Configuración de logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # json | text
+    # Fracción de eventos por predicción que se registran (los errores siempre se registran).
+    # LOG_SAMPLE_RATES ajusta por ruta: "predict=0.01,predict_reduced=0.01,predict_batch=1"
+    LOG_SAMPLE_RATE: float = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
     
     # Configuración de CORS
     CORS_ORIGINS: list = ["*"]  # En producción, especificar orígenes específicos
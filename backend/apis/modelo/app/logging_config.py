@@ -0,0 +1,123 @@
+# Logging estructurado, no bloqueante y con muestreo para el camino caliente de predicción
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from typing import Dict, Optional
+
+# Atributos estándar de LogRecord; el resto se considera contexto estructurado (extra=...)
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_sample_rates: Dict[str, float] = {}
+_default_sample_rate = 1.0
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Una línea JSON por registro; el mensaje se formatea aquí, en el hilo del listener
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que no formatea en el hilo que hace el log: pasa el registro tal cual
+    al listener, que es quien construye el mensaje y escribe en stdout
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """
+    Convierte "predict=0.01,predict_reduced=0.05" en {"predict": 0.01, "predict_reduced": 0.05}
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+def should_sample(route: str) -> bool:
+    """
+    Decide si se registra este evento de `route` según su tasa de muestreo (los errores no pasan por aquí)
+    """
+    rate = _sample_rates.get(route, _default_sample_rate)
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def _start_listener() -> None:
+    global _listener
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_formatter)
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, stream_handler, respect_handler_level=False)
+    _listener.start()
+
+
+def _restart_after_fork() -> None:
+    # El hilo del listener no sobrevive al fork (gunicorn --preload): nueva cola y nuevo listener
+    if _queue_handler is not None:
+        _queue_handler.queue = queue.SimpleQueue()
+        _start_listener()
+
+
+def configure_logging(level: str = "INFO", log_format: str = "json",
+                      sample_rate: float = 1.0, route_sample_rates: str = "") -> None:
+    """
+    Sustituye los handlers del root logger por un QueueHandler; un hilo aparte
+    formatea y escribe los registros, así el request nunca espera por stdout
+    """
+    global _queue_handler, _formatter, _default_sample_rate, _sample_rates
+
+    _default_sample_rate = sample_rate
+    _sample_rates = parse_sample_rates(route_sample_rates)
+
+    if _queue_handler is not None:
+        logging.getLogger().setLevel(level)
+        return
+
+    _formatter = JsonFormatter() if log_format == "json" else logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    _queue_handler = _LazyQueueHandler(queue.SimpleQueue())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _start_listener()
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def stop_logging() -> None:
+    """
+    Vacía la cola pendiente al apagar el servicio
+    """
+    if _listener is not None:
+        _listener.stop()
+
+
+_formatter: logging.Formatter = JsonFormatter()
@@ -1,18 +1,47 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 import logging
 
-from app.routers import prediction
+from app.routers import prediction, admin
 from app.config import settings
+from app.logging_config import configure_logging, stop_logging
+from app.metrics import MetricsMiddleware, registry as metrics_registry
+from app.models.predictor import get_predictor
+from app.startup import readiness, load_models, prepare_models, start_background_load
 
 # Configurar logging
-logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL))
+configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_SAMPLE_RATE, settings.LOG_SAMPLE_RATES)
 logger = logging.getLogger(__name__)
 
+# Modo multiproceso: con gunicorn --preload la app se importa en el proceso maestro,
+# así que los modelos se cargan una sola vez antes del fork. No se hacen predicciones
+# aquí (ni la verificación del evaluador NumPy): el pool de hilos de XGBoost no sobrevive
+# al fork, la verificación y el calentamiento van en cada worker (prepare_models).
+if settings.PRELOAD_MODELS:
+    load_models(before_fork=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Carga ambos modelos (si no vienen precargados) y los calienta antes de aceptar tráfico,
+    o en segundo plano con STARTUP_MODE=lazy
+    """
+    if settings.STARTUP_MODE == "lazy":
+        start_background_load()
+    else:
+        prepare_models()
+    yield
+
+    get_predictor().shutdown()
+    stop_logging()
+
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
-    version=settings.API_VERSION
+    version=settings.API_VERSION,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -23,9 +52,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+
 
 # Include routers
 app.include_router(prediction.router, prefix="/api/v1", tags=["prediction"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
 
 @app.get("/")
 async def root():
@@ -38,3 +70,18 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe: 200 solo cuando ambos modelos están cargados y calientes
+    """
+    status_code = status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=status_code, content=readiness)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Métricas en formato de texto de Prometheus: latencia por etapa y contadores
+    """
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,205 @@
+# Métricas internas del API de predicción (formato de texto de Prometheus en /metrics)
+import bisect
+import threading
+import time
+from typing import Dict, List, Tuple
+
+LATENCY_BUCKETS_SECONDS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+
+class Histogram:
+    """
+    Histograma acumulativo con buckets fijos, seguro entre hilos
+    """
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # el último es +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """
+        Devuelve los conteos acumulados por bucket ("le"), la suma y el total de observaciones
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum, total_count = self._sum, self._count
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets + [float("inf")], counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+        return {"buckets": cumulative, "sum": total_sum, "count": total_count}
+
+
+class Counter:
+    """
+    Contador monótono, seguro entre hilos
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class MetricFamily:
+    """
+    Conjunto de métricas con el mismo nombre y distintas etiquetas
+    """
+
+    def __init__(self, name: str, description: str, kind: str, labelnames: Tuple[str, ...], buckets: List[float] = None):
+        self.name = name
+        self.description = description
+        self.kind = kind
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = Histogram(self.buckets) if self.kind == "histogram" else Counter()
+                    self._children[key] = child
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            label_pairs = [f'{name}="{value}"' for name, value in zip(self.labelnames, key)]
+            if self.kind == "counter":
+                lines.append(f"{self.name}{_format_labels(label_pairs)} {child.value}")
+                continue
+            snapshot = child.snapshot()
+            for bound, count in snapshot["buckets"].items():
+                bucket_labels = label_pairs + [f'le="{bound}"']
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(label_pairs)} {snapshot['sum']}")
+            lines.append(f"{self.name}_count{_format_labels(label_pairs)} {snapshot['count']}")
+        return lines
+
+
+def _format_labels(label_pairs: List[str]) -> str:
+    return "{" + ",".join(label_pairs) + "}" if label_pairs else ""
+
+
+class MetricsRegistry:
+    """
+    Registro de todas las métricas del servicio
+    """
+
+    def __init__(self):
+        self._families: List[MetricFamily] = []
+
+    def histogram(self, name: str, description: str, labelnames: Tuple[str, ...] = (),
+                  buckets: List[float] = LATENCY_BUCKETS_SECONDS) -> MetricFamily:
+        family = MetricFamily(name, description, "histogram", labelnames, buckets)
+        self._families.append(family)
+        return family
+
+    def counter(self, name: str, description: str, labelnames: Tuple[str, ...] = ()) -> MetricFamily:
+        family = MetricFamily(name, description, "counter", labelnames)
+        self._families.append(family)
+        return family
+
+    def render(self) -> str:
+        lines = []
+        for family in self._families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Latencia por etapa: prepare_features (validación y matriz), dmatrix, model_predict, serialization
+STAGE_SECONDS = registry.histogram(
+    "prediction_stage_seconds", "Latency of each prediction stage in seconds", ("stage", "model")
+)
+REQUESTS_TOTAL = registry.counter("prediction_requests_total", "Prediction requests received", ("route",))
+ERRORS_TOTAL = registry.counter("prediction_errors_total", "Prediction requests answered with an error", ("route",))
+LAZY_MODEL_LOADS_TOTAL = registry.counter(
+    "prediction_lazy_model_loads_total", "Models loaded on demand by a request instead of at startup", ("model",)
+)
+LABEL_FALLBACK_TOTAL = registry.counter(
+    "prediction_label_fallback_total", "Rows answered with the fixed 0.7/0.3 probabilities of label-only models", ("model",)
+)
+CASCADE_ANSWERS_TOTAL = registry.counter(
+    "prediction_cascade_answers_total", "Cascade predictions by the model that produced the answer", ("model",)
+)
+
+
+def route_label(scope) -> str:
+    """
+    Etiqueta route de las métricas: la plantilla de la ruta que atendió la petición
+    (route.path, p. ej. /predict/batch), nunca la ruta cruda, para que rutas arbitrarias
+    no creen series nuevas. "unmatched" si ninguna ruta coincidió.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que cuenta las peticiones de predicción (por plantilla de ruta) y mide
+    la serialización (desde que termina el handler hasta que sale la respuesta)
+    """
+
+    def __init__(self, app, path_prefix: str = "/api/v1/predict"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        # El router escribe la ruta encontrada en scope["route"]: se cuenta al responder
+        state = scope.setdefault("state", {})
+        counted = False
+
+        async def timed_send(message):
+            nonlocal counted
+            if message["type"] == "http.response.start":
+                handler_done = state.get("handler_done")
+                if handler_done is not None:
+                    STAGE_SECONDS.labels(stage="serialization", model=state.get("model", "full")).observe(
+                        time.perf_counter() - handler_done
+                    )
+                route = route_label(scope)
+                REQUESTS_TOTAL.labels(route=route).inc()
+                if message["status"] >= 400:
+                    ERRORS_TOTAL.labels(route=route).inc()
+                counted = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        except Exception:
+            # Excepción sin respuesta: la convierte en 500 el middleware de errores exterior
+            if not counted:
+                route = route_label(scope)
+                REQUESTS_TOTAL.labels(route=route).inc()
+                ERRORS_TOTAL.labels(route=route).inc()
+            raise
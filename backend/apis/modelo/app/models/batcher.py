@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import numpy as np
+import time
+from typing import List, Optional, Set
+
+from app.config import settings
+from app.metrics import registry
+from app.models.predictor import XGBoostPredictor, get_predictor
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+QUEUE_WAIT_BUCKETS_SECONDS = [0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05]
+
+MICROBATCH_SIZE = registry.histogram(
+    "prediction_microbatch_size", "Rows per micro-batch", ("model",), buckets=BATCH_SIZE_BUCKETS
+)
+MICROBATCH_QUEUE_WAIT_SECONDS = registry.histogram(
+    "prediction_microbatch_queue_wait_seconds", "Time a row waits for its micro-batch in seconds",
+    ("model",), buckets=QUEUE_WAIT_BUCKETS_SECONDS
+)
+
+class MicroBatcher:
+    """
+    Agrupa predicciones concurrentes de un mismo modelo durante una ventana corta
+    (max_wait_ms o max_batch_size filas) y las resuelve con una sola llamada a XGBoost
+    """
+
+    def __init__(self, predictor: XGBoostPredictor, reduced: bool = False,
+                 max_wait_ms: float = 2.0, max_batch_size: int = 64):
+        self.predictor = predictor
+        self.reduced = reduced
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        model_name = "reduced" if reduced else "full"
+        self.batch_size = MICROBATCH_SIZE.labels(model=model_name)
+        self.queue_wait_seconds = MICROBATCH_QUEUE_WAIT_SECONDS.labels(model=model_name)
+        # Solo se accede desde el event loop, no necesita locks
+        self._pending = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Referencias a los lotes en curso: el event loop solo guarda referencias débiles a
+        # las tareas, y una tarea recolectada dejaría sus futures sin resolver
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, features: np.ndarray) -> dict:
+        """
+        Encola una fila de características (float32, orden del modelo) y espera
+        su resultado cuando se procese el lote
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((features, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """
+        Cierra la ventana actual y lanza la inferencia del lote acumulado
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[tuple]) -> None:
+        started = time.perf_counter()
+        self.batch_size.observe(len(batch))
+        for _, _, enqueued in batch:
+            self.queue_wait_seconds.observe(started - enqueued)
+
+        try:
+            features = np.vstack([row for row, _, _ in batch])
+            results = await self.predictor.run_inference(self.predictor.predict_features, features, self.reduced)
+        except Exception as e:
+            logger.error(f"Error in micro-batch of {len(batch)} rows: {str(e)}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(ValueError(str(e)))
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "batch_size": self.batch_size.snapshot(),
+            "queue_wait_seconds": self.queue_wait_seconds.snapshot(),
+        }
+
+# Instancias globales, una por modelo
+batcher = MicroBatcher(
+    get_predictor(),
+    max_wait_ms=settings.MICROBATCH_MAX_WAIT_MS,
+    max_batch_size=settings.MICROBATCH_MAX_BATCH_SIZE
+)
+batcher_reduced = MicroBatcher(
+    get_predictor(),
+    reduced=True,
+    max_wait_ms=settings.MICROBATCH_MAX_WAIT_MS,
+    max_batch_size=settings.MICROBATCH_MAX_BATCH_SIZE
+)
+
+def get_batcher(reduced: bool = False) -> MicroBatcher:
+    """
+    Factory function para obtener el micro-batcher de cada modelo
+    """
+    return batcher_reduced if reduced else batcher
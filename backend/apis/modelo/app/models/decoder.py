@@ -0,0 +1,126 @@
+import numpy as np
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
+
+from app.models.predictor import get_predictor
+from app.schemas.prediction import MatchPredictionInput, MatchPredictionInputReduced
+
+
+class FeatureDecoder:
+    """
+    Decodificador generado una vez a partir del schema y del orden de características
+    del modelo: valida el JSON ya parseado y escribe los valores directamente en una
+    matriz float32, sin crear el modelo pydantic ni el diccionario intermedio.
+
+    El camino rápido cubre los payloads bien tipados (números JSON en todos los campos);
+    cualquier otro caso (campos ausentes, strings numéricos, floats en campos int...) se
+    delega en el propio schema, así los valores aceptados y los mensajes de error son
+    exactamente los de pydantic.
+    """
+
+    def __init__(self, schema: Type[BaseModel], feature_names: List[str]):
+        fields = schema.model_fields
+        unknown = [name for name in feature_names if name not in fields]
+        if unknown:
+            raise ValueError(f"Features not present in {schema.__name__}: {unknown}")
+
+        self.schema = schema
+        self.feature_names = list(feature_names)
+        self._getter = itemgetter(*self.feature_names)
+        # Columnas cuyo campo es int: un float JSON ahí necesita la validación de pydantic
+        self._int_columns = [
+            column for column, name in enumerate(self.feature_names) if fields[name].annotation is int
+        ]
+
+    def _fast_values(self, payload: Any) -> Optional[tuple]:
+        """
+        Valores en orden del modelo si el payload es trivialmente válido, o None
+        """
+        if type(payload) is not dict:
+            return None
+        try:
+            values = self._getter(payload)
+        except KeyError:
+            return None
+        for value in values:
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                return None
+        for column in self._int_columns:
+            if type(values[column]) is not int:
+                return None
+        return values
+
+    def decode_into(self, payload: Any, out: np.ndarray) -> None:
+        """
+        Valida un partido y escribe sus características en `out` (una fila float32).
+        Lanza pydantic.ValidationError si el payload no cumple el schema.
+        """
+        values = self._fast_values(payload)
+        if values is not None:
+            try:
+                out[:] = values
+                return
+            except (OverflowError, ValueError):
+                # Enteros que no caben en un float: que los valide pydantic
+                pass
+        validated = self.schema.model_validate(payload)
+        values = tuple(getattr(validated, name) for name in self.feature_names)
+        try:
+            out[:] = values
+        except (OverflowError, ValueError):
+            raise self._out_of_range_error(values) from None
+
+    def _out_of_range_error(self, values: tuple) -> ValidationError:
+        """
+        ValidationError para los campos int que pydantic acepta pero no caben en un float
+        """
+        line_errors = []
+        for name, value in zip(self.feature_names, values):
+            try:
+                float(value)
+            except (OverflowError, ValueError):
+                line_errors.append({
+                    "type": PydanticCustomError("float_overflow", "Input is too large to be represented as a number"),
+                    "loc": (name,),
+                    "input": value,
+                })
+        return ValidationError.from_exception_data(self.schema.__name__, line_errors)
+
+    def decode(self, payload: Any) -> np.ndarray:
+        """
+        Matriz (1, n_features) lista para el predictor
+        """
+        features = np.empty((1, len(self.feature_names)), dtype=np.float32)
+        self.decode_into(payload, features[0])
+        return features
+
+    def decode_many(self, payloads: List[Any]) -> Tuple[np.ndarray, List[int], List[Tuple[int, ValidationError]]]:
+        """
+        Decodifica un lote en una sola matriz. Devuelve la matriz de filas válidas,
+        sus índices en la entrada original y los errores de las filas inválidas.
+        """
+        features = np.empty((len(payloads), len(self.feature_names)), dtype=np.float32)
+        valid_indices = []
+        errors = []
+        for index, payload in enumerate(payloads):
+            try:
+                self.decode_into(payload, features[len(valid_indices)])
+                valid_indices.append(index)
+            except ValidationError as ve:
+                errors.append((index, ve))
+        return features[:len(valid_indices)], valid_indices, errors
+
+
+# Instancias globales, una por modelo, generadas al importar
+decoder = FeatureDecoder(MatchPredictionInput, get_predictor().feature_names)
+decoder_reduced = FeatureDecoder(MatchPredictionInputReduced, get_predictor().reduced_feature_names)
+
+def get_decoder(reduced: bool = False) -> FeatureDecoder:
+    """
+    Factory function para obtener el decodificador de cada modelo
+    """
+    return decoder_reduced if reduced else decoder
@@ -0,0 +1,215 @@
+import importlib
+import io
+import numpy as np
+from typing import List, Optional
+
+# Dependencias opcionales: sin ellas esos formatos responden 415. Se importan en la primera
+# petición que las usa (pyarrow tarda ~0.1 s en importarse) y el resultado queda en caché.
+_optional_modules = {}
+
+
+def optional_dependency(name: str):
+    """
+    Módulo opcional importado en su primer uso, o None si no está instalado
+    """
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    return _optional_modules[name]
+
+# Formatos binarios/columnares aceptados en la predicción por lotes (Content-Type / Accept)
+MEDIA_JSON = "application/json"
+MEDIA_NPY = "application/x-npy"
+MEDIA_ARROW = "application/vnd.apache.arrow.stream"
+MEDIA_MSGPACK = "application/msgpack"
+
+_ALIASES = {
+    "application/vnd.apache.arrow.file": MEDIA_ARROW,
+    "application/x-msgpack": MEDIA_MSGPACK,
+    "application/octet-stream": MEDIA_NPY,
+}
+BINARY_MEDIA_TYPES = (MEDIA_NPY, MEDIA_ARROW, MEDIA_MSGPACK)
+
+# Columnas de la respuesta binaria, mismas que MatchPredictionOutput
+RESULT_DTYPE = np.dtype([
+    ("prediction", "i1"), ("probability_p1_wins", "<f4"), ("probability_p2_wins", "<f4")
+])
+
+
+class UnsupportedFormatError(ValueError):
+    """
+    Formato no soportado o sin su dependencia instalada (se responde 415)
+    """
+
+
+def normalize_media_type(header: Optional[str]) -> Optional[str]:
+    """
+    Tipo de medio sin parámetros y con alias resueltos; None si no es uno de los soportados
+    """
+    if not header:
+        return None
+    media_type = header.split(";", 1)[0].strip().lower()
+    media_type = _ALIASES.get(media_type, media_type)
+    return media_type if media_type in BINARY_MEDIA_TYPES or media_type == MEDIA_JSON else None
+
+
+def negotiate_response_type(accept: Optional[str]) -> str:
+    """
+    Primer formato binario aceptado por el cliente en la cabecera Accept; JSON en otro caso
+    """
+    for candidate in (accept or "").split(","):
+        media_type = normalize_media_type(candidate)
+        if media_type in BINARY_MEDIA_TYPES:
+            return media_type
+    return MEDIA_JSON
+
+
+def _require(name: str, media_type: str):
+    module = optional_dependency(name)
+    if module is None:
+        raise UnsupportedFormatError(f"{media_type} requires the optional dependency '{name}'")
+    return module
+
+
+def _read_npy(body: bytes, feature_names: List[str]) -> np.ndarray:
+    """
+    .npy sin copia: se lee la cabecera y los datos se mapean directamente sobre el cuerpo.
+    Acepta una matriz (n, n_features) en el orden del modelo o un array estructurado con
+    un campo por característica (en cualquier orden).
+    """
+    stream = io.BytesIO(body)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    else:
+        raise ValueError(f"Unsupported .npy format version {version}")
+    if dtype.hasobject:
+        raise ValueError("Object arrays are not supported")
+    count = int(np.prod(shape)) if shape else 1
+    data = np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    data = data.reshape(shape, order="F" if fortran_order else "C")
+
+    if dtype.names:
+        missing = [name for name in feature_names if name not in dtype.names]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        features = np.empty((len(data), len(feature_names)), dtype=np.float32)
+        for column, name in enumerate(feature_names):
+            features[:, column] = data[name]
+        return features
+
+    if data.ndim != 2 or data.shape[1] != len(feature_names):
+        raise ValueError(f"Expected an array of shape (n, {len(feature_names)}) in model feature order, got {data.shape}")
+    # Sin copia si ya es float32 contiguo; en otro caso una única conversión
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+def _read_arrow(body: bytes, feature_names: List[str]) -> np.ndarray:
+    """
+    Arrow IPC (stream o file): cada columna se ve sin copia como array NumPy y se
+    escribe una sola vez en la columna que le corresponde de la matriz del modelo
+    """
+    pa = _require("pyarrow", MEDIA_ARROW)
+    buffer = pa.py_buffer(body)
+    try:
+        table = pa.ipc.open_stream(buffer).read_all()
+    except pa.ArrowInvalid:
+        table = pa.ipc.open_file(buffer).read_all()
+
+    missing = [name for name in feature_names if name not in table.column_names]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+
+    features = np.empty((table.num_rows, len(feature_names)), dtype=np.float32)
+    for column, name in enumerate(feature_names):
+        values = table.column(name)
+        if values.null_count:
+            raise ValueError(f"Column {name} contains nulls")
+        offset = 0
+        for chunk in values.chunks:
+            features[offset:offset + len(chunk), column] = chunk.to_numpy(zero_copy_only=False)
+            offset += len(chunk)
+    return features
+
+
+def _read_msgpack(body: bytes, feature_names: List[str]) -> np.ndarray:
+    """
+    MessagePack columnar: un mapa nombre -> lista de números o bytes float32 little-endian
+    (estos últimos se mapean sin copia)
+    """
+    msgpack = _require("msgpack", MEDIA_MSGPACK)
+    columns = msgpack.unpackb(body, raw=False)
+    if not isinstance(columns, dict):
+        raise ValueError("Expected a map of feature name to column values")
+
+    missing = [name for name in feature_names if name not in columns]
+    if missing:
+        raise ValueError(f"Missing feature columns: {missing}")
+
+    arrays = [
+        np.frombuffer(values, dtype="<f4") if isinstance(values, bytes) else np.asarray(values, dtype=np.float32)
+        for values in (columns[name] for name in feature_names)
+    ]
+    n_rows = len(arrays[0])
+    if any(len(values) != n_rows for values in arrays):
+        raise ValueError("All feature columns must have the same length")
+
+    features = np.empty((n_rows, len(feature_names)), dtype=np.float32)
+    for column, values in enumerate(arrays):
+        features[:, column] = values
+    return features
+
+
+def decode_features(body: bytes, media_type: str, feature_names: List[str]) -> np.ndarray:
+    """
+    Matriz float32 (n, n_features) en el orden del modelo a partir de un cuerpo binario
+    """
+    readers = {MEDIA_NPY: _read_npy, MEDIA_ARROW: _read_arrow, MEDIA_MSGPACK: _read_msgpack}
+    if media_type not in readers:
+        raise UnsupportedFormatError(f"Unsupported Content-Type: {media_type}")
+    return readers[media_type](body, feature_names)
+
+
+def encode_results(probs_p1: np.ndarray, model_version: str, media_type: str) -> bytes:
+    """
+    Serializa prediction / probability_p1_wins / probability_p2_wins en el formato pedido:
+    .npy con un array estructurado, Arrow con una columna por campo (model_version en los
+    metadatos del schema) o MessagePack con cada columna como bytes little-endian (int8 / float32)
+    """
+    results = np.empty(len(probs_p1), dtype=RESULT_DTYPE)
+    results["probability_p1_wins"] = probs_p1
+    results["probability_p2_wins"] = 1.0 - results["probability_p1_wins"]
+    # Filas inválidas (probabilidad NaN): prediction = -1
+    results["prediction"] = np.where(
+        np.isnan(results["probability_p1_wins"]), -1,
+        results["probability_p2_wins"] > results["probability_p1_wins"]
+    )
+
+    if media_type == MEDIA_NPY:
+        output = io.BytesIO()
+        np.save(output, results, allow_pickle=False)
+        return output.getvalue()
+
+    if media_type == MEDIA_ARROW:
+        pa = _require("pyarrow", media_type)
+        table = pa.table(
+            {name: np.ascontiguousarray(results[name]) for name in RESULT_DTYPE.names},
+            metadata={"model_version": model_version or ""}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    if media_type == MEDIA_MSGPACK:
+        msgpack = _require("msgpack", media_type)
+        return msgpack.packb({
+            "model_version": model_version,
+            **{name: np.ascontiguousarray(results[name]).tobytes() for name in RESULT_DTYPE.names}
+        })
+
+    raise UnsupportedFormatError(f"Unsupported Accept type: {media_type}")
@@ -0,0 +1,83 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from app.models.predictor import XGBoostPredictor
+
+# Atributos de un perfil de jugador, en el orden de las columnas de la matriz de perfiles.
+# Cada característica p1_X / p2_X del modelo sale del atributo X del jugador correspondiente;
+# surface_wRate y tourney_wRate se resuelven antes según la superficie y el tipo de torneo.
+PLAYER_ATTRIBUTES = [
+    'age', 'ht', 'hand_encoded', 'rank', 'min_rank',
+    'pct_1stIn', 'pct_1stWon', 'pct_2ndWon', 'pct_SvPtsWon',
+    'pct_bpConv', 'pct_bpSaved', 'pct_1stRetPtsWon', 'pct_2ndRetPtsWon',
+    'recPerf', 'surface_wRate', 'tourney_wRate'
+]
+_ATTRIBUTE_INDEX = {name: column for column, name in enumerate(PLAYER_ATTRIBUTES)}
+
+
+def profile_matrix(players: List[dict], surface: Optional[str] = None, tourney_type: Optional[str] = None) -> np.ndarray:
+    """
+    Matriz (N, len(PLAYER_ATTRIBUTES)) con un perfil por fila. Las tasas por superficie y tipo
+    de torneo se toman de surface_wRates / tourney_wRates; si no hay dato valen 0, como en
+    el servicio base_de_datos.
+    """
+    surface_key = surface.lower() if surface else None
+    tourney_key = tourney_type.upper() if tourney_type else None
+
+    profiles = np.zeros((len(players), len(PLAYER_ATTRIBUTES)), dtype=np.float32)
+    for row, player in zip(profiles, players):
+        surface_rates = {key.lower(): value for key, value in (player.get('surface_wRates') or {}).items()}
+        tourney_rates = {key.upper(): value for key, value in (player.get('tourney_wRates') or {}).items()}
+        row[:-2] = [player[name] for name in PLAYER_ATTRIBUTES[:-2]]
+        row[-2] = surface_rates.get(surface_key) or 0.0
+        row[-1] = tourney_rates.get(tourney_key) or 0.0
+    return profiles
+
+
+def ordered_pairs(n_players: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Índices (i, j) de todos los pares ordenados con i != j
+    """
+    idx_i, idx_j = np.nonzero(~np.eye(n_players, dtype=bool))
+    return idx_i, idx_j
+
+
+def pair_features(profiles: np.ndarray, h2h: np.ndarray, feature_names: List[str],
+                  idx_i: np.ndarray, idx_j: np.ndarray) -> np.ndarray:
+    """
+    Matriz de características de todos los pares de una vez: el jugador i ocupa las
+    columnas p1_ y el jugador j las p2_. h2h[i, j] son las victorias de i sobre j.
+    """
+    features = np.empty((len(idx_i), len(feature_names)), dtype=np.float32)
+    for column, name in enumerate(feature_names):
+        side, attribute = name[:2], name[3:]
+        first, second = (idx_i, idx_j) if side == 'p1' else (idx_j, idx_i)
+        if attribute == 'h2h_won':
+            features[:, column] = h2h[first, second]
+        else:
+            features[:, column] = profiles[first, _ATTRIBUTE_INDEX[attribute]]
+    return features
+
+
+def win_probability_matrix(predictor: XGBoostPredictor, profiles: np.ndarray, h2h: Optional[np.ndarray] = None,
+                           reduced: bool = False) -> Tuple[np.ndarray, str]:
+    """
+    Matriz N×N con P(i gana a j) a partir de una sola llamada al modelo sobre los N·(N-1)
+    pares ordenados. El modelo no es exactamente simétrico respecto al orden p1/p2, así que
+    cada celda promedia ambas orientaciones: M[i, j] + M[j, i] = 1. La diagonal es NaN.
+    """
+    n_players = len(profiles)
+    if h2h is None:
+        h2h = np.zeros((n_players, n_players), dtype=np.float32)
+
+    feature_names = predictor.reduced_feature_names if reduced else predictor.feature_names
+    idx_i, idx_j = ordered_pairs(n_players)
+    features = pair_features(profiles, h2h, feature_names, idx_i, idx_j)
+    probs_p1, model_version = predictor.predict_probabilities(features, reduced=reduced)
+
+    # forward[i, j]: P(gana i) con i como p1
+    forward = np.zeros((n_players, n_players), dtype=np.float64)
+    forward[idx_i, idx_j] = probs_p1
+    matrix = (forward + (1.0 - forward.T)) / 2
+    np.fill_diagonal(matrix, np.nan)
+    return matrix, model_version
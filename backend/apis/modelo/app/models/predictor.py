@@ -1,23 +1,54 @@
-import pickle
+import asyncio
+import json
 import numpy as np
-import pandas as pd
-import xgboost as xgb
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Tuple
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from app.config import settings
+from app.logging_config import should_sample
+from app.metrics import STAGE_SECONDS, LABEL_FALLBACK_TOTAL, CASCADE_ANSWERS_TOTAL
+from app.models.cache import PredictionCache
+from app.models.serialization import load_model_file, model_version
+from app.models.tree_evaluator import TreeEnsembleEvaluator
+
+# xgboost (que arrastra sklearn/scipy) y pandas se importan en su primer uso: importar
+# la aplicación no los carga y el arranque no paga ~1 s antes de aceptar tráfico
+if TYPE_CHECKING:
+    import pandas as pd
+    import xgboost as xgb
+
 logger = logging.getLogger(__name__)
 
+class LoadedModel(NamedTuple):
+    """
+    Booster ya cargado junto con todo lo necesario para usarlo.
+    Se reemplaza con una sola asignación para que una petición en curso nunca vea un modelo a medio cargar.
+    """
+    booster: Any
+    objective: dict
+    metadata: dict
+    version: str
+    path: str
+    evaluator: Optional[TreeEnsembleEvaluator] = None  # Backend NumPy, si está activado
+    # Evaluador exportado en el proceso maestro (precarga) pendiente de verificar en cada worker
+    pending_evaluator: Optional[TreeEnsembleEvaluator] = None
+
 class XGBoostPredictor:
     """
     Clase para manejar las predicciones del modelo XGBoost
     """
     
-    def __init__(self, model_path: str = None, model_reduced_path: str = None):
-        self.model = None
-        self.model_reduced = None
-        self.model_version = "1.0.0"
+    def __init__(self, model_path: str = None, model_reduced_path: str = None,
+                 inference_workers: int = 1, nthread: int = None,
+                 cache_size: int = 0, cache_ttl_seconds: float = 300.0, cache_decimals: int = 6,
+                 backend: str = "xgboost", numpy_max_batch: int = 64):
+        # Modelos activos (completo y reducido); cada uno se sustituye de forma atómica
+        self._active: Optional[LoadedModel] = None
+        self._active_reduced: Optional[LoadedModel] = None
         self.feature_names = [
             'p1_age', 'p2_age', 'p1_ht', 'p2_ht', 'p1_hand_encoded', 'p2_hand_encoded',
             'p1_rank', 'p2_rank', 'p1_min_rank', 'p2_min_rank',
@@ -40,50 +71,161 @@ class XGBoostPredictor:
             'p1_pct_1stWon', 'p2_pct_1stWon'
         ]
         
+        # Pool de hilos dedicado a la inferencia y número de hilos de XGBoost por llamada
+        self.inference_workers = inference_workers
+        self.nthread = nthread
+        self._executor = None
+        
+        # Backend de inferencia: "xgboost" (DMatrix + booster.predict) o "numpy" (TreeEnsembleEvaluator)
+        self.backend = backend
+        # Por encima de este tamaño de lote XGBoost es más rápido que el evaluador NumPy
+        self.numpy_max_batch = numpy_max_batch
+        
+        # Caché de resultados por vector de características cuantizado
+        self.cache = PredictionCache(max_size=cache_size, ttl_seconds=cache_ttl_seconds)
+        self.cache_decimals = cache_decimals
+        
+        # Mapas nombre -> columna calculados una sola vez para el camino rápido con NumPy
+        self._feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        self._reduced_feature_index = {name: i for i, name in enumerate(self.reduced_feature_names)}
+        
         if model_path:
             self.load_model(model_path)
         if model_reduced_path:
             self.load_model_reduced(model_reduced_path)
     
-    def load_model(self, model_path: str) -> bool:
+    @property
+    def model(self):
+        return self._active.booster if self._active else None
+    
+    @property
+    def model_reduced(self):
+        return self._active_reduced.booster if self._active_reduced else None
+    
+    @property
+    def objective(self) -> Optional[dict]:
+        return self._active.objective if self._active else None
+    
+    @property
+    def objective_reduced(self) -> Optional[dict]:
+        return self._active_reduced.objective if self._active_reduced else None
+    
+    def get_active_model(self, reduced: bool = False) -> Optional[LoadedModel]:
+        """
+        Devuelve el modelo activo (booster, objetivo, metadatos, versión y ruta)
+        """
+        return self._active_reduced if reduced else self._active
+    
+    def load_model(self, model_path: str, verify_evaluator: bool = True) -> bool:
         """
-        Carga el modelo XGBoost desde un archivo pickle
+        Carga el modelo XGBoost desde un archivo pickle o en formato nativo (.ubj/.json)
         """
         try:
             if not os.path.exists(model_path):
                 logger.error(f"Model file not found: {model_path}")
                 return False
             
-            with open(model_path, 'rb') as f:
-                self.model = pickle.load(f)
-            
-            logger.info(f"Model loaded successfully from {model_path}")
+            self.reload_model(model_path, verify_evaluator=verify_evaluator)
             return True
             
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             return False
     
-    def load_model_reduced(self, model_path: str) -> bool:
+    def load_model_reduced(self, model_path: str, verify_evaluator: bool = True) -> bool:
         """
-        Carga el modelo XGBoost reducido desde un archivo pickle
+        Carga el modelo XGBoost reducido desde un archivo pickle o en formato nativo (.ubj/.json)
         """
         try:
             if not os.path.exists(model_path):
                 logger.error(f"Reduced model file not found: {model_path}")
                 return False
             
-            with open(model_path, 'rb') as f:
-                self.model_reduced = pickle.load(f)
-            
-            logger.info(f"Reduced model loaded successfully from {model_path}")
+            self.reload_model(model_path, reduced=True, verify_evaluator=verify_evaluator)
             return True
             
         except Exception as e:
             logger.error(f"Error loading reduced model: {str(e)}")
             return False
     
-    def prepare_features_reduced(self, input_data: dict) -> pd.DataFrame:
+    def reload_model(self, model_path: str, reduced: bool = False, verify_evaluator: bool = True) -> LoadedModel:
+        """
+        Carga completamente un modelo y solo entonces lo activa con una asignación atómica.
+        Si la carga falla, el modelo activo no cambia.
+        
+        Con verify_evaluator=False (precarga en el proceso maestro de gunicorn) el evaluador
+        NumPy solo se exporta: comprobarlo llama a booster.predict(), que arranca los hilos
+        de XGBoost/OpenMP antes del fork. Cada worker lo verifica con verify_pending_evaluators().
+        """
+        expected_features = self.reduced_feature_names if reduced else self.feature_names
+        
+        booster, metadata = load_model_file(model_path)
+        self._check_metadata(metadata, expected_features)
+        if hasattr(booster, 'num_features') and booster.num_features() != len(expected_features):
+            raise ValueError(
+                f"Model expects {booster.num_features()} features, the API provides {len(expected_features)}"
+            )
+        self._configure_threads(booster)
+        
+        evaluator = pending_evaluator = None
+        if self.backend == "numpy":
+            if verify_evaluator:
+                evaluator = self._build_evaluator(booster, expected_features)
+            else:
+                pending_evaluator = self._export_evaluator(booster)
+        
+        loaded = LoadedModel(
+            booster=booster,
+            objective=self._detect_objective(booster),
+            metadata=metadata,
+            version=model_version(model_path, metadata),
+            path=model_path,
+            evaluator=evaluator,
+            pending_evaluator=pending_evaluator
+        )
+        
+        if reduced:
+            self._active_reduced = loaded
+        else:
+            self._active = loaded
+        self.cache.clear()
+        
+        logger.info(f"{'Reduced model' if reduced else 'Model'} {loaded.version} loaded successfully from {model_path}")
+        return loaded
+    
+    def prepare_features_array(self, input_rows: List[dict], reduced: bool = False) -> np.ndarray:
+        """
+        Camino rápido: escribe las características directamente en una matriz float32
+        preasignada, en el orden que espera el modelo y sin construir un DataFrame
+        """
+        feature_index = self._reduced_feature_index if reduced else self._feature_index
+        features = np.zeros((len(input_rows), len(feature_index)), dtype=np.float32)
+        
+        try:
+            for row_number, input_data in enumerate(input_rows):
+                row = features[row_number]
+                for feature_name, column in feature_index.items():
+                    value = input_data.get(feature_name)
+                    if value is None:
+                        logger.warning("Missing %sfeature: %s", "reduced " if reduced else "", feature_name)
+                        continue  # Valor por defecto 0.0
+                    row[column] = value
+            return features
+            
+        except Exception as e:
+            logger.error(f"Error preparing feature array: {str(e)}")
+            raise ValueError(f"Error preparing feature array: {str(e)}")
+    
+    def _build_dmatrix(self, features: np.ndarray, reduced: bool = False) -> "xgb.DMatrix":
+        """
+        Construye la DMatrix a partir de la matriz NumPy con los nombres de columnas del modelo
+        """
+        import xgboost as xgb
+        
+        feature_names = self.reduced_feature_names if reduced else self.feature_names
+        return xgb.DMatrix(features, feature_names=feature_names)
+    
+    def prepare_features_reduced(self, input_data: dict) -> "pd.DataFrame":
         """
         Prepara las características reducidas para la predicción como DataFrame con nombres de columnas
         """
@@ -98,6 +240,7 @@ class XGBoostPredictor:
                     features_dict[feature_name] = 0.0  # Valor por defecto
             
             # Crear DataFrame con una sola fila y los nombres de columnas correctos
+            import pandas as pd
             df = pd.DataFrame([features_dict])
             return df
             
@@ -113,57 +256,17 @@ class XGBoostPredictor:
             raise ValueError("Reduced model not loaded. Please load a reduced model first.")
         
         try:
-            # Preparar características reducidas como DataFrame
-            features_df = self.prepare_features_reduced(input_data)
-            
-            # Convertir DataFrame a DMatrix para XGBoost
-            dmatrix = xgb.DMatrix(features_df)
+            result = self._predict_rows([input_data], reduced=True)[0]
             
-            # Realizar predicción usando DMatrix con el modelo reducido
-            prediction = self.model_reduced.predict(dmatrix)[0]
-            
-            # Para las probabilidades, algunos modelos XGBoost necesitan configuración especial
-            try:
-                prediction_proba = self.model_reduced.predict(dmatrix, output_margin=False)
-                if len(prediction_proba.shape) == 1:
-                    # Si es clasificación binaria, crear array de probabilidades
-                    prob_class_1 = prediction_proba[0]
-                    if prob_class_1 > 1:  # Si viene como logits, aplicar sigmoid
-                        prob_class_1 = 1 / (1 + np.exp(-prob_class_1))
-                    prob_p2_wins = float(prob_class_1)
-                    prob_p1_wins = 1.0 - prob_p2_wins
-                else:
-                    prediction_proba = prediction_proba[0]
-                    prob_p1_wins = float(prediction_proba[0])
-                    prob_p2_wins = float(prediction_proba[1])
-            except:
-                # Si no hay predict_proba, usar solo la predicción
-                if prediction == 0:
-                    prob_p1_wins = 0.7  # Asumimos cierta confianza
-                    prob_p2_wins = 0.3
-                else:
-                    prob_p1_wins = 0.3
-                    prob_p2_wins = 0.7
-            
-            # Calcular confianza (diferencia entre probabilidades)
-            confidence = abs(prob_p1_wins - prob_p2_wins)
-            
-            result = {
-                'prediction': int(prediction),
-                'probability_p1_wins': prob_p1_wins,
-                'probability_p2_wins': prob_p2_wins,
-                'confidence': confidence,
-                'model_version': self.model_version
-            }
-            
-            logger.info(f"Reduced prediction completed: {result}")
+            if should_sample("predict_reduced") and logger.isEnabledFor(logging.INFO):
+                logger.info("Reduced prediction completed", extra={"route": "predict_reduced", "result": result})
             return result
             
         except Exception as e:
             logger.error(f"Error making reduced prediction: {str(e)}")
             raise ValueError(f"Error making reduced prediction: {str(e)}")
 
-    def prepare_features(self, input_data: dict) -> pd.DataFrame:
+    def prepare_features(self, input_data: dict) -> "pd.DataFrame":
         """
         Prepara las características para la predicción como DataFrame con nombres de columnas
         """
@@ -178,6 +281,7 @@ class XGBoostPredictor:
                     features_dict[feature_name] = 0.0  # Valor por defecto
             
             # Crear DataFrame con una sola fila y los nombres de columnas correctos
+            import pandas as pd
             df = pd.DataFrame([features_dict])
             return df
             
@@ -193,55 +297,377 @@ class XGBoostPredictor:
             raise ValueError("Model not loaded. Please load a model first.")
         
         try:
-            # Preparar características como DataFrame con nombres de columnas
-            features_df = self.prepare_features(input_data)
+            result = self._predict_rows([input_data])[0]
             
-            # Convertir DataFrame a DMatrix para XGBoost
-            dmatrix = xgb.DMatrix(features_df)
+            if should_sample("predict") and logger.isEnabledFor(logging.INFO):
+                logger.info("Prediction completed", extra={"route": "predict", "result": result})
+            return result
             
-            # Realizar predicción usando DMatrix
-            prediction = self.model.predict(dmatrix)[0]
+        except Exception as e:
+            logger.error(f"Error making prediction: {str(e)}")
+            raise ValueError(f"Error making prediction: {str(e)}")
+
+    def predict_many(self, input_rows: List[dict], reduced: bool = False) -> List[dict]:
+        """
+        Realiza predicciones para varios partidos con una sola llamada al modelo XGBoost.
+        Los resultados se devuelven en el mismo orden que las filas de entrada.
+        """
+        if reduced and self.model_reduced is None:
+            raise ValueError("Reduced model not loaded. Please load a reduced model first.")
+        if not reduced and self.model is None:
+            raise ValueError("Model not loaded. Please load a model first.")
+        
+        if not input_rows:
+            return []
+        
+        try:
+            results = self._predict_rows(input_rows, reduced=reduced)
             
-            # Para las probabilidades, algunos modelos XGBoost necesitan configuración especial
-            try:
-                prediction_proba = self.model.predict(dmatrix, output_margin=False)
-                if len(prediction_proba.shape) == 1:
-                    # Si es clasificación binaria, crear array de probabilidades
-                    prob_class_1 = prediction_proba[0]
-                    if prob_class_1 > 1:  # Si viene como logits, aplicar sigmoid
-                        prob_class_1 = 1 / (1 + np.exp(-prob_class_1))
-                    prob_p2_wins = float(prob_class_1)
-                    prob_p1_wins = 1.0 - prob_p2_wins
-                else:
-                    prediction_proba = prediction_proba[0]
-                    prob_p1_wins = float(prediction_proba[0])
-                    prob_p2_wins = float(prediction_proba[1])
-            except:
-                # Si no hay predict_proba, usar solo la predicción
-                if prediction == 0:
-                    prob_p1_wins = 0.7  # Asumimos cierta confianza
-                    prob_p2_wins = 0.3
-                else:
-                    prob_p1_wins = 0.3
-                    prob_p2_wins = 0.7
+            if should_sample("predict_batch") and logger.isEnabledFor(logging.INFO):
+                logger.info("Batch prediction completed", extra={"route": "predict_batch", "matches": len(results)})
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error making batch prediction: {str(e)}")
+            raise ValueError(f"Error making batch prediction: {str(e)}")
+    
+    def predict_features(self, features: np.ndarray, reduced: bool = False) -> List[dict]:
+        """
+        Realiza predicciones a partir de una matriz float32 ya validada y en el orden
+        de características del modelo (ver app.models.decoder)
+        """
+        if reduced and self.model_reduced is None:
+            raise ValueError("Reduced model not loaded. Please load a reduced model first.")
+        if not reduced and self.model is None:
+            raise ValueError("Model not loaded. Please load a model first.")
+        
+        if len(features) == 0:
+            return []
+        
+        try:
+            results = self._predict_features(features, reduced=reduced)
+            
+            route = "predict_reduced" if reduced else "predict"
+            if should_sample(route) and logger.isEnabledFor(logging.INFO):
+                logger.info("Prediction completed", extra={"route": route, "matches": len(results), "result": results[0]})
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error making prediction from features: {str(e)}")
+            raise ValueError(f"Error making prediction from features: {str(e)}")
+    
+    def predict_cascade(self, input_rows: List[dict], threshold: float, use_full_model: bool = False) -> List[dict]:
+        """
+        Cascada de modelos: puntúa primero con el modelo reducido (16 características) y
+        solo pasa al completo las filas cuya confianza queda por debajo de `threshold`.
+        Con use_full_model=True las filas que traen las 34 características van directas al
+        modelo completo. Una fila sin todas las características completas nunca escala.
+        El campo 'model' de cada resultado indica qué modelo respondió.
+        """
+        if self.model_reduced is None:
+            raise ValueError("Reduced model not loaded. Please load a reduced model first.")
+        
+        if not input_rows:
+            return []
+        
+        try:
+            full_available = self.model is not None
+            has_full = [
+                full_available and all(row.get(name) is not None for name in self.feature_names)
+                for row in input_rows
+            ]
+            results = [None] * len(input_rows)
+            
+            full_indices = [i for i, complete in enumerate(has_full) if complete and use_full_model]
+            reduced_indices = [i for i in range(len(input_rows)) if not (has_full[i] and use_full_model)]
             
-            # Calcular confianza (diferencia entre probabilidades)
-            confidence = abs(prob_p1_wins - prob_p2_wins)
+            # Una llamada al modelo reducido para todas las filas que empiezan por él
+            if reduced_indices:
+                reduced_results = self._predict_rows([input_rows[i] for i in reduced_indices], reduced=True)
+                for i, result in zip(reduced_indices, reduced_results):
+                    if result['confidence'] < threshold and has_full[i]:
+                        full_indices.append(i)
+                    else:
+                        results[i] = result
             
-            result = {
-                'prediction': int(prediction),
+            # Y otra al modelo completo para las forzadas y las de baja confianza
+            if full_indices:
+                full_results = self._predict_rows([input_rows[i] for i in full_indices], reduced=False)
+                for i, result in zip(full_indices, full_results):
+                    results[i] = result
+            
+            escalated = len(full_indices)
+            CASCADE_ANSWERS_TOTAL.labels(model='full').inc(escalated)
+            CASCADE_ANSWERS_TOTAL.labels(model='reduced').inc(len(input_rows) - escalated)
+            if should_sample("predict_cascade") and logger.isEnabledFor(logging.INFO):
+                logger.info("Cascade prediction completed", extra={
+                    "route": "predict_cascade", "matches": len(results), "escalated": escalated
+                })
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error making cascade prediction: {str(e)}")
+            raise ValueError(f"Error making cascade prediction: {str(e)}")
+    
+    def _predict_rows(self, input_rows: List[dict], reduced: bool = False, use_cache: bool = True) -> List[dict]:
+        """
+        Prepara la matriz de características de los diccionarios de entrada y la puntúa
+        """
+        started = time.perf_counter()
+        features = self.prepare_features_array(input_rows, reduced=reduced)
+        STAGE_SECONDS.labels(stage='prepare_features', model='reduced' if reduced else 'full').observe(
+            time.perf_counter() - started
+        )
+        return self._predict_features(features, reduced=reduced, use_cache=use_cache)
+    
+    def _predict_features(self, features: np.ndarray, reduced: bool = False, use_cache: bool = True) -> List[dict]:
+        """
+        Puntúa todas las filas con una única llamada a predict y arma un resultado por fila.
+        Las filas ya presentes en la caché no pasan por XGBoost.
+        """
+        # Una sola lectura del modelo activo: un cambio de versión en paralelo no afecta a esta llamada
+        active = self.get_active_model(reduced)
+        if active is None:
+            raise ValueError(f"{'Reduced model' if reduced else 'Model'} not loaded.")
+        
+        n_rows = len(features)
+        results = [None] * n_rows
+        
+        cache_keys = None
+        if use_cache and self.cache.enabled:
+            cache_keys = self._cache_keys(features, reduced, active.version)
+            results = [self.cache.get(key) for key in cache_keys]
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        if len(missing) < n_rows:
+            features = features[missing]
+        
+        probs_p1, probs_p2 = self._score(active, features, reduced)
+        
+        for i, prob_p1_wins, prob_p2_wins in zip(missing, probs_p1.tolist(), probs_p2.tolist()):
+            results[i] = {
+                'prediction': int(prob_p2_wins > prob_p1_wins),
                 'probability_p1_wins': prob_p1_wins,
                 'probability_p2_wins': prob_p2_wins,
-                'confidence': confidence,
-                'model_version': self.model_version
+                # Calcular confianza (diferencia entre probabilidades)
+                'confidence': abs(prob_p1_wins - prob_p2_wins),
+                'model': 'reduced' if reduced else 'full',
+                'model_version': active.version
             }
-            
-            logger.info(f"Prediction completed: {result}")
-            return result
-            
+            if cache_keys is not None:
+                self.cache.put(cache_keys[i], results[i])
+        return results
+    
+    def _score(self, active: LoadedModel, features: np.ndarray, reduced: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Una sola inferencia (sin DMatrix con el backend NumPy) y conversión a probabilidades de cada jugador
+        """
+        model_name = 'reduced' if reduced else 'full'
+        if active.evaluator is not None and len(features) <= self.numpy_max_batch:
+            started = time.perf_counter()
+            raw_output = active.evaluator.predict(features)
+        else:
+            started = time.perf_counter()
+            dmatrix = self._build_dmatrix(features, reduced=reduced)
+            STAGE_SECONDS.labels(stage='dmatrix', model=model_name).observe(time.perf_counter() - started)
+            started = time.perf_counter()
+            raw_output = active.booster.predict(dmatrix)
+        STAGE_SECONDS.labels(stage='model_predict', model=model_name).observe(time.perf_counter() - started)
+        
+        if active.objective['output'] == 'label':
+            LABEL_FALLBACK_TOTAL.labels(model=model_name).inc(len(features))
+        return self._to_probabilities(raw_output, active.objective)
+    
+    def predict_probabilities(self, features: np.ndarray, reduced: bool = False) -> Tuple[np.ndarray, str]:
+        """
+        Probabilidad de que gane el jugador 1 para cada fila de la matriz, sin caché ni
+        diccionarios por fila (pensado para lotes grandes: matrices de enfrentamientos,
+        simulaciones). Devuelve también la versión del modelo que respondió.
+        """
+        active = self.get_active_model(reduced)
+        if active is None:
+            raise ValueError(f"{'Reduced model' if reduced else 'Model'} not loaded. Please load a model first.")
+        
+        if len(features) == 0:
+            return np.empty(0, dtype=np.float32), active.version
+        
+        probs_p1, _ = self._score(active, features, reduced)
+        return probs_p1, active.version
+    
+    def _cache_keys(self, features: np.ndarray, reduced: bool, model_version: str) -> List[tuple]:
+        """
+        Clave de caché por fila: modelo usado, versión y vector de características cuantizado
+        """
+        model_name = 'reduced' if reduced else 'full'
+        quantized = np.round(features, self.cache_decimals)
+        return [(model_name, model_version, row.tobytes()) for row in quantized]
+    
+    def _build_evaluator(self, booster, feature_names: List[str]) -> Optional[TreeEnsembleEvaluator]:
+        """
+        Exporta el booster al evaluador NumPy y comprueba que reproduce booster.predict();
+        si no es posible se sigue usando XGBoost para ese modelo
+        """
+        evaluator = self._export_evaluator(booster)
+        if evaluator is None:
+            return None
+        return self._verify_evaluator(evaluator, booster, feature_names)
+    
+    def _export_evaluator(self, booster) -> Optional[TreeEnsembleEvaluator]:
+        """
+        Exporta los árboles del booster al evaluador NumPy sin ejecutar ninguna predicción
+        """
+        try:
+            booster = booster.get_booster() if hasattr(booster, 'get_booster') else booster
+            return TreeEnsembleEvaluator(booster)
         except Exception as e:
-            logger.error(f"Error making prediction: {str(e)}")
-            raise ValueError(f"Error making prediction: {str(e)}")
+            logger.warning(f"NumPy backend unavailable, falling back to XGBoost: {str(e)}")
+            return None
+    
+    def _verify_evaluator(self, evaluator: TreeEnsembleEvaluator, booster,
+                          feature_names: List[str]) -> Optional[TreeEnsembleEvaluator]:
+        """
+        Devuelve el evaluador si reproduce booster.predict() sobre un corpus sintético, o None
+        """
+        try:
+            booster = booster.get_booster() if hasattr(booster, 'get_booster') else booster
+            error = evaluator.max_abs_error(booster, evaluator.synthetic_corpus(), feature_names)
+            if error > 1e-5:
+                raise ValueError(f"NumPy evaluator differs from XGBoost by {error}")
+            return evaluator
+        except Exception as e:
+            logger.warning(f"NumPy backend unavailable, falling back to XGBoost: {str(e)}")
+            return None
+    
+    def verify_pending_evaluators(self) -> None:
+        """
+        Verifica y activa los evaluadores NumPy exportados sin comprobar durante la precarga.
+        Se llama en cada worker después del fork; hasta entonces se puntúa con XGBoost.
+        """
+        for reduced in (False, True):
+            loaded = self.get_active_model(reduced)
+            if loaded is None or loaded.pending_evaluator is None:
+                continue
+            feature_names = self.reduced_feature_names if reduced else self.feature_names
+            verified = loaded._replace(
+                evaluator=self._verify_evaluator(loaded.pending_evaluator, loaded.booster, feature_names),
+                pending_evaluator=None
+            )
+            if reduced:
+                self._active_reduced = verified
+            else:
+                self._active = verified
+    
+    def _check_metadata(self, metadata: dict, expected_features: List[str]) -> None:
+        """
+        Avisa si los metadatos del modelo no coinciden con las características que usa el API
+        """
+        feature_names = metadata.get('feature_names')
+        if feature_names and feature_names != expected_features:
+            logger.warning(f"Model feature names do not match the expected features: {feature_names}")
+    
+    def _configure_threads(self, model) -> None:
+        """
+        Fija los hilos internos de XGBoost para no sobresuscribir núcleos con el pool de inferencia
+        """
+        if self.nthread:
+            booster = model.get_booster() if hasattr(model, 'get_booster') else model
+            booster.set_param({'nthread': self.nthread})
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Pool acotado donde se ejecuta la inferencia, fuera del event loop de asyncio
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.inference_workers,
+                thread_name_prefix="inference"
+            )
+        return self._executor
+    
+    async def run_inference(self, fn: Callable, *args) -> Any:
+        """
+        Ejecuta una llamada de inferencia en el pool dedicado sin bloquear el event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+    
+    def shutdown(self) -> None:
+        """
+        Libera el pool de inferencia (se vuelve a crear si se usa de nuevo)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _detect_objective(self, model) -> dict:
+        """
+        Lee la configuración del booster para saber qué devuelve predict():
+        - 'probability': probabilidades (binary:logistic, multi:softprob, ...)
+        - 'margin': logits sin transformar (binary:logitraw)
+        - 'label': clases sin probabilidades (binary:hinge, multi:softmax)
+        """
+        try:
+            booster = model.get_booster() if hasattr(model, 'get_booster') else model
+            learner = json.loads(booster.save_config())['learner']
+            name = learner['objective']['name']
+            num_class = int(learner['learner_model_param'].get('num_class', '0'))
+        except Exception as e:
+            logger.warning(f"Could not read model objective, assuming binary probabilities: {str(e)}")
+            name, num_class = 'binary:logistic', 0
+        
+        if name in ('binary:hinge', 'multi:softmax'):
+            output = 'label'
+        elif name == 'binary:logitraw':
+            output = 'margin'
+        else:
+            output = 'probability'
+        
+        objective = {'name': name, 'output': output, 'multiclass': num_class > 1}
+        logger.info(f"Model objective detected: {objective}")
+        return objective
+    
+    def _to_probabilities(self, raw_output: np.ndarray, objective: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convierte la salida única del modelo en (probabilidad gana p1, probabilidad gana p2)
+        """
+        raw_output = np.asarray(raw_output, dtype=np.float64)
+        
+        if objective['output'] == 'label':
+            # El modelo solo devuelve la clase: asumimos cierta confianza
+            prob_p2_wins = np.where(raw_output.reshape(-1) == 0, 0.3, 0.7)
+        elif objective['multiclass'] or raw_output.ndim == 2:
+            return raw_output[:, 0], raw_output[:, 1]
+        elif objective['output'] == 'margin':
+            # Logits: aplicar sigmoid
+            prob_p2_wins = 1 / (1 + np.exp(-raw_output))
+        else:
+            # Clasificación binaria: la salida es la probabilidad de la clase 1
+            prob_p2_wins = raw_output
+        
+        return 1.0 - prob_p2_wins, prob_p2_wins
+
+    def warm_up(self, iterations: int = 3) -> dict:
+        """
+        Ejecuta predicciones sintéticas con los modelos cargados para que la primera
+        petición real no pague la inicialización de XGBoost. Devuelve la latencia en ms.
+        """
+        latencies = {}
+        for reduced, model in ((False, self.model), (True, self.model_reduced)):
+            if model is None:
+                continue
+            feature_names = self.reduced_feature_names if reduced else self.feature_names
+            synthetic_row = {name: 0.0 for name in feature_names}
+            
+            start = time.perf_counter()
+            for _ in range(iterations):
+                self._predict_rows([synthetic_row], reduced=reduced, use_cache=False)
+            latencies['reduced' if reduced else 'full'] = (time.perf_counter() - start) * 1000 / max(iterations, 1)
+        
+        logger.info(f"Warm-up completed: {latencies}")
+        return latencies
     
     def is_model_loaded(self) -> bool:
         """
@@ -262,7 +688,15 @@ class XGBoostPredictor:
         return self.feature_names.copy()
 
 # Instancia global del predictor
-predictor = XGBoostPredictor()
+predictor = XGBoostPredictor(
+    inference_workers=settings.INFERENCE_WORKERS,
+    nthread=settings.XGBOOST_NTHREAD,
+    cache_size=settings.PREDICTION_CACHE_SIZE,
+    cache_ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+    cache_decimals=settings.PREDICTION_CACHE_DECIMALS,
+    backend=settings.INFERENCE_BACKEND,
+    numpy_max_batch=settings.NUMPY_BACKEND_MAX_BATCH
+)
 
 def get_predictor() -> XGBoostPredictor:
     """
@@ -0,0 +1,73 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import List
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor, get_predictor
+from app.models.serialization import metadata_path, model_version
+
+logger = logging.getLogger(__name__)
+
+MODEL_EXTENSIONS = ('.pkl', '.ubj', '.json')
+
+class ModelRegistry:
+    """
+    Registro de los modelos disponibles en el directorio de modelos.
+    Permite cambiar el modelo activo (completo o reducido) sin reiniciar el servicio.
+    """
+
+    def __init__(self, predictor: XGBoostPredictor, models_dir: str):
+        self.predictor = predictor
+        self.models_dir = Path(models_dir)
+        # Serializa las activaciones; las predicciones nunca esperan por este lock
+        self._lock = threading.Lock()
+
+    def list_models(self) -> List[dict]:
+        """
+        Lista los archivos de modelo del directorio con su versión y si están activos
+        """
+        active_paths = {}
+        for target, reduced in (("full", False), ("reduced", True)):
+            active = self.predictor.get_active_model(reduced)
+            if active is not None:
+                active_paths[Path(active.path).resolve()] = target
+
+        models = []
+        if not self.models_dir.is_dir():
+            return models
+        for path in sorted(self.models_dir.iterdir()):
+            if path.suffix.lower() not in MODEL_EXTENSIONS or path.name.endswith('.meta.json'):
+                continue
+            meta_file = metadata_path(str(path))
+            metadata = json.loads(meta_file.read_text()) if meta_file.exists() else {}
+            models.append({
+                "name": path.name,
+                "version": model_version(str(path), metadata),
+                "active_as": active_paths.get(path.resolve()),
+            })
+        return models
+
+    def activate(self, name: str, reduced: bool = False) -> dict:
+        """
+        Carga el modelo `name` del directorio y lo activa como modelo completo o reducido
+        """
+        path = self.models_dir / name
+        if path.name != name or path.suffix.lower() not in MODEL_EXTENSIONS or not path.is_file():
+            raise ValueError(f"Model '{name}' not found in {self.models_dir}")
+
+        with self._lock:
+            loaded = self.predictor.reload_model(str(path), reduced=reduced)
+
+        logger.info(f"Activated model {name} (version {loaded.version}) as {'reduced' if reduced else 'full'}")
+        return {"name": name, "version": loaded.version, "target": "reduced" if reduced else "full"}
+
+# Instancia global del registro
+registry = ModelRegistry(get_predictor(), settings.MODELS_DIR)
+
+def get_registry() -> ModelRegistry:
+    """
+    Factory function para obtener el registro de modelos
+    """
+    return registry
@@ -0,0 +1,133 @@
+# Carga y conversión de modelos XGBoost entre pickle y el formato nativo (UBJSON/JSON)
+#
+# Conversión única de los pickles existentes (desde backend/apis/modelo):
+#   python -m app.models.serialization AI_models/modelo_xgb2.pkl AI_models/modelo_reduced_xgb2.pkl --model-version 2.0.0
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# xgboost se importa al cargar el primer modelo, no al importar la aplicación
+if TYPE_CHECKING:
+    import xgboost as xgb
+
+logger = logging.getLogger(__name__)
+
+NATIVE_EXTENSIONS = ('.ubj', '.json')
+
+
+def is_native_format(model_path: str) -> bool:
+    """
+    Indica si la ruta apunta a un modelo en formato nativo de XGBoost
+    """
+    return Path(model_path).suffix.lower() in NATIVE_EXTENSIONS
+
+
+def metadata_path(model_path: str) -> Path:
+    """
+    Ruta del archivo de metadatos que acompaña a un modelo nativo (<nombre>.meta.json)
+    """
+    path = Path(model_path)
+    return path.with_name(f"{path.stem}.meta.json")
+
+
+@lru_cache(maxsize=32)
+def _content_hash(model_path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-256 (12 primeros caracteres) del archivo; mtime y tamaño forman parte de la clave
+    de la caché para recalcularlo si el archivo se sobrescribe
+    """
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def model_version(model_path: str, metadata: dict) -> str:
+    """
+    Versión de un modelo: la de sus metadatos o, si no tiene, <archivo>-<hash del contenido>.
+    Dos modelos distintos nunca comparten versión, y la caché de predicciones y el campo
+    model_version de las respuestas se basan en ella.
+    """
+    if metadata.get('model_version'):
+        return str(metadata['model_version'])
+    stat = os.stat(model_path)
+    return f"{Path(model_path).name}-{_content_hash(str(Path(model_path).resolve()), stat.st_mtime_ns, stat.st_size)}"
+
+
+def load_model_file(model_path: str) -> Tuple["xgb.Booster", dict]:
+    """
+    Carga un booster desde un pickle o desde el formato nativo y devuelve (booster, metadatos).
+    Si no existe <nombre>.meta.json los metadatos son un diccionario vacío.
+    """
+    import xgboost as xgb
+    
+    if is_native_format(model_path):
+        booster = xgb.Booster()
+        booster.load_model(model_path)
+    else:
+        with open(model_path, 'rb') as f:
+            booster = pickle.load(f)
+
+    metadata = {}
+    meta_file = metadata_path(model_path)
+    if meta_file.exists():
+        metadata = json.loads(meta_file.read_text())
+    return booster, metadata
+
+
+def convert_pickle_to_native(pickle_path: str, output_path: Optional[str] = None, *,
+                             model_version: str) -> str:
+    """
+    Convierte un modelo pickle a formato nativo (por defecto .ubj junto al pickle) y
+    guarda sus nombres de características, objetivo y versión en <nombre>.meta.json.
+    La versión es obligatoria: identifica el modelo en las respuestas y en la caché.
+    """
+    if not model_version:
+        raise ValueError("A model version is required")
+    import xgboost as xgb
+    
+    with open(pickle_path, 'rb') as f:
+        model = pickle.load(f)
+    booster = model.get_booster() if hasattr(model, 'get_booster') else model
+
+    output_path = output_path or str(Path(pickle_path).with_suffix('.ubj'))
+    booster.save_model(output_path)
+
+    learner = json.loads(booster.save_config())['learner']
+    metadata = {
+        'feature_names': booster.feature_names,
+        'objective': learner['objective']['name'],
+        'num_class': int(learner['learner_model_param'].get('num_class', '0')),
+        'model_version': model_version,
+        'xgboost_version': xgb.__version__,
+        'source': os.path.basename(pickle_path),
+    }
+    metadata_path(output_path).write_text(json.dumps(metadata, indent=2))
+
+    logger.info(f"Converted {pickle_path} -> {output_path}")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert pickled XGBoost models to the native format")
+    parser.add_argument("pickles", nargs="+", help="Pickle files to convert")
+    parser.add_argument("--format", choices=["ubj", "json"], default="ubj")
+    parser.add_argument("--model-version", required=True,
+                        help="Unique version of each converted model (e.g. 2.1.0 or 2026-10-18)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for pickle_path in args.pickles:
+        output_path = str(Path(pickle_path).with_suffix(f".{args.format}"))
+        convert_pickle_to_native(pickle_path, output_path, model_version=args.model_version)
+
+
+if __name__ == "__main__":
+    main()
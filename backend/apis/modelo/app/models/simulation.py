@@ -0,0 +1,79 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from app.models.pairwise import win_probability_matrix
+from app.models.predictor import XGBoostPredictor
+
+# Filas por bloque de simulación: acota la memoria (bloque × plazas del cuadro en int16)
+SIMULATION_CHUNK_SIZE = 50_000
+
+
+def round_names(draw_size: int) -> List[str]:
+    """
+    Nombre de cada ronda que se puede alcanzar tras ganar un partido, de la segunda ronda
+    al título: un cuadro de 32 da ["R16", "QF", "SF", "F", "W"]
+    """
+    names = []
+    remaining = draw_size // 2
+    while remaining >= 1:
+        names.append({1: "W", 2: "F", 4: "SF", 8: "QF"}.get(remaining, f"R{remaining}"))
+        remaining //= 2
+    return names
+
+
+def probability_table(matrix: np.ndarray) -> np.ndarray:
+    """
+    Tabla float32 (N+1)×(N+1) para el simulador a partir de la matriz de enfrentamientos:
+    el índice N representa un bye, que siempre pierde frente a un jugador real
+    """
+    n_players = len(matrix)
+    table = np.full((n_players + 1, n_players + 1), 0.5, dtype=np.float32)
+    table[:n_players, :n_players] = np.nan_to_num(matrix, nan=0.5)
+    table[:n_players, n_players] = 1.0
+    table[n_players, :n_players] = 0.0
+    return table
+
+
+def simulate_draw(table: np.ndarray, slots: np.ndarray, n_simulations: int,
+                  seed: Optional[int] = None, chunk_size: int = SIMULATION_CHUNK_SIZE) -> np.ndarray:
+    """
+    Monte Carlo vectorizado del cuadro. `slots` es el cuadro en orden (índices de jugador;
+    el índice N = len(table) - 1 es un bye) y table[i, j] = P(i gana a j).
+
+    Cada ronda resuelve a la vez todos los partidos de todas las simulaciones del bloque
+    con una búsqueda en la tabla y un número aleatorio por partido; no hay inferencia
+    ni bucles de Python por partido.
+
+    Devuelve una matriz (N, rondas) con la probabilidad de que cada jugador alcance
+    cada ronda de round_names(len(slots)).
+    """
+    n_players = len(table) - 1
+    n_rounds = int(np.log2(len(slots)))
+    reached = np.zeros((n_rounds, n_players + 1), dtype=np.int64)
+    rng = np.random.default_rng(seed)
+
+    done = 0
+    while done < n_simulations:
+        size = min(chunk_size, n_simulations - done)
+        alive = np.broadcast_to(slots.astype(np.int16), (size, len(slots)))
+        for round_number in range(n_rounds):
+            first, second = alive[:, 0::2], alive[:, 1::2]
+            first_wins = rng.random(first.shape, dtype=np.float32) < table[first, second]
+            alive = np.where(first_wins, first, second)
+            reached[round_number] += np.bincount(alive.ravel(), minlength=n_players + 1)
+        done += size
+
+    # Se descarta la columna del bye
+    return (reached[:, :n_players] / n_simulations).T
+
+
+def run_draw_simulation(predictor: XGBoostPredictor, profiles: np.ndarray, h2h: Optional[np.ndarray],
+                        slots: np.ndarray, n_simulations: int, seed: Optional[int] = None,
+                        reduced: bool = False) -> Tuple[np.ndarray, str]:
+    """
+    Precalcula todos los enfrentamientos posibles con una sola llamada al modelo y
+    simula el cuadro sobre esa tabla. Devuelve (probabilidades por ronda, versión del modelo).
+    """
+    matrix, model_version = win_probability_matrix(predictor, profiles, h2h, reduced=reduced)
+    reach = simulate_draw(probability_table(matrix), slots, n_simulations, seed=seed)
+    return reach, model_version
@@ -0,0 +1,80 @@
+# Endpoints de administración de modelos
+from fastapi import APIRouter, Header, HTTPException, status
+import hmac
+import logging
+
+from app.schemas.admin import ModelActivationInput, AdminResponse
+from app.models.predictor import get_predictor
+from app.models.registry import get_registry
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+def check_admin_token(token: str) -> None:
+    """
+    Valida el token de administración; sin ADMIN_TOKEN configurado los endpoints quedan deshabilitados
+    """
+    if not settings.ADMIN_TOKEN or not hmac.compare_digest(token or "", settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+@router.get("/models", response_model=AdminResponse)
+async def list_models(x_admin_token: str = Header(default="")):
+    """
+    Lista los modelos del registro y cuál está activo como modelo completo y reducido
+    """
+    check_admin_token(x_admin_token)
+    return AdminResponse(
+        success=True,
+        message="Models listed successfully",
+        data=get_registry().list_models()
+    )
+
+@router.post("/models/activate", response_model=AdminResponse)
+async def activate_model(activation: ModelActivationInput, x_admin_token: str = Header(default="")):
+    """
+    Carga un modelo del registro y lo activa sin reiniciar el servicio.
+    Las peticiones en curso terminan con el modelo anterior.
+
+    La activación solo cambia el modelo del proceso que atiende la petición, así que
+    solo se permite con un único worker (WEB_CONCURRENCY=1); con varios se responde 409
+    y el cambio de modelo se hace con MODEL_PATH / MODEL_REDUCED_PATH y un reinicio.
+    """
+    check_admin_token(x_admin_token)
+    if settings.WEB_CONCURRENCY > 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Model activation is only supported with a single worker (WEB_CONCURRENCY={settings.WEB_CONCURRENCY}): "
+                "it would only change the model of the worker handling this request. "
+                "Set MODEL_PATH/MODEL_REDUCED_PATH and restart the service instead."
+            )
+        )
+    try:
+        predictor = get_predictor()
+        # La carga se hace en el pool de inferencia para no bloquear el event loop
+        activated = await predictor.run_inference(
+            get_registry().activate, activation.name, activation.target == "reduced"
+        )
+        return AdminResponse(
+            success=True,
+            message="Model activated successfully",
+            data=activated
+        )
+
+    except ValueError as ve:
+        logger.error(f"Validation error activating model: {str(ve)}")
+        return AdminResponse(
+            success=False,
+            message="Validation error",
+            error=str(ve)
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected error activating model: {str(e)}")
+        return AdminResponse(
+            success=False,
+            message="Internal server error",
+            error="An unexpected error occurred while activating the model"
+        )
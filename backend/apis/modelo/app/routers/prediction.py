@@ -1,124 +1,636 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+import json
 import logging
+import numpy as np
+import time
+from typing import Literal
 
-from app.schemas.prediction import MatchPredictionInput, MatchPredictionInputReduced, MatchPredictionOutput, PredictionResponse
+from app.schemas.prediction import (
+    MatchPredictionInput, MatchPredictionInputReduced, MatchPredictionInputCascade, MatchPredictionOutput, PredictionResponse,
+    BatchPredictionInput, BatchPredictionItem, BatchPredictionResponse,
+    PairwiseMatrixInput, PairwiseMatrixOutput, PairwiseMatrixResponse,
+    DrawSimulationInput, DrawPlayerResult, DrawSimulationOutput, DrawSimulationResponse
+)
 from app.models.predictor import get_predictor
+from app.models.batcher import get_batcher
+from app.models.decoder import get_decoder
+from app.models.formats import (
+    MEDIA_JSON, BINARY_MEDIA_TYPES, UnsupportedFormatError,
+    decode_features, encode_results, negotiate_response_type, normalize_media_type
+)
+from app.models.pairwise import profile_matrix, win_probability_matrix
+from app.models.simulation import round_names, run_draw_simulation
+from app.startup import wait_for_models
 from app.config import settings
+from app.metrics import STAGE_SECONDS, ERRORS_TOTAL, LAZY_MODEL_LOADS_TOTAL, route_label
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.post("/predict", response_model=PredictionResponse)
-async def predict_match_outcome(match_data: MatchPredictionInput):
+def _start_handler(request: Request, model: str) -> None:
+    """
+    Anota el modelo que atiende la petición para las métricas de serialización del middleware
+    (la validación del cuerpo se mide dentro del handler, en la etapa prepare_features)
+    """
+    request.scope.setdefault("state", {})["model"] = model
+
+def _finish_handler(request: Request, response):
+    """
+    Marca el fin del handler (inicio de la serialización) y cuenta las respuestas con error
+    """
+    if not getattr(response, "success", True):
+        ERRORS_TOTAL.labels(route=route_label(request.scope)).inc()
+    request.scope.setdefault("state", {})["handler_done"] = time.perf_counter()
+    return response
+
+async def _decode_body(request: Request, reduced: bool = False) -> np.ndarray:
+    """
+    Valida el cuerpo JSON con el decodificador del modelo y devuelve la matriz float32 (1, n_features).
+    Los errores se devuelven como el 422 estándar de FastAPI.
+    """
+    body = await request.body()
+    if not body:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error",
+            "input": {}, "ctx": {"error": e.msg}
+        }])
+
+    started = time.perf_counter()
+    try:
+        features = get_decoder(reduced).decode(payload)
+    except ValidationError as ve:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in ve.errors(include_url=False)
+        ])
+    STAGE_SECONDS.labels(stage="prepare_features", model="reduced" if reduced else "full").observe(
+        time.perf_counter() - started
+    )
+    return features
+
+def _request_body_schema(schema) -> dict:
+    """
+    Documenta en OpenAPI el cuerpo que el handler decodifica manualmente
+    """
+    return {"requestBody": {"content": {"application/json": {"schema": schema.model_json_schema()}}, "required": True}}
+
+@router.post("/predict", response_model=PredictionResponse, openapi_extra=_request_body_schema(MatchPredictionInput))
+async def predict_match_outcome(request: Request):
     """
     Predice el resultado de un partido de tenis usando el modelo XGBoost
     
     Parameters:
-    - match_data: Datos del partido incluyendo estadísticas de ambos jugadores
+    - Cuerpo JSON con los campos de MatchPredictionInput: datos del partido incluyendo
+      estadísticas de ambos jugadores. Se valida y se escribe directamente en la matriz
+      de características del modelo (app.models.decoder).
     
     Returns:
     - PredictionResponse: Resultado de la predicción con probabilidades
     """
+    _start_handler(request, "full")
+    features = await _decode_body(request)
     try:
         # Obtener instancia del predictor
         predictor = get_predictor()
+        await wait_for_models()
         
         # Si el modelo no está cargado, intentar cargarlo automáticamente
         if not predictor.is_model_loaded():
             logger.info(f"Model not loaded, attempting to load from {settings.MODEL_PATH}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="full").inc()
             if not predictor.load_model(settings.MODEL_PATH):
-                return PredictionResponse(
+                return _finish_handler(request, PredictionResponse(
                     success=False,
                     message="Model could not be loaded",
                     error=f"Failed to load model from {settings.MODEL_PATH}. Please check if the file exists."
-                )
-        
-        # Convertir datos de entrada a diccionario
-        input_dict = match_data.dict()
+                ))
         
-        # Realizar predicción
-        prediction_result = predictor.predict(input_dict)
+        # Realizar predicción en el pool de inferencia, fuera del event loop
+        if settings.MICROBATCH_ENABLED:
+            prediction_result = await get_batcher().submit(features[0])
+        else:
+            prediction_result = (await predictor.run_inference(predictor.predict_features, features))[0]
         
         # Crear objeto de respuesta
         prediction_output = MatchPredictionOutput(**prediction_result)
         
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=True,
             message="Prediction completed successfully",
             data=prediction_output
-        )
+        ))
         
     except ValueError as ve:
         logger.error(f"Validation error: {str(ve)}")
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=False,
             message="Validation error",
             error=str(ve)
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Unexpected error in prediction: {str(e)}")
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=False,
             message="Internal server error",
             error="An unexpected error occurred during prediction"
-        )
+        ))
 
-@router.post("/predict-reduced", response_model=PredictionResponse)
-async def predict_match_outcome_reduced(match_data: MatchPredictionInputReduced):
+@router.post(
+    "/predict-reduced", response_model=PredictionResponse,
+    openapi_extra=_request_body_schema(MatchPredictionInputReduced)
+)
+async def predict_match_outcome_reduced(request: Request):
     """
     Predice el resultado de un partido de tenis usando características reducidas
     
     Parameters:
-    - match_data: Datos del partido con solo las características más importantes
+    - Cuerpo JSON con los campos de MatchPredictionInputReduced: datos del partido con
+      solo las características más importantes
     
     Returns:
     - PredictionResponse: Resultado de la predicción con probabilidades
     """
+    _start_handler(request, "reduced")
+    features = await _decode_body(request, reduced=True)
     try:
         # Obtener instancia del predictor
         predictor = get_predictor()
+        await wait_for_models()
         
         # Si el modelo reducido no está cargado, intentar cargarlo automáticamente
         if not predictor.is_model_reduced_loaded():
             logger.info(f"Reduced model not loaded, attempting to load from {settings.MODEL_REDUCED_PATH}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="reduced").inc()
             if not predictor.load_model_reduced(settings.MODEL_REDUCED_PATH):
-                return PredictionResponse(
+                return _finish_handler(request, PredictionResponse(
                     success=False,
                     message="Reduced model could not be loaded",
                     error=f"Failed to load reduced model from {settings.MODEL_REDUCED_PATH}. Please check if the file exists."
-                )
-        
-        # Convertir datos de entrada a diccionario
-        input_dict = match_data.dict()
+                ))
         
         # Realizar predicción con características reducidas
-        prediction_result = predictor.predict_reduced(input_dict)
+        if settings.MICROBATCH_ENABLED:
+            prediction_result = await get_batcher(reduced=True).submit(features[0])
+        else:
+            prediction_result = (await predictor.run_inference(predictor.predict_features, features, True))[0]
         
         # Crear objeto de respuesta
         prediction_output = MatchPredictionOutput(**prediction_result)
         
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=True,
             message="Reduced prediction completed successfully",
             data=prediction_output
-        )
+        ))
         
     except ValueError as ve:
         logger.error(f"Validation error in reduced prediction: {str(ve)}")
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=False,
             message="Validation error",
             error=str(ve)
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Unexpected error in reduced prediction: {str(e)}")
-        return PredictionResponse(
+        return _finish_handler(request, PredictionResponse(
             success=False,
             message="Internal server error",
             error="An unexpected error occurred during reduced prediction"
-        )
\ No newline at end of file
+        ))
+
+@router.post("/predict/cascade", response_model=PredictionResponse)
+async def predict_match_outcome_cascade(match_data: MatchPredictionInputCascade, request: Request):
+    """
+    Predice con la cascada de modelos: responde el modelo reducido y solo se consulta el
+    completo cuando su confianza queda por debajo del umbral (o si se pide explícitamente)
+    
+    Parameters:
+    - match_data: Características reducidas obligatorias; el resto son opcionales y solo
+      se usan si vienen todas. use_full_model y confidence_threshold controlan la cascada.
+    
+    Returns:
+    - PredictionResponse: Resultado de la predicción; data.model indica qué modelo respondió
+    """
+    _start_handler(request, "reduced")
+    try:
+        # Obtener instancia del predictor
+        predictor = get_predictor()
+        await wait_for_models()
+        
+        # Si los modelos no están cargados, intentar cargarlos automáticamente. Sin el
+        # modelo completo la cascada sigue funcionando, solo que nunca escala.
+        if not predictor.is_model_reduced_loaded():
+            logger.info(f"Reduced model not loaded, attempting to load from {settings.MODEL_REDUCED_PATH}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="reduced").inc()
+            if not predictor.load_model_reduced(settings.MODEL_REDUCED_PATH):
+                return _finish_handler(request, PredictionResponse(
+                    success=False,
+                    message="Reduced model could not be loaded",
+                    error=f"Failed to load reduced model from {settings.MODEL_REDUCED_PATH}. Please check if the file exists."
+                ))
+        if not predictor.is_model_loaded():
+            logger.info(f"Model not loaded, attempting to load from {settings.MODEL_PATH}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="full").inc()
+            predictor.load_model(settings.MODEL_PATH)
+        
+        threshold = match_data.confidence_threshold
+        if threshold is None:
+            threshold = settings.CASCADE_CONFIDENCE_THRESHOLD
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("confidence_threshold must be between 0 and 1")
+        
+        input_dict = match_data.model_dump(exclude={"use_full_model", "confidence_threshold"})
+        
+        # Realizar predicción en cascada en el pool de inferencia
+        prediction_result = (await predictor.run_inference(
+            predictor.predict_cascade, [input_dict], threshold, match_data.use_full_model
+        ))[0]
+        
+        return _finish_handler(request, PredictionResponse(
+            success=True,
+            message=f"Cascade prediction completed successfully by the {prediction_result['model']} model",
+            data=MatchPredictionOutput(**prediction_result)
+        ))
+        
+    except ValueError as ve:
+        logger.error(f"Validation error in cascade prediction: {str(ve)}")
+        return _finish_handler(request, PredictionResponse(
+            success=False,
+            message="Validation error",
+            error=str(ve)
+        ))
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in cascade prediction: {str(e)}")
+        return _finish_handler(request, PredictionResponse(
+            success=False,
+            message="Internal server error",
+            error="An unexpected error occurred during cascade prediction"
+        ))
+
+def _batch_openapi() -> dict:
+    """
+    Cuerpo de /predict/batch en OpenAPI: JSON o uno de los formatos binarios/columnares
+    """
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    return {"requestBody": {"required": True, "content": {
+        MEDIA_JSON: {"schema": BatchPredictionInput.model_json_schema()},
+        **{media_type: binary for media_type in BINARY_MEDIA_TYPES}
+    }}}
+
+@router.post("/predict/batch", response_model=BatchPredictionResponse, openapi_extra=_batch_openapi())
+async def predict_match_outcome_batch(request: Request):
+    """
+    Predice el resultado de varios partidos con una sola llamada al modelo XGBoost
+    
+    Parameters:
+    - Cuerpo según Content-Type:
+      - application/json: BatchPredictionInput, lista de partidos con los campos de MatchPredictionInput
+      - application/x-npy: matriz (n, 34) en el orden de feature_names o array estructurado con un campo por característica
+      - application/vnd.apache.arrow.stream: tabla Arrow IPC con una columna por característica
+      - application/msgpack: mapa característica -> lista de valores o bytes float32 little-endian
+    - Accept: application/json (por defecto) o uno de los formatos binarios para la respuesta
+    
+    Returns:
+    - BatchPredictionResponse: Un resultado por partido, en el mismo orden de entrada.
+      Las filas inválidas devuelven su propio error sin afectar al resto del lote.
+    - Con Accept binario: columnas prediction / probability_p1_wins / probability_p2_wins
+      (las filas inválidas llevan prediction = -1 y probabilidades NaN) y la versión
+      del modelo en la cabecera X-Model-Version
+    """
+    _start_handler(request, "full")
+    
+    content_type_header = request.headers.get("content-type")
+    content_type = normalize_media_type(content_type_header) if content_type_header else MEDIA_JSON
+    if content_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported Content-Type: {content_type_header}"
+        )
+    response_type = negotiate_response_type(request.headers.get("accept"))
+    
+    body = await request.body()
+    batch_data = None
+    if content_type == MEDIA_JSON:
+        try:
+            batch_data = BatchPredictionInput.model_validate_json(body)
+        except ValidationError as ve:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])} for error in ve.errors(include_url=False)
+            ])
+    
+    try:
+        # Obtener instancia del predictor
+        predictor = get_predictor()
+        await wait_for_models()
+        
+        # Si el modelo no está cargado, intentar cargarlo automáticamente
+        if not predictor.is_model_loaded():
+            logger.info(f"Model not loaded, attempting to load from {settings.MODEL_PATH}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="full").inc()
+            if not predictor.load_model(settings.MODEL_PATH):
+                return _finish_handler(request, BatchPredictionResponse(
+                    success=False,
+                    message="Model could not be loaded",
+                    error=f"Failed to load model from {settings.MODEL_PATH}. Please check if the file exists."
+                ))
+        
+        started = time.perf_counter()
+        if batch_data is not None:
+            # Validar cada fila por separado directamente sobre la matriz de características;
+            # las inválidas se reportan individualmente
+            n_rows = len(batch_data.matches)
+            features, valid_indices, errors = get_decoder().decode_many(batch_data.matches)
+        else:
+            # Cuerpo binario: columnas mapeadas al orden de feature_names, fuera del event loop
+            features = await predictor.run_inference(decode_features, body, content_type, predictor.feature_names)
+            n_rows = len(features)
+            valid_indices, errors = range(n_rows), []
+        STAGE_SECONDS.labels(stage="prepare_features", model="full").observe(time.perf_counter() - started)
+        
+        if response_type != MEDIA_JSON:
+            # Respuesta binaria: solo probabilidades, sin un diccionario por fila
+            probs_p1, model_version = await predictor.run_inference(predictor.predict_probabilities, features)
+            if len(valid_indices) < n_rows:
+                all_probs = np.full(n_rows, np.nan, dtype=np.float32)
+                all_probs[valid_indices] = probs_p1
+                probs_p1 = all_probs
+            return _finish_handler(request, Response(
+                content=encode_results(probs_p1, model_version, response_type),
+                media_type=response_type,
+                headers={"X-Model-Version": model_version or ""}
+            ))
+        
+        items = [None] * n_rows
+        for index, ve in errors:
+            details = ve.errors(include_url=False, include_input=False, include_context=False)
+            items[index] = BatchPredictionItem(
+                index=index,
+                success=False,
+                error="; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in details),
+                details=details
+            )
+        
+        # Realizar todas las predicciones válidas en una sola llamada
+        prediction_results = await predictor.run_inference(predictor.predict_features, features)
+        
+        for index, prediction_result in zip(valid_indices, prediction_results):
+            items[index] = BatchPredictionItem(
+                index=index,
+                success=True,
+                data=MatchPredictionOutput(**prediction_result)
+            )
+        
+        return _finish_handler(request, BatchPredictionResponse(
+            success=True,
+            message=f"Batch prediction completed: {len(valid_indices)} of {len(items)} matches predicted",
+            data=items
+        ))
+        
+    except UnsupportedFormatError as ue:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(ue))
+        
+    except ValueError as ve:
+        logger.error(f"Validation error in batch prediction: {str(ve)}")
+        return _finish_handler(request, BatchPredictionResponse(
+            success=False,
+            message="Validation error",
+            error=str(ve)
+        ))
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in batch prediction: {str(e)}")
+        return _finish_handler(request, BatchPredictionResponse(
+            success=False,
+            message="Internal server error",
+            error="An unexpected error occurred during batch prediction"
+        ))
+
+@router.post("/predict/matrix", response_model=PairwiseMatrixResponse)
+async def predict_win_probability_matrix(
+    matrix_data: PairwiseMatrixInput,
+    request: Request,
+    format: Literal["json", "columnar", "binary"] = Query("json")
+):
+    """
+    Matriz N×N de probabilidades de victoria entre un grupo de jugadores ("quién gana a quién")
+    
+    Parameters:
+    - matrix_data: Perfiles de los N jugadores, superficie, tipo de torneo y H2H opcional
+    - format: json (matriz anidada), columnar (listas player/opponent/probability por par)
+      o binary (float32 little-endian N×N, forma en la cabecera X-Matrix-Shape)
+    
+    Returns:
+    - PairwiseMatrixResponse con matrix[i][j] = P(i gana a j); todos los pares se
+      puntúan con una sola llamada al modelo
+    """
+    reduced = matrix_data.reduced
+    _start_handler(request, "reduced" if reduced else "full")
+    try:
+        predictor = get_predictor()
+        await wait_for_models()
+        
+        # Si el modelo no está cargado, intentar cargarlo automáticamente
+        loaded = predictor.is_model_reduced_loaded() if reduced else predictor.is_model_loaded()
+        if not loaded:
+            model_path = settings.MODEL_REDUCED_PATH if reduced else settings.MODEL_PATH
+            logger.info(f"Model not loaded, attempting to load from {model_path}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="reduced" if reduced else "full").inc()
+            load = predictor.load_model_reduced if reduced else predictor.load_model
+            if not load(model_path):
+                return _finish_handler(request, PairwiseMatrixResponse(
+                    success=False,
+                    message="Model could not be loaded",
+                    error=f"Failed to load model from {model_path}. Please check if the file exists."
+                ))
+        
+        n_players = len(matrix_data.players)
+        if not 2 <= n_players <= settings.PAIRWISE_MAX_PLAYERS:
+            raise ValueError(f"Between 2 and {settings.PAIRWISE_MAX_PLAYERS} players are required, got {n_players}")
+        
+        h2h = None
+        if matrix_data.h2h_wins is not None:
+            h2h = np.asarray(matrix_data.h2h_wins, dtype=np.float32)
+            if h2h.shape != (n_players, n_players):
+                raise ValueError(f"h2h_wins must be a {n_players}x{n_players} matrix")
+        
+        profiles = profile_matrix(
+            [player.model_dump() for player in matrix_data.players], matrix_data.surface, matrix_data.tourney_type
+        )
+        
+        # Todos los pares ordenados en una sola llamada, en el pool de inferencia
+        matrix, model_version = await predictor.run_inference(win_probability_matrix, predictor, profiles, h2h, reduced)
+        
+        if format == "binary":
+            return _finish_handler(request, Response(
+                content=matrix.astype("<f4").tobytes(),
+                media_type="application/octet-stream",
+                headers={"X-Matrix-Shape": f"{n_players},{n_players}", "X-Model-Version": model_version}
+            ))
+        
+        output = PairwiseMatrixOutput(
+            players=[player.name for player in matrix_data.players],
+            surface=matrix_data.surface,
+            tourney_type=matrix_data.tourney_type,
+            model_version=model_version
+        )
+        if format == "columnar":
+            idx_i, idx_j = np.nonzero(~np.isnan(matrix))
+            output.columns = {
+                "player": idx_i.tolist(),
+                "opponent": idx_j.tolist(),
+                "probability": matrix[idx_i, idx_j].tolist()
+            }
+        else:
+            output.matrix = [
+                [None if i == j else value for j, value in enumerate(row)]
+                for i, row in enumerate(matrix.tolist())
+            ]
+        
+        return _finish_handler(request, PairwiseMatrixResponse(
+            success=True,
+            message=f"Win probability matrix completed: {n_players} players, {n_players * (n_players - 1)} pairs",
+            data=output
+        ))
+        
+    except ValueError as ve:
+        logger.error(f"Validation error in win probability matrix: {str(ve)}")
+        return _finish_handler(request, PairwiseMatrixResponse(
+            success=False,
+            message="Validation error",
+            error=str(ve)
+        ))
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in win probability matrix: {str(e)}")
+        return _finish_handler(request, PairwiseMatrixResponse(
+            success=False,
+            message="Internal server error",
+            error="An unexpected error occurred during win probability matrix prediction"
+        ))
+
+@router.post("/predict/draw", response_model=DrawSimulationResponse)
+async def simulate_tournament_draw(draw_data: DrawSimulationInput, request: Request):
+    """
+    Simula un cuadro de torneo con Monte Carlo y devuelve la probabilidad de que cada
+    jugador alcance cada ronda
+    
+    Parameters:
+    - draw_data: Cuadro en orden (null = bye), perfiles de los jugadores, superficie,
+      tipo de torneo, H2H opcional por posición y número de simulaciones
+    
+    Returns:
+    - DrawSimulationResponse: Probabilidades por ronda de cada jugador. Todos los
+      enfrentamientos posibles se puntúan con una sola llamada al modelo y las
+      simulaciones solo consultan esa tabla.
+    """
+    reduced = draw_data.reduced
+    _start_handler(request, "reduced" if reduced else "full")
+    try:
+        predictor = get_predictor()
+        await wait_for_models()
+        
+        # Si el modelo no está cargado, intentar cargarlo automáticamente
+        loaded = predictor.is_model_reduced_loaded() if reduced else predictor.is_model_loaded()
+        if not loaded:
+            model_path = settings.MODEL_REDUCED_PATH if reduced else settings.MODEL_PATH
+            logger.info(f"Model not loaded, attempting to load from {model_path}")
+            LAZY_MODEL_LOADS_TOTAL.labels(model="reduced" if reduced else "full").inc()
+            load = predictor.load_model_reduced if reduced else predictor.load_model
+            if not load(model_path):
+                return _finish_handler(request, DrawSimulationResponse(
+                    success=False,
+                    message="Model could not be loaded",
+                    error=f"Failed to load model from {model_path}. Please check if the file exists."
+                ))
+        
+        draw_size = len(draw_data.players)
+        if draw_size < 2 or draw_size & (draw_size - 1) or draw_size > settings.PAIRWISE_MAX_PLAYERS:
+            raise ValueError(f"Draw size must be a power of 2 between 2 and {settings.PAIRWISE_MAX_PLAYERS}, got {draw_size}")
+        if not 1 <= draw_data.simulations <= settings.SIMULATION_MAX_RUNS:
+            raise ValueError(f"simulations must be between 1 and {settings.SIMULATION_MAX_RUNS}")
+        
+        # Jugadores reales en orden del cuadro; los byes apuntan al índice len(players)
+        positions = [slot for slot, player in enumerate(draw_data.players) if player is not None]
+        players = [draw_data.players[slot] for slot in positions]
+        if len(players) < 2:
+            raise ValueError("At least 2 players are required")
+        slots = np.full(draw_size, len(players), dtype=np.int16)
+        slots[positions] = np.arange(len(players))
+        
+        h2h = None
+        if draw_data.h2h_wins is not None:
+            h2h = np.asarray(draw_data.h2h_wins, dtype=np.float32)
+            if h2h.shape != (draw_size, draw_size):
+                raise ValueError(f"h2h_wins must be a {draw_size}x{draw_size} matrix")
+            h2h = h2h[np.ix_(positions, positions)]
+        
+        profiles = profile_matrix([player.model_dump() for player in players], draw_data.surface, draw_data.tourney_type)
+        
+        # Tabla de enfrentamientos y simulación en el pool de inferencia
+        reach, model_version = await predictor.run_inference(
+            run_draw_simulation, predictor, profiles, h2h, slots, draw_data.simulations, draw_data.seed, reduced
+        )
+        
+        rounds = round_names(draw_size)
+        results = [
+            DrawPlayerResult(slot=slot, name=player.name, rounds=dict(zip(rounds, probabilities)))
+            for slot, player, probabilities in zip(positions, players, reach.tolist())
+        ]
+        
+        return _finish_handler(request, DrawSimulationResponse(
+            success=True,
+            message=f"Draw simulation completed: {draw_data.simulations} simulations of a {draw_size}-player draw",
+            data=DrawSimulationOutput(
+                rounds=rounds,
+                players=results,
+                simulations=draw_data.simulations,
+                surface=draw_data.surface,
+                tourney_type=draw_data.tourney_type,
+                model_version=model_version
+            )
+        ))
+        
+    except ValueError as ve:
+        logger.error(f"Validation error in draw simulation: {str(ve)}")
+        return _finish_handler(request, DrawSimulationResponse(
+            success=False,
+            message="Validation error",
+            error=str(ve)
+        ))
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in draw simulation: {str(e)}")
+        return _finish_handler(request, DrawSimulationResponse(
+            success=False,
+            message="Internal server error",
+            error="An unexpected error occurred during draw simulation"
+        ))
+
+@router.get("/batching/stats")
+async def micro_batching_stats():
+    """
+    Histogramas de tamaño de lote y espera en cola del micro-batcher de cada modelo
+    """
+    return {
+        "enabled": settings.MICROBATCH_ENABLED,
+        "max_wait_ms": settings.MICROBATCH_MAX_WAIT_MS,
+        "max_batch_size": settings.MICROBATCH_MAX_BATCH_SIZE,
+        "full": get_batcher().stats(),
+        "reduced": get_batcher(reduced=True).stats()
+    }
+
+@router.get("/cache/stats")
+async def prediction_cache_stats():
+    """
+    Contadores de aciertos, fallos y expulsiones de la caché de predicciones
+    """
+    return get_predictor().cache.stats()
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Literal, Optional, Any
+
+class ModelActivationInput(BaseModel):
+    """
+    Schema para activar un modelo del registro
+    """
+    name: str  # Nombre del archivo en el directorio de modelos, p. ej. modelo_xgb2.ubj
+    target: Literal["full", "reduced"] = "full"  # Qué modelo del API se reemplaza
+
+class AdminResponse(BaseModel):
+    """
+    Schema para la respuesta de los endpoints de administración
+    """
+    success: bool
+    message: str
+    data: Optional[Any] = None
+    error: Optional[str] = None
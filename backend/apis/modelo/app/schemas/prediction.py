@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List, Dict, Any
 
 class MatchPredictionInput(BaseModel):
     """
@@ -91,6 +91,34 @@ class MatchPredictionInputReduced(BaseModel):
     p1_pct_1stWon: float  # Porcentaje de puntos ganados con primer servicio
     p2_pct_1stWon: float
 
+class MatchPredictionInputCascade(MatchPredictionInputReduced):
+    """
+    Schema para la predicción en cascada: las características reducidas son obligatorias
+    y el resto opcionales. El modelo completo solo puede responder si vienen todas.
+    """
+    p1_age: Optional[float] = None
+    p2_age: Optional[float] = None
+    p1_ht: Optional[float] = None
+    p2_ht: Optional[float] = None
+    p1_hand_encoded: Optional[int] = None
+    p2_hand_encoded: Optional[int] = None
+    p1_min_rank: Optional[float] = None
+    p2_min_rank: Optional[float] = None
+    p1_pct_1stIn: Optional[float] = None
+    p2_pct_1stIn: Optional[float] = None
+    p1_pct_2ndWon: Optional[float] = None
+    p2_pct_2ndWon: Optional[float] = None
+    p1_pct_bpConv: Optional[float] = None
+    p2_pct_bpConv: Optional[float] = None
+    p1_pct_bpSaved: Optional[float] = None
+    p2_pct_bpSaved: Optional[float] = None
+    p1_h2h_won: Optional[float] = None
+    p2_h2h_won: Optional[float] = None
+    
+    # Control de la cascada
+    use_full_model: bool = False  # Ir directo al modelo completo si vienen todas las características
+    confidence_threshold: Optional[float] = None  # Por defecto CASCADE_CONFIDENCE_THRESHOLD
+
 class MatchPredictionOutput(BaseModel):
     """
     Schema para la respuesta de la predicción
@@ -98,6 +126,8 @@ class MatchPredictionOutput(BaseModel):
     prediction: int  # 0 o 1 (gana jugador 1 o jugador 2)
     probability_p1_wins: float  # Probabilidad de que gane el jugador 1
     probability_p2_wins: float  # Probabilidad de que gane el jugador 2
+    model: Optional[str] = None  # Modelo que respondió: "full" o "reduced"
+    model_version: Optional[str] = None  # Versión del modelo que respondió
 
 class PredictionResponse(BaseModel):
     """
@@ -107,3 +137,130 @@ class PredictionResponse(BaseModel):
     message: str
     data: Optional[MatchPredictionOutput] = None
     error: Optional[str] = None
+
+
+class BatchPredictionInput(BaseModel):
+    """
+    Schema para la predicción por lotes.
+    Cada fila se valida por separado contra MatchPredictionInput para que
+    una fila mal formada no invalide el lote completo.
+    """
+    matches: List[Any]  # Cualquier JSON por fila: lo que no sea un objeto se reporta como error de esa fila
+
+class BatchPredictionItem(BaseModel):
+    """
+    Resultado de una fila dentro de una predicción por lotes
+    """
+    index: int  # Posición de la fila en la petición original
+    success: bool
+    data: Optional[MatchPredictionOutput] = None
+    error: Optional[str] = None  # Resumen "campo: mensaje" de los errores de validación
+    details: Optional[List[Dict[str, Any]]] = None  # Errores de validación (loc, msg, type), sin el valor recibido
+
+class BatchPredictionResponse(BaseModel):
+    """
+    Schema para la respuesta completa de la predicción por lotes
+    """
+    success: bool
+    message: str
+    data: List[BatchPredictionItem] = []
+    error: Optional[str] = None
+
+
+class PlayerProfile(BaseModel):
+    """
+    Perfil de un jugador para la matriz de enfrentamientos: las mismas estadísticas
+    que MatchPredictionInput, sin prefijo p1_/p2_
+    """
+    name: Optional[str] = None  # Etiqueta opcional para identificar filas y columnas
+    age: float
+    ht: float
+    hand_encoded: int  # 0 = izquierdo, 1 = derecho
+    rank: float
+    min_rank: float
+    pct_1stIn: float
+    pct_1stWon: float
+    pct_2ndWon: float
+    pct_SvPtsWon: float
+    pct_bpConv: float
+    pct_bpSaved: float
+    pct_1stRetPtsWon: float
+    pct_2ndRetPtsWon: float
+    recPerf: float
+    # Tasas de victoria por superficie (grass, hard, clay) y por tipo de torneo (G, M, A, F, D, O)
+    surface_wRates: Dict[str, float] = {}
+    tourney_wRates: Dict[str, float] = {}
+
+class PairwiseMatrixInput(BaseModel):
+    """
+    Schema para la matriz de probabilidades de victoria entre N jugadores
+    """
+    players: List[PlayerProfile]
+    surface: Optional[str] = None  # Selecciona surface_wRates de cada jugador
+    tourney_type: Optional[str] = None  # Selecciona tourney_wRates de cada jugador
+    h2h_wins: Optional[List[List[float]]] = None  # N×N: h2h_wins[i][j] = victorias de i sobre j
+    reduced: bool = False  # Usar el modelo de características reducidas
+
+class PairwiseMatrixOutput(BaseModel):
+    """
+    Resultado de la matriz de enfrentamientos. Según el formato pedido se rellena
+    `matrix` (N×N, diagonal nula) o `columns` (una entrada por par ordenado)
+    """
+    players: List[Optional[str]]
+    surface: Optional[str] = None
+    tourney_type: Optional[str] = None
+    model_version: Optional[str] = None
+    matrix: Optional[List[List[Optional[float]]]] = None  # matrix[i][j] = P(i gana a j)
+    columns: Optional[Dict[str, List[Any]]] = None  # player, opponent, probability
+
+class PairwiseMatrixResponse(BaseModel):
+    """
+    Schema para la respuesta completa de la matriz de enfrentamientos
+    """
+    success: bool
+    message: str
+    data: Optional[PairwiseMatrixOutput] = None
+    error: Optional[str] = None
+
+
+class DrawSimulationInput(BaseModel):
+    """
+    Schema para la simulación Monte Carlo de un cuadro de torneo
+    """
+    # Cuadro en orden: el 1 juega contra el 2, el 3 contra el 4... null = bye.
+    # El tamaño debe ser potencia de 2.
+    players: List[Optional[PlayerProfile]]
+    surface: Optional[str] = None
+    tourney_type: Optional[str] = None
+    h2h_wins: Optional[List[List[float]]] = None  # Indexado por posición en el cuadro
+    simulations: int = 100_000
+    seed: Optional[int] = None  # Para resultados reproducibles
+    reduced: bool = False
+
+class DrawPlayerResult(BaseModel):
+    """
+    Probabilidad de que un jugador alcance cada ronda del cuadro
+    """
+    slot: int  # Posición en el cuadro
+    name: Optional[str] = None
+    rounds: Dict[str, float]  # p. ej. {"R16": 0.81, "QF": 0.55, ..., "W": 0.12}
+
+class DrawSimulationOutput(BaseModel):
+    """
+    Resultado de la simulación del cuadro
+    """
+    rounds: List[str]
+    players: List[DrawPlayerResult]
+    simulations: int
+    surface: Optional[str] = None
+    tourney_type: Optional[str] = None
+    model_version: Optional[str] = None
+
+class DrawSimulationResponse(BaseModel):
+    """
+    Schema para la respuesta completa de la simulación del cuadro
+    """
+    success: bool
+    message: str
+    data: Optional[DrawSimulationOutput] = None
+    error: Optional[str] = None
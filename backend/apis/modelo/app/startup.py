@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.config import settings
+from app.models.predictor import get_predictor
+
+logger = logging.getLogger(__name__)
+
+# Estado de arranque que reporta /ready
+readiness = {
+    "ready": False,
+    "models": {"full": False, "reduced": False},
+    "load_time_ms": None,
+    "warmup_latency_ms": None,
+}
+
+# Carga en segundo plano de STARTUP_MODE=lazy (None si no se ha lanzado)
+_background_load: Optional[asyncio.Future] = None
+
+def load_models(before_fork: bool = False) -> None:
+    """
+    Carga ambos modelos en el predictor global y registra el tiempo de carga.
+    Con before_fork (precarga en el maestro de gunicorn) no se ejecuta ninguna predicción:
+    la verificación del evaluador NumPy queda para prepare_models() en cada worker.
+    """
+    predictor = get_predictor()
+
+    start = time.perf_counter()
+    predictor.load_model(settings.MODEL_PATH, verify_evaluator=not before_fork)
+    predictor.load_model_reduced(settings.MODEL_REDUCED_PATH, verify_evaluator=not before_fork)
+    readiness["load_time_ms"] = (time.perf_counter() - start) * 1000
+    readiness["models"] = {
+        "full": predictor.is_model_loaded(),
+        "reduced": predictor.is_model_reduced_loaded(),
+    }
+
+def prepare_models() -> None:
+    """
+    Carga los modelos (si no vienen precargados), los calienta y marca el servicio como listo
+    """
+    predictor = get_predictor()
+
+    if not (predictor.is_model_loaded() and predictor.is_model_reduced_loaded()):
+        load_models()
+    predictor.verify_pending_evaluators()
+
+    try:
+        readiness["warmup_latency_ms"] = predictor.warm_up(settings.WARMUP_ITERATIONS)
+        readiness["ready"] = all(readiness["models"].values())
+    except Exception as e:
+        logger.error(f"Error during model warm-up: {str(e)}")
+
+    logger.info("Startup completed", extra={"readiness": readiness})
+
+def start_background_load() -> asyncio.Future:
+    """
+    Lanza prepare_models() en un hilo: el servidor acepta tráfico de inmediato
+    (/health responde y /ready devuelve 503 hasta que termine la carga)
+    """
+    global _background_load
+    _background_load = asyncio.get_running_loop().run_in_executor(None, prepare_models)
+    return _background_load
+
+async def wait_for_models() -> None:
+    """
+    Espera a la carga en segundo plano si sigue en curso, para que una petición temprana
+    no vuelva a cargar el modelo de forma síncrona en el event loop
+    """
+    if _background_load is not None and not _background_load.done():
+        await asyncio.shield(_background_load)
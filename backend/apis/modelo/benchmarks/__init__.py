@@ -0,0 +1 @@
+# Benchmarks del API de predicción
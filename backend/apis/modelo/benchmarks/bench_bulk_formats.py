@@ -0,0 +1,79 @@
+# Benchmark de /api/v1/predict/batch con cuerpos JSON frente a .npy, Arrow IPC y MessagePack
+#
+# Los cuerpos se serializan antes de medir; cada medición incluye la petición completa
+# (decodificación, inferencia y serialización de la respuesta en el mismo formato).
+# Arrow y MessagePack se omiten si pyarrow / msgpack no están instalados.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_bulk_formats --rows 1000 10000 100000
+import argparse
+import io
+import json
+import logging
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.formats import MEDIA_ARROW, MEDIA_JSON, MEDIA_MSGPACK, MEDIA_NPY, optional_dependency
+from benchmarks.payloads import FEATURE_NAMES, synthetic_inputs
+
+
+def encode_bodies(rows: list) -> dict:
+    """
+    El mismo lote en cada formato soportado
+    """
+    pa, msgpack = optional_dependency("pyarrow"), optional_dependency("msgpack")
+    features = np.array([[row[name] for name in FEATURE_NAMES] for row in rows], dtype=np.float32)
+    bodies = {MEDIA_JSON: json.dumps({"matches": rows}).encode()}
+
+    buffer = io.BytesIO()
+    np.save(buffer, features)
+    bodies[MEDIA_NPY] = buffer.getvalue()
+
+    if pa is not None:
+        table = pa.table({name: features[:, column] for column, name in enumerate(FEATURE_NAMES)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        bodies[MEDIA_ARROW] = sink.getvalue().to_pybytes()
+
+    if msgpack is not None:
+        bodies[MEDIA_MSGPACK] = msgpack.packb(
+            {name: np.ascontiguousarray(features[:, column]).tobytes() for column, name in enumerate(FEATURE_NAMES)}
+        )
+    return bodies
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs binary bodies on the batch prediction path")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with TestClient(app) as client:
+        for n_rows in args.rows:
+            bodies = encode_bodies(synthetic_inputs(n_rows, seed=n_rows))
+            for media_type, body in bodies.items():
+                headers = {"content-type": media_type, "accept": media_type}
+                elapsed = best_ms(lambda: client.post("/api/v1/predict/batch", content=body, headers=headers), args.repeat)
+                response_kb = len(client.post("/api/v1/predict/batch", content=body, headers=headers).content) / 1024
+                print(
+                    f"rows={n_rows:<7} {media_type:<38} {elapsed:9.1f} ms  {n_rows / elapsed * 1000:12,.0f} rows/s  "
+                    f"request={len(body) / 1024:9.1f} KB  response={response_kb:9.1f} KB"
+                )
+
+
+if __name__ == "__main__":
+    main()
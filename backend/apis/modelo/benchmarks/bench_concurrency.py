@@ -0,0 +1,80 @@
+# Benchmark de concurrencia: rendimiento de la inferencia según el tamaño del pool
+# y latencia del event loop mientras hay inferencias en curso
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_concurrency --requests 4000 --workers 1 2 4 8
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor
+from benchmarks.payloads import synthetic_input
+
+
+async def probe_event_loop(stop: asyncio.Event, lags: list):
+    """
+    Mide cuánto tarda el event loop en atender una tarea mientras se hace inferencia
+    (equivalente a la latencia que vería /health)
+    """
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def run(predictor: XGBoostPredictor, inputs: list, concurrency: int):
+    """
+    Lanza todas las predicciones con a lo sumo `concurrency` en vuelo y devuelve
+    (predicciones por segundo, lag p99 del event loop en ms)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    lags = []
+
+    async def one(input_data):
+        async with semaphore:
+            await predictor.run_inference(predictor.predict, input_data)
+
+    probe = asyncio.create_task(probe_event_loop(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(one(input_data) for input_data in inputs))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return len(inputs) / elapsed, float(np.percentile(lags, 99)) if lags else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inference throughput vs pool size")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--nthread", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # No medir el coste del log INFO de cada predicción
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    inputs = [synthetic_input(rng) for _ in range(args.requests)]
+
+    print(f"cpus={os.cpu_count()} requests={args.requests} nthread={args.nthread}")
+    for workers in sorted(set(args.workers)):
+        predictor = XGBoostPredictor(
+            settings.MODEL_PATH,
+            inference_workers=workers,
+            nthread=args.nthread
+        )
+        predictor.warm_up()
+        throughput, loop_lag_p99 = asyncio.run(run(predictor, inputs, concurrency=workers * 4))
+        predictor.shutdown()
+        print(f"workers={workers:<3} throughput={throughput:9.1f} pred/s  event-loop lag p99={loop_lag_p99:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Benchmark del decodificador generado desde el schema (app.models.decoder) frente al camino
+# anterior: modelo pydantic -> .dict() -> prepare_features_array
+#
+# Ambos caminos parten del cuerpo JSON en bytes y terminan en la matriz float32 en el orden
+# del modelo; se comprueba primero que producen exactamente la misma matriz.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_decoder --iterations 5000
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.models.decoder import get_decoder
+from app.models.predictor import get_predictor
+from app.schemas.prediction import MatchPredictionInput, MatchPredictionInputReduced
+from benchmarks.payloads import synthetic_inputs
+
+
+def per_call_us(fn, bodies, repeat: int = 3) -> float:
+    """
+    Mejor media de `repeat` pasadas, en microsegundos por llamada
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            fn(body)
+        best = min(best, (time.perf_counter() - start) / len(bodies) * 1e6)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schema-driven decoder vs pydantic + prepare_features_array")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=128)
+    args = parser.parse_args()
+
+    predictor = get_predictor()
+    for name, schema, reduced in (
+        ("full", MatchPredictionInput, False),
+        ("reduced", MatchPredictionInputReduced, True),
+    ):
+        decoder = get_decoder(reduced)
+        rows = synthetic_inputs(args.iterations, seed=7, reduced=reduced)
+        bodies = [json.dumps(row).encode() for row in rows]
+
+        def current(body):
+            return predictor.prepare_features_array([schema(**json.loads(body)).model_dump()], reduced=reduced)
+
+        def decoded(body):
+            return decoder.decode(json.loads(body))
+
+        same = all(np.array_equal(current(body), decoded(body)) for body in bodies[:500])
+        print(f"{name}: identical matrices={same}")
+
+        current_us = per_call_us(current, bodies)
+        decoded_us = per_call_us(decoded, bodies)
+        print(f"  single   current={current_us:8.2f} us  decoder={decoded_us:8.2f} us  speedup={current_us / decoded_us:5.2f}x")
+
+        batches = [
+            json.dumps(rows[i:i + args.batch_size]).encode()
+            for i in range(0, len(rows) - args.batch_size + 1, args.batch_size)
+        ]
+
+        def current_batch(body):
+            return predictor.prepare_features_array(
+                [schema(**row).model_dump() for row in json.loads(body)], reduced=reduced
+            )
+
+        def decoded_batch(body):
+            return decoder.decode_many(json.loads(body))[0]
+
+        current_us = per_call_us(current_batch, batches)
+        decoded_us = per_call_us(decoded_batch, batches)
+        print(
+            f"  batch={args.batch_size:<4} current={current_us:8.2f} us  decoder={decoded_us:8.2f} us  "
+            f"speedup={current_us / decoded_us:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Throughput del simulador Monte Carlo de cuadros (app.models.simulation)
+#
+# Mide por separado el precálculo de la tabla de enfrentamientos (una llamada al modelo
+# sobre N·(N-1) pares) y las simulaciones sobre esa tabla, y lo compara con el coste
+# estimado de hacer una inferencia por partido simulado.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_draw_simulation --draw-sizes 32 64 128 --simulations 100000 1000000
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.models.pairwise import profile_matrix, win_probability_matrix
+from app.models.predictor import XGBoostPredictor
+from app.models.simulation import probability_table, simulate_draw
+from benchmarks.payloads import synthetic_inputs, synthetic_players
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo draw simulation throughput")
+    parser.add_argument("--draw-sizes", type=int, nargs="+", default=[32, 64, 128])
+    parser.add_argument("--simulations", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    predictor = XGBoostPredictor(settings.MODEL_PATH, settings.MODEL_REDUCED_PATH)
+
+    # Latencia de una predicción individual, para estimar el coste de inferir cada partido
+    rows = synthetic_inputs(500, seed=5)
+    start = time.perf_counter()
+    for row in rows:
+        predictor.predict_many([row])
+    single_ms = (time.perf_counter() - start) * 1000 / len(rows)
+
+    for draw_size in args.draw_sizes:
+        profiles = profile_matrix(synthetic_players(draw_size, seed=draw_size), "hard", "G")
+
+        start = time.perf_counter()
+        matrix, _ = win_probability_matrix(predictor, profiles)
+        table = probability_table(matrix)
+        table_ms = (time.perf_counter() - start) * 1000
+
+        for n_simulations in args.simulations:
+            start = time.perf_counter()
+            simulate_draw(table, np.arange(draw_size), n_simulations, seed=0)
+            simulate_ms = (time.perf_counter() - start) * 1000
+
+            matches = n_simulations * (draw_size - 1)
+            print(
+                f"draw={draw_size:<4} sims={n_simulations:<8} table={table_ms:7.1f} ms  simulate={simulate_ms:9.1f} ms  "
+                f"{n_simulations / simulate_ms * 1000:12,.0f} sims/s  {matches / simulate_ms * 1000:14,.0f} matches/s  "
+                f"per-match inference~{single_ms * matches / 1000 / 3600:8.1f} h"
+            )
+
+
+if __name__ == "__main__":
+    main()
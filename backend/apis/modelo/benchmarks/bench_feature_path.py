@@ -0,0 +1,82 @@
+# Benchmark del camino de características: DataFrame de pandas vs fila NumPy float32
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_feature_path --iterations 5000 --concurrency 4
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import xgboost as xgb
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor
+from benchmarks.payloads import synthetic_input
+
+
+def pandas_path(predictor: XGBoostPredictor, input_data: dict, reduced: bool):
+    """
+    Camino anterior: dict -> DataFrame de una fila -> DMatrix -> predict
+    """
+    if reduced:
+        dmatrix = xgb.DMatrix(predictor.prepare_features_reduced(input_data))
+        return predictor.model_reduced.predict(dmatrix)
+    dmatrix = xgb.DMatrix(predictor.prepare_features(input_data))
+    return predictor.model.predict(dmatrix)
+
+
+def numpy_path(predictor: XGBoostPredictor, input_data: dict, reduced: bool):
+    """
+    Camino rápido: dict -> fila float32 -> DMatrix -> predict
+    """
+    dmatrix = predictor._build_dmatrix(predictor.prepare_features_array([input_data], reduced=reduced), reduced=reduced)
+    model = predictor.model_reduced if reduced else predictor.model
+    return model.predict(dmatrix)
+
+
+def measure(fn, predictor, inputs, reduced, concurrency):
+    """
+    Ejecuta fn para cada entrada y devuelve las latencias individuales en milisegundos
+    """
+    def timed(input_data):
+        start = time.perf_counter()
+        fn(predictor, input_data, reduced)
+        return (time.perf_counter() - start) * 1000
+
+    if concurrency <= 1:
+        return np.array([timed(input_data) for input_data in inputs])
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return np.array(list(executor.map(timed, inputs)))
+
+
+def report(label: str, latencies: np.ndarray):
+    print(
+        f"{label:<28} p50={np.percentile(latencies, 50):7.3f} ms  "
+        f"p99={np.percentile(latencies, 99):7.3f} ms  mean={latencies.mean():7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pandas vs NumPy feature path")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    predictor = XGBoostPredictor(settings.MODEL_PATH, settings.MODEL_REDUCED_PATH)
+    rng = random.Random(args.seed)
+    inputs = [synthetic_input(rng) for _ in range(args.iterations)]
+
+    print(f"iterations={args.iterations} concurrency={args.concurrency}")
+    for reduced in (False, True):
+        model_label = "reduced" if reduced else "full"
+        # Calentamiento para no medir la primera llamada a XGBoost
+        measure(pandas_path, predictor, inputs[:50], reduced, 1)
+        measure(numpy_path, predictor, inputs[:50], reduced, 1)
+        report(f"{model_label} / pandas (before)", measure(pandas_path, predictor, inputs, reduced, args.concurrency))
+        report(f"{model_label} / numpy (after)", measure(numpy_path, predictor, inputs, reduced, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark de arranque en frío: pickle vs formato nativo de XGBoost (.ubj)
+#
+# Cada medición se hace en un proceso nuevo para incluir el coste real de carga
+# y la memoria residente (RSS) que añade el modelo.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_model_format --repeat 5
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from app.models.serialization import convert_pickle_to_native
+
+MODELS = {
+    "full": "AI_models/modelo_xgb2.pkl",
+    "reduced": "AI_models/modelo_reduced_xgb2.pkl",
+}
+
+# Se ejecuta en un proceso hijo: importa xgboost, mide RSS, carga el modelo y vuelve a medir
+CHILD_SCRIPT = """
+import json, sys, time, warnings
+warnings.filterwarnings("ignore")
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+import xgboost
+from app.models.serialization import load_model_file
+
+before = rss_kb()
+start = time.perf_counter()
+model, _ = load_model_file(sys.argv[1])
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"load_ms": elapsed, "rss_delta_kb": rss_kb() - before}))
+"""
+
+
+def measure(model_path: str, repeat: int) -> dict:
+    load_ms, rss_kb = [], []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT, model_path],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        load_ms.append(result["load_ms"])
+        rss_kb.append(result["rss_delta_kb"])
+    return {
+        "load_ms_median": float(np.median(load_ms)),
+        "rss_delta_kb_median": float(np.median(rss_kb)),
+        "file_kb": Path(model_path).stat().st_size / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pickle vs native model loading")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, pickle_path in MODELS.items():
+            native_path = convert_pickle_to_native(pickle_path, str(Path(tmp) / f"{name}.ubj"), model_version=f"bench-{name}")
+            for label, path in (("pickle", pickle_path), ("native", native_path)):
+                stats = measure(path, args.repeat)
+                print(
+                    f"{name:<8} {label:<7} load={stats['load_ms_median']:8.2f} ms  "
+                    f"rss+={stats['rss_delta_kb_median']:8.0f} KB  file={stats['file_kb']:8.1f} KB"
+                )
+
+
+if __name__ == "__main__":
+    main()
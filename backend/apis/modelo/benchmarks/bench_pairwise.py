@@ -0,0 +1,63 @@
+# Benchmark de la matriz de enfrentamientos (/api/v1/predict/matrix) frente a pedir
+# cada par ordenado por separado a /api/v1/predict
+#
+# El coste de las N·(N-1) peticiones individuales se extrapola a partir de una muestra
+# de --sample-requests peticiones (sin caché: cada par es distinto).
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_pairwise --players 16 64 128 256
+import argparse
+import logging
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.payloads import synthetic_inputs, synthetic_players
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pairwise matrix endpoint vs N^2 single predictions")
+    parser.add_argument("--players", type=int, nargs="+", default=[16, 64, 128, 256])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sample-requests", type=int, default=300)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with TestClient(app) as client:
+        rows = synthetic_inputs(args.sample_requests, seed=11)
+        start = time.perf_counter()
+        for row in rows:
+            client.post("/api/v1/predict", json=row)
+        single_ms = (time.perf_counter() - start) * 1000 / len(rows)
+
+        for n_players in args.players:
+            body = {"players": synthetic_players(n_players, seed=n_players), "surface": "hard", "tourney_type": "G"}
+            pairs = n_players * (n_players - 1)
+            timings = {
+                fmt: best_ms(lambda: client.post(f"/api/v1/predict/matrix?format={fmt}", json=body), args.repeat)
+                for fmt in ("json", "columnar", "binary")
+            }
+            sizes = {
+                fmt: len(client.post(f"/api/v1/predict/matrix?format={fmt}", json=body).content) / 1024
+                for fmt in ("json", "binary")
+            }
+            print(
+                f"N={n_players:<4} pairs={pairs:<6} single-requests~{single_ms * pairs:10.1f} ms  "
+                f"matrix json={timings['json']:8.1f} ms columnar={timings['columnar']:8.1f} ms "
+                f"binary={timings['binary']:8.1f} ms  "
+                f"body json={sizes['json']:8.1f} KB binary={sizes['binary']:7.1f} KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Benchmark de extremo a extremo del camino de servicio de /predict y /predict/batch
+#
+# Lanza peticiones HTTP contra la app ASGI real (middleware, FeatureDecoder, caché de
+# predicciones, micro-batcher, pool de inferencia y serialización de la respuesta) con
+# httpx.ASGITransport, dentro de su lifespan y sin red. Las peticiones individuales van
+# con varias en vuelo a la vez para que el micro-batcher tenga filas que agrupar.
+#
+# Cada escenario combina caché activada/desactivada y micro-batching activado/desactivado.
+# Los payloads salen de un conjunto de --unique partidos distintos, así que con la caché
+# activada una parte de las peticiones se resuelve sin pasar por el modelo.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_serving_path --requests 4000 --concurrency 32
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+
+import httpx
+import numpy as np
+
+from app.config import settings
+from app.main import app
+from app.models.batcher import get_batcher
+from app.models.cache import PredictionCache
+from app.models.predictor import get_predictor
+from benchmarks.payloads import synthetic_inputs
+
+BATCH_SIZES = [16, 128]
+
+
+async def measure(client: httpx.AsyncClient, url: str, bodies: list, concurrency: int) -> dict:
+    """
+    Envía todos los cuerpos con a lo sumo `concurrency` peticiones en vuelo y resume las latencias
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = np.empty(len(bodies))
+    failures = []
+
+    async def one(i, body):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(url, json=body)
+            latencies[i] = (time.perf_counter() - start) * 1000
+            if response.status_code != 200 or not response.json()["success"]:
+                failures.append(response.text)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i, body) for i, body in enumerate(bodies)))
+    elapsed = time.perf_counter() - start
+    return {
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "requests_per_s": len(bodies) / elapsed,
+        "failures": failures,
+    }
+
+
+def configure(cache_enabled: bool, microbatch_enabled: bool) -> PredictionCache:
+    """
+    Aplica la combinación del escenario sobre el predictor y la configuración globales
+    """
+    predictor = get_predictor()
+    predictor.cache = PredictionCache(
+        max_size=settings.PREDICTION_CACHE_SIZE if cache_enabled else 0,
+        ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+    )
+    settings.MICROBATCH_ENABLED = microbatch_enabled
+    return predictor.cache
+
+
+def report(name: str, stats: dict, rows_per_request: int, cache: PredictionCache, extra: str = "") -> None:
+    lookups = cache.hits + cache.misses
+    hit_rate = f"{cache.hits / lookups:6.1%}" if lookups else "   off"
+    print(
+        f"{name:<40} p50={stats['p50_ms']:8.3f} ms  p99={stats['p99_ms']:8.3f} ms  "
+        f"{stats['requests_per_s']:8.1f} req/s  {stats['requests_per_s'] * rows_per_request:9.1f} rows/s  "
+        f"cache hits={hit_rate}{extra}"
+    )
+
+
+async def run(args) -> int:
+    rng = random.Random(args.seed)
+    pool = synthetic_inputs(args.unique, seed=args.seed)
+    singles = [rng.choice(pool) for _ in range(args.requests)]
+    batches = {
+        size: [[rng.choice(pool) for _ in range(size)] for _ in range(max(10, args.requests // size))]
+        for size in BATCH_SIZES
+    }
+
+    failures = 0
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{args.requests} single requests, concurrency {args.concurrency}, {args.unique} distinct matches")
+            for cache_enabled in (False, True):
+                for microbatch_enabled in (False, True):
+                    cache = configure(cache_enabled, microbatch_enabled)
+                    await measure(client, "/api/v1/predict", singles[:args.warmup], args.concurrency)
+                    cache.hits = cache.misses = 0
+                    batch_sizes = get_batcher().batch_size.snapshot()
+                    stats = await measure(client, "/api/v1/predict", singles, args.concurrency)
+                    extra = ""
+                    if microbatch_enabled:
+                        after = get_batcher().batch_size.snapshot()
+                        flushes = after["count"] - batch_sizes["count"]
+                        if flushes:
+                            extra = f"  rows/micro-batch={(after['sum'] - batch_sizes['sum']) / flushes:5.1f}"
+                    name = f"predict cache={'on ' if cache_enabled else 'off'} microbatch={'on ' if microbatch_enabled else 'off'}"
+                    report(name, stats, 1, cache, extra)
+                    failures += len(stats["failures"])
+
+            print(f"batch requests, concurrency {args.batch_concurrency}")
+            settings.MICROBATCH_ENABLED = False
+            for size, bodies in batches.items():
+                for cache_enabled in (False, True):
+                    cache = configure(cache_enabled, False)
+                    payloads = [{"matches": rows} for rows in bodies]
+                    await measure(client, "/api/v1/predict/batch", payloads[:2], args.batch_concurrency)
+                    cache.hits = cache.misses = 0
+                    stats = await measure(client, "/api/v1/predict/batch", payloads, args.batch_concurrency)
+                    report(f"predict/batch.{size} cache={'on ' if cache_enabled else 'off'}", stats, size, cache)
+                    failures += len(stats["failures"])
+
+    if failures:
+        print(f"FAIL: {failures} requests did not return a successful prediction")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of the /predict serving path")
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--unique", type=int, default=1000, help="Distinct matches the requests are drawn from")
+    parser.add_argument("--concurrency", type=int, default=32, help="Single requests in flight")
+    parser.add_argument("--batch-concurrency", type=int, default=4, help="Batch requests in flight")
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # El log INFO por petición distorsionaría las mediciones
+    logging.disable(logging.INFO)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
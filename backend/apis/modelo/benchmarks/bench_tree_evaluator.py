@@ -0,0 +1,64 @@
+# Benchmark del backend NumPy (TreeEnsembleEvaluator) frente a DMatrix + booster.predict
+#
+# Verifica primero que ambos backends coinciden y después mide la latencia por lote.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_tree_evaluator --sizes 1 10 100 1000 10000 100000
+import argparse
+import time
+
+import numpy as np
+import xgboost as xgb
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor
+from app.models.tree_evaluator import TreeEnsembleEvaluator
+
+TOLERANCE = 1e-5
+
+
+def best_of(fn, repeat: int) -> float:
+    """
+    Mejor tiempo en milisegundos de `repeat` ejecuciones
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NumPy tree evaluator vs XGBoost")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--corpus-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    predictor = XGBoostPredictor(settings.MODEL_PATH, settings.MODEL_REDUCED_PATH)
+    for name, booster, feature_names in (
+        ("full", predictor.model, predictor.feature_names),
+        ("reduced", predictor.model_reduced, predictor.reduced_feature_names),
+    ):
+        evaluator = TreeEnsembleEvaluator(booster)
+
+        corpus = evaluator.synthetic_corpus(args.corpus_rows, seed=1)
+        error = evaluator.max_abs_error(booster, corpus, feature_names)
+        status = "OK" if error <= TOLERANCE else "MISMATCH"
+        print(f"{name}: trees={evaluator.roots.size} depth={evaluator.max_depth} max|diff|={error:.2e} {status}")
+
+        largest = evaluator.synthetic_corpus(max(args.sizes), seed=2)
+        for size in args.sizes:
+            batch = largest[:size]
+            repeat = max(1, args.repeat if size <= 10000 else args.repeat // 10)
+            native_ms = best_of(lambda: booster.predict(xgb.DMatrix(batch, feature_names=feature_names)), repeat)
+            numpy_ms = best_of(lambda: evaluator.predict(batch), repeat)
+            print(
+                f"  batch={size:<7} xgboost={native_ms:9.3f} ms  numpy={numpy_ms:9.3f} ms  "
+                f"speedup={native_ms / numpy_ms:6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
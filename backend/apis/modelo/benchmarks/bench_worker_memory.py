@@ -0,0 +1,116 @@
+# Memoria por worker de gunicorn con y sin precarga de modelos (PRELOAD_MODELS)
+#
+# Arranca gunicorn con 1, 2, 4 y 8 workers, espera a /ready, hace unas predicciones
+# y lee RSS y PSS (memoria proporcional: las páginas compartidas se reparten entre
+# procesos) de /proc/<pid>/smaps_rollup. Solo Linux.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.bench_worker_memory --workers 1 2 4 8
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from benchmarks.payloads import synthetic_input
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def memory_kb(pid: int) -> dict:
+    """
+    Rss y Pss del proceso en KB
+    """
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key.lower()] = int(rest.split()[0])
+    return values
+
+
+def children(pid: int) -> list:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def wait_ready(port: int, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except Exception:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError("Service did not become ready")
+
+
+def exercise(port: int, requests: int) -> None:
+    """
+    Hace algunas predicciones para que cada worker toque el modelo
+    """
+    import random
+    rng = random.Random(0)
+    for _ in range(requests):
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/api/v1/predict",
+            data=json.dumps(synthetic_input(rng)).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        urllib.request.urlopen(request, timeout=5).read()
+
+
+def measure(workers: int, preload: bool, requests: int) -> dict:
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(workers),
+               PRELOAD_MODELS="true" if preload else "false", LOG_LEVEL="WARNING")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_ready(port)
+        exercise(port, requests)
+        time.sleep(0.5)
+        master = memory_kb(process.pid)
+        worker_stats = [memory_kb(pid) for pid in children(process.pid)]
+        return {
+            "master_rss_kb": master["rss"],
+            "worker_rss_kb": sum(stat["rss"] for stat in worker_stats) / len(worker_stats),
+            "worker_pss_kb": sum(stat["pss"] for stat in worker_stats) / len(worker_stats),
+            "total_pss_kb": master["pss"] + sum(stat["pss"] for stat in worker_stats),
+        }
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-worker memory with and without model preloading")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    for preload in (False, True):
+        for workers in args.workers:
+            stats = measure(workers, preload, args.requests)
+            print(
+                f"preload={str(preload):<5} workers={workers:<2} "
+                f"worker RSS={stats['worker_rss_kb'] / 1024:7.1f} MB  worker PSS={stats['worker_pss_kb'] / 1024:7.1f} MB  "
+                f"total PSS={stats['total_pss_kb'] / 1024:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
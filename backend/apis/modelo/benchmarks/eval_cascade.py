@@ -0,0 +1,92 @@
+# Evaluación offline de la cascada reducido -> completo (XGBoostPredictor.predict_cascade)
+#
+# Para varios umbrales de confianza informa la fracción de filas que escalan al modelo
+# completo, la precisión y la latencia por predicción individual, junto a las referencias
+# "solo reducido" y "solo completo".
+#
+# Con --data se usa un conjunto held-out en CSV con las 34 columnas de feature_names y una
+# columna de etiqueta (--label-column; 0 = gana el jugador 1, 1 = gana el jugador 2).
+# Sin --data se generan filas sintéticas y la "precisión" es el acuerdo con el modelo
+# completo: sirve para medir latencia y tasa de escalado, no la calidad real.
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.eval_cascade --data holdout.csv --thresholds 0 0.1 0.2 0.3 0.4 0.5
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor
+from benchmarks.payloads import synthetic_inputs
+
+
+def load_rows(args, predictor: XGBoostPredictor):
+    """
+    Filas de entrada y etiquetas: el CSV held-out o filas sintéticas etiquetadas por el modelo completo
+    """
+    if args.data:
+        frame = pd.read_csv(args.data)
+        rows = frame[predictor.feature_names].to_dict(orient="records")
+        return rows, frame[args.label_column].to_numpy(dtype=int), "accuracy"
+
+    rows = synthetic_inputs(args.rows, seed=args.seed)
+    labels = np.array([result["prediction"] for result in predictor.predict_many(rows)])
+    return rows, labels, "agreement with full model"
+
+
+def single_row_latency_ms(fn, rows: list) -> tuple:
+    """
+    Latencia media y p99 en ms de llamadas de una sola fila
+    """
+    latencies = np.empty(len(rows))
+    for i, row in enumerate(rows):
+        start = time.perf_counter()
+        fn(row)
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return float(latencies.mean()), float(np.percentile(latencies, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accuracy/latency trade-off of the reduced -> full model cascade")
+    parser.add_argument("--data", help="Held-out CSV with the 34 model features and a label column")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--rows", type=int, default=20000, help="Synthetic rows when --data is not given")
+    parser.add_argument("--latency-rows", type=int, default=2000)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    predictor = XGBoostPredictor(settings.MODEL_PATH, settings.MODEL_REDUCED_PATH)
+    rows, labels, metric = load_rows(args, predictor)
+    sample = rows[:args.latency_rows]
+
+    def report(name: str, results: list, latency: tuple) -> None:
+        predictions = np.array([result["prediction"] for result in results])
+        escalated = np.mean([result["model"] == "full" for result in results])
+        print(
+            f"{name:<18} escalated={escalated * 100:6.1f}%  {metric}={np.mean(predictions == labels) * 100:6.2f}%  "
+            f"latency mean={latency[0]:7.3f} ms  p99={latency[1]:7.3f} ms"
+        )
+
+    print(f"{len(rows)} rows, metric: {metric}")
+    report(
+        "reduced only", predictor.predict_many(rows, reduced=True),
+        single_row_latency_ms(lambda row: predictor.predict_many([row], reduced=True), sample)
+    )
+    report(
+        "full only", predictor.predict_many(rows),
+        single_row_latency_ms(lambda row: predictor.predict_many([row]), sample)
+    )
+    for threshold in args.thresholds:
+        report(
+            f"cascade t={threshold:.2f}", predictor.predict_cascade(rows, threshold),
+            single_row_latency_ms(lambda row: predictor.predict_cascade([row], threshold), sample)
+        )
+
+
+if __name__ == "__main__":
+    main()
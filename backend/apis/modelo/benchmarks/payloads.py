@@ -0,0 +1,55 @@
+# Generación de partidos sintéticos para los benchmarks
+import random
+
+from app.models.pairwise import PLAYER_ATTRIBUTES
+from app.models.predictor import XGBoostPredictor
+
+_predictor = XGBoostPredictor()
+FEATURE_NAMES = _predictor.feature_names
+REDUCED_FEATURE_NAMES = _predictor.reduced_feature_names
+
+
+def synthetic_value(name: str, rng: random.Random):
+    """
+    Valor plausible para una característica según su nombre
+    """
+    if "hand" in name:
+        return rng.randint(0, 1)
+    if "rank" in name:
+        return float(rng.randint(1, 500))
+    if "age" in name:
+        return rng.uniform(18, 38)
+    if "ht" in name:
+        return float(rng.randint(170, 205))
+    if "h2h" in name:
+        return float(rng.randint(0, 10))
+    return rng.random()
+
+
+def synthetic_input(rng: random.Random, reduced: bool = False) -> dict:
+    """
+    Genera un partido sintético (MatchPredictionInput o MatchPredictionInputReduced)
+    """
+    names = REDUCED_FEATURE_NAMES if reduced else FEATURE_NAMES
+    return {name: synthetic_value(name, rng) for name in names}
+
+
+def synthetic_inputs(count: int, seed: int = 42, reduced: bool = False) -> list:
+    rng = random.Random(seed)
+    return [synthetic_input(rng, reduced=reduced) for _ in range(count)]
+
+
+def synthetic_players(count: int, seed: int = 42) -> list:
+    """
+    Perfiles de jugador (PlayerProfile) con tasas para superficie "hard" y torneo "G"
+    """
+    rng = random.Random(seed)
+    players = []
+    for k in range(count):
+        row = synthetic_input(rng)
+        player = {name: row[f"p1_{name}"] for name in PLAYER_ATTRIBUTES[:-2]}
+        player["name"] = f"player_{k}"
+        player["surface_wRates"] = {"hard": row["p1_surface_wRate"]}
+        player["tourney_wRates"] = {"G": row["p1_tourney_wRate"]}
+        players.append(player)
+    return players
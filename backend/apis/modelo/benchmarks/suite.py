@@ -0,0 +1,185 @@
+# Suite reproducible de micro y macro benchmarks del predictor
+#
+# Mide, con payloads sintéticos y los modelos reales (settings.MODEL_PATH / MODEL_REDUCED_PATH):
+#   - prepare_features / prepare_features_array por separado
+#   - predict / predict_reduced de extremo a extremo
+#   - predict_many con varios tamaños de lote
+#   - peticiones HTTP completas con el TestClient de FastAPI
+#
+# Uso (desde backend/apis/modelo):
+#   python -m benchmarks.suite run --output benchmarks/results/current.json
+#   python -m benchmarks.suite compare benchmarks/results/baseline.json benchmarks/results/current.json
+#
+# compare termina con código 1 si algún benchmark empeora más que --threshold en p50 o p99.
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+from app.config import settings
+from app.models.predictor import XGBoostPredictor
+from benchmarks.payloads import synthetic_inputs
+
+BATCH_SIZES = [1, 16, 128, 1024]
+
+
+def time_calls(fn: Callable, args_list: List[tuple], warmup: int = 20) -> dict:
+    """
+    Ejecuta fn una vez por elemento de args_list y resume las latencias en milisegundos
+    """
+    for args in args_list[:warmup]:
+        fn(*args)
+
+    latencies = np.empty(len(args_list))
+    for i, args in enumerate(args_list):
+        start = time.perf_counter()
+        fn(*args)
+        latencies[i] = (time.perf_counter() - start) * 1000
+
+    return {
+        "n": len(args_list),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "mean_ms": float(latencies.mean()),
+        "ops_per_s": float(1000 / latencies.mean()),
+    }
+
+
+def run_micro(predictor: XGBoostPredictor, iterations: int, seed: int) -> dict:
+    results = {}
+    full_inputs = synthetic_inputs(iterations, seed=seed)
+    reduced_inputs = synthetic_inputs(iterations, seed=seed, reduced=True)
+
+    results["prepare_features.full.dataframe"] = time_calls(predictor.prepare_features, [(row,) for row in full_inputs])
+    results["prepare_features.full.array"] = time_calls(
+        predictor.prepare_features_array, [([row],) for row in full_inputs]
+    )
+    results["prepare_features.reduced.dataframe"] = time_calls(
+        predictor.prepare_features_reduced, [(row,) for row in reduced_inputs]
+    )
+    results["prepare_features.reduced.array"] = time_calls(
+        lambda rows: predictor.prepare_features_array(rows, reduced=True), [([row],) for row in reduced_inputs]
+    )
+
+    results["predict.full"] = time_calls(predictor.predict, [(row,) for row in full_inputs])
+    results["predict.reduced"] = time_calls(predictor.predict_reduced, [(row,) for row in reduced_inputs])
+
+    for size in BATCH_SIZES:
+        repeats = max(5, min(200, iterations // size))
+        batches = [(synthetic_inputs(size, seed=seed + i),) for i in range(repeats)]
+        results[f"predict_many.full.{size}"] = time_calls(predictor.predict_many, batches, warmup=2)
+    return results
+
+
+def run_http(iterations: int, seed: int) -> dict:
+    """
+    Peticiones completas a través de FastAPI (validación, inferencia y serialización)
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    results = {}
+    with TestClient(app) as client:
+        # Payloads distintos en cada petición para no medir la caché de predicciones
+        full_inputs = synthetic_inputs(iterations, seed=seed + 1000)
+        reduced_inputs = synthetic_inputs(iterations, seed=seed + 2000, reduced=True)
+        results["http.predict"] = time_calls(
+            lambda row: client.post("/api/v1/predict", json=row), [(row,) for row in full_inputs]
+        )
+        results["http.predict_reduced"] = time_calls(
+            lambda row: client.post("/api/v1/predict-reduced", json=row), [(row,) for row in reduced_inputs]
+        )
+        batches = [(synthetic_inputs(128, seed=seed + 3000 + i),) for i in range(max(5, iterations // 128))]
+        results["http.predict_batch.128"] = time_calls(
+            lambda rows: client.post("/api/v1/predict/batch", json={"matches": rows}), batches, warmup=2
+        )
+    return results
+
+
+def run(args) -> None:
+    # El log INFO por predicción distorsionaría las mediciones
+    logging.disable(logging.INFO)
+
+    predictor = XGBoostPredictor(settings.MODEL_PATH, settings.MODEL_REDUCED_PATH)
+    benchmarks = run_micro(predictor, args.iterations, args.seed)
+    if not args.skip_http:
+        benchmarks.update(run_http(args.iterations, args.seed))
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "model_path": settings.MODEL_PATH,
+            "model_reduced_path": settings.MODEL_REDUCED_PATH,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "benchmarks": benchmarks,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    for name, stats in benchmarks.items():
+        print(f"{name:<38} p50={stats['p50_ms']:9.3f} ms  p99={stats['p99_ms']:9.3f} ms  {stats['ops_per_s']:10.1f} ops/s")
+    print(f"Results written to {output}")
+
+
+def compare(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())["benchmarks"]
+    current = json.loads(Path(args.current).read_text())["benchmarks"]
+
+    regressions = 0
+    for name in sorted(set(baseline) & set(current)):
+        flags = []
+        for metric in ("p50_ms", "p99_ms"):
+            ratio = current[name][metric] / baseline[name][metric] if baseline[name][metric] else 1.0
+            if ratio > 1 + args.threshold:
+                flags.append(f"{metric} +{(ratio - 1) * 100:.0f}%")
+        status = "REGRESSION " + ", ".join(flags) if flags else "ok"
+        regressions += bool(flags)
+        print(
+            f"{name:<38} p50 {baseline[name]['p50_ms']:8.3f} -> {current[name]['p50_ms']:8.3f} ms  "
+            f"p99 {baseline[name]['p99_ms']:8.3f} -> {current[name]['p99_ms']:8.3f} ms  {status}"
+        )
+
+    for name in sorted(set(baseline) ^ set(current)):
+        print(f"{name:<38} only in {'baseline' if name in baseline else 'current'}")
+
+    print(f"{regressions} regression(s) above {args.threshold * 100:.0f}%")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Predictor benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and write a JSON report")
+    run_parser.add_argument("--output", default="benchmarks/results/current.json")
+    run_parser.add_argument("--iterations", type=int, default=2000)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--skip-http", action="store_true")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare a report against a saved baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown, 0.10 = 10%%")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+# Configuración de gunicorn para el API de predicción
+#
+#   gunicorn -c gunicorn.conf.py app.main:app
+#
+# Con PRELOAD_MODELS=true la app (y los modelos) se cargan una vez en el proceso maestro
+# y los WEB_CONCURRENCY workers la heredan por fork, compartiendo la memoria copy-on-write.
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("PRELOAD_MODELS", "False").lower() == "true"
+timeout = 120
+
+
+def pre_fork(server, worker):
+    # Mover los objetos ya creados a la generación permanente para que el GC de los
+    # workers no toque sus cabeceras y no fuerce copias de las páginas compartidas
+    gc.freeze()
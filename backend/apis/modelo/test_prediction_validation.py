@@ -0,0 +1,49 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.payloads import synthetic_inputs
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("field", ["p1_age", "p1_hand_encoded"])
+def test_predict_rechaza_numeros_fuera_de_rango(client, field):
+    """
+    Un entero que no cabe en un float es un 422 de validación, no un 500
+    """
+    payload = dict(synthetic_inputs(1)[0], **{field: 10 ** 400})
+    response = client.post("/api/v1/predict", json=payload)
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", field]]
+
+
+def test_batch_reporta_fila_fuera_de_rango(client):
+    """
+    En /predict/batch la fila fuera de rango se reporta sola y el resto se predice
+    """
+    matches = synthetic_inputs(3)
+    matches[1]["p1_age"] = 10 ** 400
+    matches[2]["p2_hand_encoded"] = 10 ** 400
+    response = client.post("/api/v1/predict/batch", json={"matches": matches})
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert [result["success"] for result in results] == [True, False, False]
+    assert results[1]["details"][0]["loc"] == ["p1_age"]
+    assert results[2]["details"][0]["loc"] == ["p2_hand_encoded"]
+
+
+def test_batch_reporta_filas_que_no_son_objetos(client):
+    """
+    Una fila que no es un objeto JSON no invalida el lote: se reporta con su índice
+    """
+    matches = synthetic_inputs(2)
+    response = client.post("/api/v1/predict/batch", json={"matches": [matches[0], 5, None, matches[1]]})
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert [(result["index"], result["success"]) for result in results] == [(0, True), (1, False), (2, False), (3, True)]
+    assert results[1]["details"][0]["type"] == "model_type"
@@ -0,0 +1,166 @@
+# Perfil de arranque de los servicios (modelo, base_de_datos, scrap_attemp)
+#
+# imports: ejecuta `python -X importtime -c "import app.main"` en el directorio de cada
+#          servicio y agrupa el tiempo propio de importación por paquete de primer nivel,
+#          además del coste acumulado de cada módulo de la aplicación (app.*).
+# ttfr:    arranca uvicorn como subproceso y mide, desde el lanzamiento, cuándo cada ruta
+#          de comprobación responde 200 por primera vez (time-to-first-response), para
+#          cada STARTUP_MODE pedido.
+#
+# Solo usa la biblioteca estándar; cada servicio necesita sus propias dependencias
+# instaladas en el intérprete que ejecuta el script. Variables extra con --env CLAVE=VALOR
+# (base_de_datos necesita DATABASE_URL y, en modo eager, GOOGLE_APPLICATION_CREDENTIALS).
+#
+# Uso (desde backend/apis):
+#   python profile_startup.py imports --services modelo base_de_datos scrap_attemp
+#   python profile_startup.py ttfr --services modelo --modes eager lazy --runs 5
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Rutas que se comprueban en orden: la primera indica que el servidor acepta tráfico,
+# las siguientes que ya está listo para servir predicciones
+PROBES = {
+    "modelo": ["/health", "/ready"],
+    "base_de_datos": ["/health"],
+    "scrap_attemp": ["/"],
+}
+
+
+def parse_env(pairs: list) -> dict:
+    env = {}
+    for pair in pairs:
+        key, _, value = pair.partition("=")
+        env[key] = value
+    return env
+
+
+def service_env(extra: dict) -> dict:
+    env = dict(os.environ)
+    env.update(extra)
+    # Sin .pyc obsoletos de otra versión que alteren la medida
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    return env
+
+
+def import_profile(service: str, env: dict) -> list:
+    """
+    Filas (tiempo propio µs, acumulado µs, nivel, módulo) de -X importtime para `import app.main`
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT / service, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{service}: import app.main failed\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), level, name.strip()))
+    return rows
+
+
+def report_imports(service: str, rows: list, top: int) -> None:
+    total_ms = sum(cumulative for _, cumulative, level, _ in rows if level == 0) / 1000
+    by_package = defaultdict(int)
+    for self_us, _, _, name in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"\n== {service}: import app.main = {total_ms:.1f} ms ({len(rows)} modules)")
+    print("  self time by top-level package:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"    {package:<32} {self_us / 1000:8.1f} ms  {self_us / 1000 / total_ms * 100:5.1f}%")
+
+    print("  cumulative time of application modules:")
+    for _, cumulative, _, name in rows:
+        if name == "app" or name.startswith("app."):
+            print(f"    {name:<32} {cumulative / 1000:8.1f} ms")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def probe_ok(port: int, path: str) -> bool:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+    try:
+        connection.request("GET", path)
+        return connection.getresponse().status == 200
+    except OSError:
+        return False
+    finally:
+        connection.close()
+
+
+def time_to_first_response(service: str, env: dict, probes: list, timeout: float) -> dict:
+    """
+    ms desde el lanzamiento de uvicorn hasta el primer 200 de cada ruta (en orden)
+    """
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=ROOT / service, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    timings = {}
+    try:
+        for path in probes:
+            while not probe_ok(port, path):
+                if process.poll() is not None:
+                    raise RuntimeError(f"{service}: server exited\n{process.stderr.read().decode()[-2000:]}")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"{service}: {path} did not answer 200 within {timeout:.0f} s")
+                time.sleep(0.005)
+            timings[path] = (time.perf_counter() - start) * 1000
+    finally:
+        process.terminate()
+        process.wait()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time and time-to-first-response profile of each service")
+    parser.add_argument("command", choices=["imports", "ttfr"])
+    parser.add_argument("--services", nargs="+", default=list(PROBES), choices=list(PROBES))
+    parser.add_argument("--modes", nargs="+", default=["eager", "lazy"], help="STARTUP_MODE values for ttfr")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--env", nargs="*", default=[], metavar="KEY=VALUE")
+    args = parser.parse_args()
+
+    extra = parse_env(args.env)
+    for service in args.services:
+        if args.command == "imports":
+            report_imports(service, import_profile(service, service_env(extra)), args.top)
+            continue
+
+        for mode in args.modes:
+            env = service_env({**extra, "STARTUP_MODE": mode})
+            runs = [time_to_first_response(service, env, PROBES[service], args.timeout) for _ in range(args.runs)]
+            summary = "  ".join(
+                f"{path} median={statistics.median(run[path] for run in runs):7.1f} ms "
+                f"min={min(run[path] for run in runs):7.1f} ms"
+                for path in PROBES[service]
+            )
+            print(f"{service:<14} STARTUP_MODE={mode:<6} {summary}")
+
+
+if __name__ == "__main__":
+    main()
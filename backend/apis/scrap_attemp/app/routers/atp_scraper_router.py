@@ -1,27 +1,28 @@
 # app/routers/atp_scraper_router.py
 from fastapi import APIRouter, Response, status
 from fastapi.responses import JSONResponse
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-
-import undetected_chromedriver as uc
-from undetected_chromedriver import ChromeOptions
 
 import time
 
-from bs4 import BeautifulSoup
-
-from typing import List
+from typing import TYPE_CHECKING, List
 from app.schemas.atp_schemas import TournamentResult, Match
 import os # <<< SOLUCIÓN: Importar os para manejar rutas de archivos
 import tempfile # <<< SOLUCIÓN: Para crear un directorio de perfil temporal estándar
 
+# selenium, undetected_chromedriver y bs4 se importan dentro de las funciones de scraping:
+# importar la aplicación no los carga y el arranque del servicio no paga ~0.6 s por ellos
+if TYPE_CHECKING:
+    import undetected_chromedriver as uc
+
 router = APIRouter()
 
 # --- Parte 1: Función para scrapear partidos incompletos de un draw específico (CORREGIDA) ---
-def scrape_single_draw_for_incomplete_matches(driver: uc.Chrome, draw_url: str) -> List[Match]:
+def scrape_single_draw_for_incomplete_matches(driver: "uc.Chrome", draw_url: str) -> List[Match]:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from bs4 import BeautifulSoup
+
     driver.get(draw_url)
     
     current_tournament_incomplete_matches = []
@@ -100,7 +101,12 @@ def scrape_single_draw_for_incomplete_matches(driver: uc.Chrome, draw_url: str)
     
     return current_tournament_incomplete_matches
 
-def get_tournament_surface(driver: uc.Chrome, overview_url: str) -> str:
+def get_tournament_surface(driver: "uc.Chrome", overview_url: str) -> str:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from bs4 import BeautifulSoup
+
     driver.get(overview_url)
     surface = "Desconocida"
 
@@ -128,6 +134,14 @@ def get_tournament_surface(driver: uc.Chrome, overview_url: str) -> str:
 
 # --- Función principal de scraping que será llamada por la API ---
 async def perform_full_scraping() -> List[TournamentResult]:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    import undetected_chromedriver as uc
+    from undetected_chromedriver import ChromeOptions
+    from bs4 import BeautifulSoup
+
     chrome_options = ChromeOptions() 
      # --- INICIO DE LA SOLUCIÓN ---
     # 1. Usar un directorio de perfil en la carpeta del proyecto. Es más estable.
@@ -2,6 +2,7 @@ import requests
 import json
 import os
 import logging
+from datetime import date
 from typing import Dict, Any, Optional
 
 # Configuración básica de logging para producción: solo INFO y niveles superiores.
@@ -89,14 +90,26 @@ class ATPInfoAPI:
 
     def obtener_partidos_futuros(self) -> Optional[Dict[str, Any]]:
         """
-        Obtiene los partidos futuros de ATP desde la API principal.
+        Obtiene los partidos futuros de ATP (desde hoy) desde la API principal.
+        El endpoint está paginado: se sigue next_cursor hasta la última página.
         
         Returns:
-            Dict con la información de los partidos futuros o None si hay error.
+            Dict con todos los partidos futuros ('matches') y su número total
+            ('total_matches'), o None si hay error.
         """
         endpoint = f"{self.base_url}/players/matches"
+        params = {"date_from": date.today().isoformat(), "limit": 500}
+        matches = []
         logging.info("Solicitando partidos futuros.")
-        return self._make_request('GET', endpoint, timeout=10)
+        while True:
+            page = self._make_request('GET', endpoint, params=params, timeout=10)
+            if page is None:
+                return None
+            matches.extend(page.get('matches', []))
+            if not page.get('next_cursor'):
+                break
+            params = {"cursor": page['next_cursor'], "limit": 500}
+        return {"total_matches": len(matches), "matches": matches}
     
     def comparar_jugadores(self, 
                            nombre1: str, 
@@ -79,8 +79,9 @@ class TennisBot:
             await loading_msg.edit_text("❌ Error al obtener los partidos. Intenta de nuevo más tarde.")
             return
         
+        # obtener_partidos_futuros ya recorre todas las páginas: el total es el de todos los partidos futuros
         matches = partidos_data.get('matches', [])
-        total_matches = partidos_data.get('total_matches', 0)
+        total_matches = partidos_data.get('total_matches', len(matches))
         
         if not matches:
             await loading_msg.edit_text("📅 No hay partidos programados próximamente.")
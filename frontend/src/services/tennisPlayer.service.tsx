@@ -123,10 +123,28 @@ const getSimpleH2HStats = async (
 };
 
 
+/**
+ * Obtiene todos los partidos desde hoy. El endpoint está paginado por cursor:
+ * se piden páginas hasta que no devuelve next_cursor.
+ */
 const getNextMatches = async (): Promise<NextMatch[]> => {
   try {
-    const response = await axios.get(`${API_URL}/players/matches`);
-    return response.data;
+    const today = new Date();
+    const dateFrom = [
+      today.getFullYear(),
+      String(today.getMonth() + 1).padStart(2, "0"),
+      String(today.getDate()).padStart(2, "0"),
+    ].join("-");
+
+    const matches: NextMatch[] = [];
+    let params: Record<string, string | number> = { date_from: dateFrom, limit: 500 };
+    while (true) {
+      const response = await axios.get(`${API_URL}/players/matches`, { params });
+      matches.push(...(response.data.matches ?? []));
+      if (!response.data.next_cursor) break;
+      params = { cursor: response.data.next_cursor, limit: 500 };
+    }
+    return matches;
   } catch (error) {
     console.error("Error al obtener partidos próximos:", error);
     throw error;